@@ -0,0 +1,32 @@
+# Dictionnaire de tous les kanji : table fusionnée (Unihan + GlyphWiki), rendu de
+# la grille et outils de téléchargement. Les sous-modules ne sont importés qu'au
+# premier accès à l'un des noms ci-dessous (import du paquet instantané).
+
+_LAZY = {
+    'CharTable': 'char_table',
+    'load_table': 'table_cache',
+    'save_table': 'table_cache',
+    'build_table': 'kanji_all',
+    'parse_unihan': 'kanji_all',
+    'generate_grid_html': 'kanji_all',
+    'load_glyphwiki_data': 'kanji_all',
+    'load_irg_attributes': 'kanji_all',
+    'load_bundles': 'font_bundler',
+    'TableIndex': 'table_query',
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
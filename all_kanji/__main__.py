@@ -0,0 +1,33 @@
+import argparse
+import importlib
+import sys
+
+# python -m all_kanji <commande> [options] : chaque commande est un module du
+# paquet exposant main(argv), importé seulement quand la commande est choisie.
+COMMANDS = {
+    'grid': ('kanji_all', "Génère la grille de tous les kanji (kanji-all.py)"),
+    'irg-attributes': ('irg_attributes', "Radicaux et traits du Working Set IRG 2024 (irg2024-attributes.py)"),
+    'irg-fonts': ('irg_fonts', "Télécharge les polices IRG 2024 (IRG2024-fonts.py)"),
+    'ext-j-fonts': ('ext_j_fonts', "Télécharge les polices de l'Extension J (fonts-glyphwiki-for-unicode-ext-J.py)"),
+    'bundle': ('font_bundler', "Regroupe les polices en lots à code points privés (font_bundler.py)"),
+    'query': ('table_query', "Recherche par radical, traits, code point, bloc ou dictionnaire (query.py)"),
+    'pipeline': ('pipeline', "Enchaîne toutes les étapes en ignorant celles à jour (pipeline.py)"),
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(prog="python -m all_kanji",
+                                     description="Dictionnaire de tous les kanji : outils en ligne de commande")
+    commands = parser.add_subparsers(dest='command', metavar='<commande>', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        # Options de chaque commande analysées par son propre module (add_help=False : --help lui est transmis)
+        commands.add_parser(name, help=help_text, add_help=False)
+    args, rest = parser.parse_known_args(argv[:1])
+    module = importlib.import_module(f".{COMMANDS[args.command][0]}", __package__)
+    sys.argv[0] = f"{parser.prog} {args.command}"
+    return module.main(argv[1:] + rest)
+
+
+if __name__ == "__main__":
+    main()
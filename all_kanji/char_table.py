@@ -0,0 +1,172 @@
+import array
+
+# Table des caractères en colonnes (struct-of-arrays) : une ligne = un indice.
+# Remplace la liste de ~100k dicts ; les chaînes dérivées (code affiché,
+# fichier et famille de police) sont calculées à la demande.
+
+KIND_UNICODE = 0        # Caractère Unicode rendu par les polices système
+KIND_CUSTOM_FONT = 1    # Caractère Unicode sans police système (Ext J) : police GlyphWiki dédiée
+KIND_GLYPHWIKI = 2      # Glyphe GlyphWiki sans code point (dictionnaires, IRG...)
+KIND_NAMES = ('U', 'U_CUSTOM_FONT', 'GW')
+
+PLACEHOLDER_CHAR = '〓'
+
+# Clé de tri entière unique : (radical, traits, ordre) empaquetés dans 64 bits,
+# pour trier avec une seule comparaison d'entiers.
+#   bits 52+   : radical
+#   bits 44-51 : traits + STROKE_OFFSET (les traits peuvent être négatifs)
+#   bits 0-43  : code point Unicode, ou GLYPHWIKI_ORDER | source << 32 | numéro
+# Les glyphes GlyphWiki passent après les caractères Unicode du même groupe,
+# classés par dictionnaire puis par numéro : ordre stable d'un run à l'autre.
+STROKE_OFFSET = 64
+STROKE_SHIFT = 44
+RAD_SHIFT = 52
+GLYPHWIKI_ORDER = 1 << 40
+SOURCE_SHIFT = 32
+MAX_SOURCES = 256
+MAX_IDENT = (1 << SOURCE_SHIFT) - 1
+
+
+class CharTable:
+    __slots__ = ('rad', 'strokes', 'cp', 'kind', 'source', 'ident', 'sources', 'prefixes', 'bundles',
+                 '_source_index')
+
+    def __init__(self):
+        self.rad = array.array('H')
+        self.strokes = array.array('h')
+        self.cp = array.array('Q')       # Code point, ou rang GlyphWiki (voir GLYPHWIKI_ORDER)
+        self.kind = array.array('B')
+        self.source = array.array('H')   # Indice dans self.sources (0 pour Unicode)
+        self.ident = []                  # Identifiant GlyphWiki ('00123'), None pour Unicode
+        self.sources = ['']              # Clés de dictionnaire GlyphWiki (internées)
+        self.prefixes = ['U']            # Préfixe affiché pour chaque source (K, DKW, IRG...)
+        self.bundles = {}                # Fichier de glyphe -> (code point PUA, famille, chemin du lot)
+        self._source_index = {}
+
+    def __len__(self):
+        return len(self.rad)
+
+    def add_source(self, key, prefix):
+        index = self._source_index.get(key)
+        if index is None:
+            if len(self.sources) >= MAX_SOURCES:
+                raise ValueError(f"Trop de dictionnaires GlyphWiki (max {MAX_SOURCES - 1})")
+            index = self._source_index[key] = len(self.sources)
+            self.sources.append(key)
+            self.prefixes.append(prefix)
+        return index
+
+    def append_unicode(self, code_point, rad, strokes, custom_font=False):
+        self.rad.append(rad)
+        self.strokes.append(strokes)
+        self.cp.append(code_point)
+        self.kind.append(KIND_CUSTOM_FONT if custom_font else KIND_UNICODE)
+        self.source.append(0)
+        self.ident.append(None)
+
+    def append_glyphwiki(self, source_index, ident, rad, strokes):
+        # Rang déterministe : ordinal du dictionnaire + numéro du glyphe
+        if not ident.isdigit() or int(ident) > MAX_IDENT:
+            raise ValueError(f"Identifiant GlyphWiki non numérique : {self.sources[source_index]}-{ident}")
+        self.rad.append(rad)
+        self.strokes.append(strokes)
+        self.cp.append(GLYPHWIKI_ORDER | source_index << SOURCE_SHIFT | int(ident))
+        self.kind.append(KIND_GLYPHWIKI)
+        self.source.append(source_index)
+        self.ident.append(ident)
+
+    # --- Valeurs dérivées (calculées à la demande) ---
+
+    def type_name(self, i):
+        return KIND_NAMES[self.kind[i]]
+
+    def char(self, i):
+        if self.kind[i] == KIND_UNICODE:
+            return chr(self.cp[i])
+        bundled = self.bundles.get(self.glyph_font_file(i))
+        return chr(bundled[0]) if bundled else PLACEHOLDER_CHAR
+
+    def pua(self, i):
+        # Code point privé du glyphe dans son lot de polices (0 si non regroupé)
+        bundled = self.bundles.get(self.glyph_font_file(i))
+        return bundled[0] if bundled else 0
+
+    def display_code(self, i):
+        if self.kind[i] == KIND_GLYPHWIKI:
+            return f"{self.prefixes[self.source[i]]}+{self.ident[i]}"
+        return f"U+{self.cp[i]:X}"
+
+    def glyph_font_file(self, i):
+        # Police individuelle du glyphe (telle que téléchargée), None pour Unicode
+        kind = self.kind[i]
+        if kind == KIND_CUSTOM_FONT:
+            return f"u{self.cp[i]:x}.ttf"
+        if kind == KIND_GLYPHWIKI:
+            # Le fichier .ttf DOIT s'appeler ainsi : "source-id.ttf"
+            return f"{self.sources[self.source[i]]}-{self.ident[i]}.ttf"
+        return None
+
+    def font_file(self, i):
+        # Lot de polices (font_bundler.py) s'il contient le glyphe, sinon police individuelle
+        name = self.glyph_font_file(i)
+        bundled = self.bundles.get(name)
+        return bundled[2] if bundled else name
+
+    def font_family(self, i):
+        kind = self.kind[i]
+        if kind != KIND_UNICODE and self.bundles:
+            bundled = self.bundles.get(self.glyph_font_file(i))
+            if bundled:
+                return bundled[1]
+        if kind == KIND_CUSTOM_FONT:
+            return f"U_CUSTOM_FONT_{self.cp[i]:X}"
+        if kind == KIND_GLYPHWIKI:
+            return f"GW_{self.sources[self.source[i]]}_{self.ident[i]}".replace('-', '_')
+        return None
+
+    def count(self, kind):
+        return self.kind.count(kind)
+
+    # --- Tri ---
+
+    def sort_key(self, i):
+        return self.rad[i] << RAD_SHIFT | (self.strokes[i] + STROKE_OFFSET) << STROKE_SHIFT | self.cp[i]
+
+    def sort_keys(self):
+        return array.array('Q', [rad << RAD_SHIFT | (strokes + STROKE_OFFSET) << STROKE_SHIFT | cp
+                                 for rad, strokes, cp in zip(self.rad, self.strokes, self.cp)])
+
+    def sort_order(self):
+        # Indices des lignes triées par (radical, traits, code point / rang GlyphWiki)
+        keys = self.sort_keys()
+        return sorted(range(len(keys)), key=keys.__getitem__)
+
+    # --- Sérialisation (voir table_cache.py) ---
+
+    def to_columns(self):
+        return {
+            'rad': self.rad.tobytes(),
+            'str': self.strokes.tobytes(),
+            'cp': self.cp.tobytes(),
+            'kind': self.kind.tobytes(),
+            'source': self.source.tobytes(),
+            # Identifiants stockés uniquement pour les glyphes GlyphWiki
+            'ident': [ident for ident in self.ident if ident is not None],
+            'sources': self.sources,
+            'prefixes': self.prefixes,
+        }
+
+    @classmethod
+    def from_columns(cls, columns):
+        table = cls()
+        table.rad.frombytes(columns['rad'])
+        table.strokes.frombytes(columns['str'])
+        table.cp.frombytes(columns['cp'])
+        table.kind.frombytes(columns['kind'])
+        table.source.frombytes(columns['source'])
+        idents = iter(columns['ident'])
+        table.ident = [next(idents) if kind == KIND_GLYPHWIKI else None for kind in table.kind]
+        table.sources = list(columns['sources'])
+        table.prefixes = list(columns['prefixes'])
+        table._source_index = {key: i for i, key in enumerate(table.sources) if i}
+        return table
@@ -0,0 +1,78 @@
+import bisect
+
+# Blocs d'idéogrammes CJC (Unicode 17) : (début, fin, nom, polices locales).
+# Les polices sont celles de FONT_STACK qui couvrent le bloc, dans le même ordre
+# de préférence ; un bloc sans police système (Ext J) est rendu avec une police
+# GlyphWiki par caractère (voir fonts-glyphwiki-for-unicode-ext-J.py).
+BABELSTONE = ("BabelStone Han",)
+HANAMIN_A = ("HanaMinA", "Hanazono Mincho A")
+HANAMIN_B = ("HanaMinB", "Hanazono Mincho B")
+
+CJK_BLOCKS = (
+    (0x3400, 0x4DBF, "Ext A", BABELSTONE + HANAMIN_A + ("Noto Serif CJK JP", "Source Han Serif")),
+    (0x4E00, 0x9FFF, "URO", BABELSTONE + HANAMIN_A + ("Noto Serif CJK JP", "Source Han Serif")),
+    (0xF900, 0xFAFF, "Compatibility", BABELSTONE + HANAMIN_A),
+    (0x20000, 0x2A6DF, "Ext B", BABELSTONE + HANAMIN_B + ("TH-Tshyn-P1", "SimSun-ExtB", "MingLiU-ExtB")),
+    (0x2A700, 0x2B73F, "Ext C", BABELSTONE + HANAMIN_B + ("TH-Tshyn-P2",)),
+    (0x2B740, 0x2B81F, "Ext D", BABELSTONE + HANAMIN_B + ("TH-Tshyn-P2",)),
+    (0x2B820, 0x2CEAF, "Ext E", BABELSTONE + HANAMIN_B + ("TH-Tshyn-P2",)),
+    (0x2CEB0, 0x2EBEF, "Ext F", BABELSTONE + HANAMIN_B + ("TH-Tshyn-P2",)),
+    (0x2EBF0, 0x2EE5F, "Ext I", BABELSTONE + ("TH-Tshyn-P2",)),
+    (0x2F800, 0x2FA1F, "Compatibility Supplement", BABELSTONE + HANAMIN_B),
+    (0x30000, 0x3134F, "Ext G", ("BabelStone Han Extra",) + BABELSTONE),
+    (0x31350, 0x323AF, "Ext H", ("BabelStone Han Extra",) + BABELSTONE),
+    (0x323B0, 0x3347F, "Ext J", ()),
+)
+
+BLOCK_STARTS = [block[0] for block in CJK_BLOCKS]
+
+
+def block_of(code_point):
+    # Bloc contenant code_point (recherche dichotomique), None hors des blocs CJC
+    index = bisect.bisect_right(BLOCK_STARTS, code_point) - 1
+    if index >= 0 and code_point <= CJK_BLOCKS[index][1]:
+        return CJK_BLOCKS[index]
+    return None
+
+
+def block_range(name):
+    for start, end, block_name, _ in CJK_BLOCKS:
+        if block_name == name:
+            return start, end
+    raise KeyError(name)
+
+
+def needs_custom_font(code_point):
+    # Aucune police système ne couvre le bloc : police GlyphWiki dédiée
+    block = block_of(code_point)
+    return block is not None and not block[3]
+
+
+def block_family(name, index):
+    return f"CJK {name} {index}"
+
+
+def block_aliases():
+    # (famille, police locale, début, fin) : un alias par police de chaque bloc, dans
+    # l'ordre de préférence. Plusieurs local() dans un même @font-face ne donnent pas
+    # de secours par caractère : seule la première police installée serait utilisée,
+    # même si elle n'a pas le glyphe.
+    for start, end, name, fonts in CJK_BLOCKS:
+        for index, font in enumerate(fonts):
+            yield block_family(name, index), font, start, end
+
+
+def block_font_faces():
+    # Alias @font-face limités au bloc par unicode-range : le navigateur ne considère
+    # que les alias du bloc du caractère et trouve la bonne police sans parcourir
+    # toute la pile de secours.
+    return [f'@font-face {{ font-family: "{family}"; src: local("{font}"); '
+            f'unicode-range: U+{start:X}-{end:X}; }}'
+            for family, font, start, end in block_aliases()]
+
+
+def block_font_stack(font_stack):
+    # Alias par bloc en tête, dans l'ordre de secours ; pile d'origine ensuite
+    # (polices web, caractères hors blocs)
+    families = [f'"{family}"' for family, _, _, _ in block_aliases()]
+    return ", ".join(families + [font_stack])
@@ -0,0 +1,149 @@
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+from .cjk_blocks import block_range
+
+# --- CONFIGURATION ---
+BASE_URL = "https://glyphwiki.org/glyph/"
+OUTPUT_DIR = "downloaded_fonts"
+ZIP_NAME = "fonts_glyphwiki.zip"
+
+#  PLAGE EXTENSION J (U+323B0 .. U+3347F, voir cjk_blocks.py)
+EXT_J_START, EXT_J_END = block_range("Ext J")
+
+# Glyphes GlyphWiki supplémentaires à télécharger (ex: "kokuji-0001")
+CUSTOM_LIST = []
+
+# Téléchargement parallèle (rester raisonnable avec GlyphWiki)
+WORKERS = 8
+PER_HOST_LIMIT = 4      # Connexions simultanées max vers glyphwiki.org
+MIN_INTERVAL = 0.05     # Petit délai pour ne pas DDOS GlyphWiki (important !)
+
+# Cache des 404 : les glyphes pas encore créés sur GlyphWiki ne sont redemandés
+# qu'après expiration du TTL (ou avec --recheck)
+NEGATIVE_CACHE_FILE = "glyphwiki_404_cache.json"
+NEGATIVE_CACHE_TTL_DAYS = 7
+
+# Taille + SHA-256 de chaque police (écrite de façon atomique)
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, "manifest.json")
+
+
+def make_downloader(ttl_days=NEGATIVE_CACHE_TTL_DAYS, recheck=False):
+    # Importé et construit à l'exécution seulement (import du module et --help instantanés)
+    from .glyph_downloader import GlyphDownloader, FontManifest, NegativeCache
+
+    downloader = GlyphDownloader(BASE_URL, OUTPUT_DIR, workers=WORKERS,
+                                 per_host=PER_HOST_LIMIT, min_interval=MIN_INTERVAL)
+    downloader.negative_cache = NegativeCache(NEGATIVE_CACHE_FILE, ttl=ttl_days * 86400, recheck=recheck)
+    downloader.manifest = FontManifest(MANIFEST_FILE)
+    return downloader
+
+
+def download_file(downloader, filename):
+    # Renvoie le statut du téléchargement (EXISTS, OK, MISSING, KNOWN_MISSING ou ERROR)
+    from .glyph_downloader import EXISTS, OK, MISSING, KNOWN_MISSING
+
+    status, error = downloader.download(filename)
+
+    # Si le fichier existe déjà, on passe (pour pouvoir relancer le script sans tout retélécharger)
+    if status == EXISTS:
+        print(f"   [Existe déjà] {filename}")
+    elif status == OK:
+        print(f"   [OK] Téléchargé: {filename}")
+    elif status == KNOWN_MISSING:
+        pass
+    elif status == MISSING:
+        print(f"   [404] Introuvable sur GlyphWiki: {filename}")
+    elif getattr(error, 'code', None):
+        print(f"   [ERREUR {error.code}] {filename}")
+    else:
+        print(f"   [ERREUR] {filename}: {error}")
+    return status
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Téléchargement des glyphes GlyphWiki (Extension J + liste Custom)")
+    parser.add_argument('--recheck', action='store_true',
+                        help="Ignore le cache des 404 et redemande tous les glyphes manquants")
+    parser.add_argument('--ttl-days', type=float, default=NEGATIVE_CACHE_TTL_DAYS,
+                        help=f"Durée de validité d'un 404 mémorisé (défaut : {NEGATIVE_CACHE_TTL_DAYS} jours)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Vérifie tout le dossier contre le manifeste et ne retélécharge que les fichiers abîmés")
+    parser.add_argument('--full-zip', action='store_true',
+                        help="Reconstruit le ZIP de zéro au lieu de le mettre à jour")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from .font_packager import build_zip, format_stats
+    from .glyph_downloader import ERROR, EXISTS, OK
+
+    # Création du dossier
+    if not os.path.exists(OUTPUT_DIR):
+        os.makedirs(OUTPUT_DIR)
+    downloader = make_downloader(args.ttl_days, args.recheck)
+
+    print(f"=== DÉBUT DU TÉLÉCHARGEMENT ===")
+    print(f"Dossier cible : {OUTPUT_DIR}")
+
+    files_to_download = []
+
+    if args.verify:
+        # Seuls les fichiers abîmés (tronqués, modifiés, absents) sont remis en file
+        print("--- Vérification du dossier contre le manifeste ---")
+        bad = downloader.verify()
+        for filename, problem in bad:
+            print(f"   [ABÎMÉ] {filename} : {problem}")
+        files_to_download = [filename for filename, _ in bad]
+    else:
+        # A. Ajout des Custom
+        print("--- Préparation de la liste Custom ---")
+        files_to_download.extend(CUSTOM_LIST)
+
+        # B. Ajout de l'Extension J
+        print(f"--- Préparation de la liste Extension J (U+{hex(EXT_J_START)} à U+{hex(EXT_J_END)}) ---")
+        for cp in range(EXT_J_START, EXT_J_END + 1):
+            # Format GlyphWiki pour unicode : "u" + hex minuscule (ex: u323b0)
+            hex_code = f"u{cp:x}"
+            files_to_download.append(hex_code)
+
+    total = len(files_to_download)
+    print(f"Total de fichiers à traiter : {total}")
+
+    # C. Téléchargement parallèle (pool borné, connexions keep-alive, politesse par hôte)
+    success_count = 0
+    error_count = 0
+    start_time = time.time()
+    try:
+        for i, (filename, status) in enumerate(downloader.run(partial(download_file, downloader), files_to_download)):
+            if status in (EXISTS, OK):
+                success_count += 1
+            elif status == ERROR:
+                error_count += 1
+
+            # Affichage progression tous les 100 fichiers
+            if i % 100 == 0:
+                print(f"   ... Progression : {i}/{total}")
+    finally:
+        # Sauvegarde du cache 404 et du manifeste même en cas d'interruption (Ctrl+C)
+        downloader.negative_cache.save()
+        downloader.manifest.save()
+
+    # D. Création du ZIP
+    print(f"\n=== CRÉATION DU ZIP ({ZIP_NAME}) ===")
+    # Mise à jour incrémentale : seuls les fichiers nouveaux ou modifiés sont compressés
+    zip_start = time.time()
+    stats = build_zip(OUTPUT_DIR, ZIP_NAME, extensions=('.ttf',), incremental=not args.full_zip)
+    print(f"   {format_stats(stats)} - {time.time() - zip_start:.1f}s")
+
+    print(f"Terminé ! {success_count} fichiers téléchargés en {time.time() - start_time:.0f}s.")
+    print(f"Votre fichier ZIP est prêt : {ZIP_NAME}")
+    print(downloader.negative_cache.summary())
+    if error_count:
+        # Les 404 (glyphes pas encore créés) ne comptent pas comme des échecs
+        print(f"[ERREUR] {error_count} téléchargements en échec : relancez le script.")
+        sys.exit(1)
@@ -0,0 +1,281 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from .table_cache import hash_file
+
+# Regroupe les polices à un seul glyphe (GlyphWiki, Ext J) en quelques polices
+# "lots" : chaque glyphe reçoit un code point privé (PUA, plan 15) stable d'un
+# run à l'autre, et la grille affiche ce code point au lieu du placeholder 〓.
+# Le navigateur charge alors quelques dizaines de fichiers au lieu de milliers.
+# Nécessite fontTools (pip install fonttools) pour construire les lots ; il n'est
+# importé que par les fonctions de construction : load_bundles(), appelé à chaque
+# génération de la grille, se contente de lire la table des code points.
+
+# --- CONFIGURATION ---
+FONT_DIRS = ("irg2024_fonts", "downloaded_fonts")
+BUNDLE_DIR = "font_bundles"
+PUA_MAP_FILE = os.path.join(BUNDLE_DIR, "pua_map.json")
+
+BUNDLE_FORMAT = 1
+PUA_START = 0xF0000     # Supplementary Private Use Area-A
+PUA_END = 0xFFFFD
+BUNDLE_SIZE = 256       # Glyphes par lot (un lot = une plage de code points contiguë)
+UNITS_PER_EM = 1024     # Les glyphes d'un autre em sont mis à l'échelle
+PLACEHOLDER_CP = 0x3013  # GlyphWiki place le glyphe sur 〓
+
+PARALLEL_THRESHOLD = 2   # Lots à reconstruire à partir desquels on utilise un pool
+
+
+def bundle_family(index):
+    return f"GW_BUNDLE_{index:03d}"
+
+
+def bundle_file(index):
+    return f"gw-bundle-{index:03d}.ttf"
+
+
+def bundle_index(code_point):
+    return (code_point - PUA_START) // BUNDLE_SIZE
+
+
+def load_pua_map(path=PUA_MAP_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('format') != BUNDLE_FORMAT or data.get('pua_start') != PUA_START \
+            or data.get('bundle_size') != BUNDLE_SIZE:
+        return None
+    return data
+
+
+def load_bundles(bundle_dir=BUNDLE_DIR, page_dir='.'):
+    # {fichier du glyphe: (code point PUA, famille du lot, chemin du lot)} pour
+    # les lots présents sur disque ; {} si font_bundler.py n'a pas été lancé.
+    # Le chemin est relatif à page_dir, le dossier des pages HTML qui chargent les lots.
+    data = load_pua_map(os.path.join(bundle_dir, "pua_map.json"))
+    if data is None:
+        return {}
+    bundles = {}
+    for name, entry in data['bundles'].items():
+        path = os.path.join(bundle_dir, name)
+        if not os.path.exists(path):
+            continue
+        url = os.path.relpath(path, page_dir).replace(os.sep, '/')
+        index = int(entry['index'])
+        for glyph in entry['glyphs']:
+            bundles[glyph] = (data['glyphs'][glyph], bundle_family(index), url)
+    return bundles
+
+
+def scan_fonts(font_dirs):
+    # {nom du fichier: chemin} ; un nom présent dans plusieurs dossiers vient du premier
+    fonts = {}
+    for directory in font_dirs:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if name.endswith('.ttf') and name not in fonts:
+                fonts[name] = os.path.join(directory, name)
+    return fonts
+
+
+def assign_code_points(glyphs, next_cp, names):
+    # Les glyphes déjà connus gardent leur code point, même disparus (jamais réattribué) ;
+    # les nouveaux prennent les suivants, dans l'ordre des noms.
+    added = 0
+    for name in sorted(names):
+        if name in glyphs:
+            continue
+        if next_cp > PUA_END:
+            raise ValueError("Plus de code point privé disponible")
+        glyphs[name] = next_cp
+        next_cp += 1
+        added += 1
+    return next_cp, added
+
+
+def bundle_digest(members):
+    payload = json.dumps([BUNDLE_FORMAT, UNITS_PER_EM, members], separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def source_glyph(font):
+    # Glyphe du fichier : celui de 〓 si le cmap le donne, sinon le premier glyphe réel
+    cmap = font.getBestCmap() or {}
+    name = cmap.get(PLACEHOLDER_CP)
+    if name is None:
+        name = next((g for g in font.getGlyphOrder() if g != '.notdef'), None)
+    return name
+
+
+def extract_glyph(path):
+    # (contour TrueType à l'échelle UNITS_PER_EM, chasse) ; composants décomposés
+    from fontTools.pens.cu2quPen import Cu2QuPen
+    from fontTools.pens.recordingPen import DecomposingRecordingPen
+    from fontTools.pens.transformPen import TransformPen
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(path, lazy=True)
+    name = source_glyph(font)
+    if name is None:
+        raise ValueError("aucun glyphe")
+    glyph_set = font.getGlyphSet()
+    recording = DecomposingRecordingPen(glyph_set)
+    glyph_set[name].draw(recording)
+    scale = UNITS_PER_EM / font['head'].unitsPerEm
+    pen = TTGlyphPen(None)
+    target = Cu2QuPen(pen, max_err=1.0, reverse_direction=False)
+    if scale != 1:
+        target = TransformPen(target, (scale, 0, 0, scale, 0, 0))
+    recording.replay(target)
+    advance = round(font['hmtx'][name][0] * scale)
+    font.close()
+    glyph = pen.glyph()
+    glyph.recalcBounds(None)    # Glyphe simple : la table glyf n'est pas nécessaire
+    return glyph, advance
+
+
+def empty_glyph():
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    return TTGlyphPen(None).glyph()
+
+
+def build_bundle(job):
+    # Exécuté dans un processus du pool : construit et écrit un lot
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.misc.timeTools import timestampSinceEpoch
+
+    glyph_order = ['.notdef']
+    glyphs = {'.notdef': empty_glyph()}
+    metrics = {'.notdef': (UNITS_PER_EM, 0)}
+    cmap = {}
+    skipped = []
+    for name, code_point, path in job['members']:
+        try:
+            glyph, advance = extract_glyph(path)
+        except Exception as e:
+            skipped.append((name, str(e)))
+            continue
+        glyph_name = f"uni{code_point:X}"
+        glyph_order.append(glyph_name)
+        glyphs[glyph_name] = glyph
+        cmap[code_point] = glyph_name
+        metrics[glyph_name] = (advance, getattr(glyph, 'xMin', 0))
+
+    family = bundle_family(job['index'])
+    builder = FontBuilder(UNITS_PER_EM, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap(cmap)
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics(metrics)
+    builder.setupHorizontalHeader(ascent=UNITS_PER_EM * 7 // 8, descent=-(UNITS_PER_EM // 8))
+    builder.setupNameTable({'familyName': family, 'styleName': 'Regular'})
+    builder.setupOS2(sTypoAscender=UNITS_PER_EM * 7 // 8, sTypoDescender=-(UNITS_PER_EM // 8),
+                     usWinAscent=UNITS_PER_EM * 7 // 8, usWinDescent=UNITS_PER_EM // 8)
+    builder.setupPost()
+    # Dates figées : même contenu -> mêmes octets
+    builder.font['head'].created = builder.font['head'].modified = timestampSinceEpoch(0)
+    builder.font.recalcTimestamp = False
+    tmp_path = f"{job['path']}.tmp"
+    builder.save(tmp_path)
+    os.replace(tmp_path, job['path'])
+    return job['index'], len(cmap), skipped
+
+
+def build_bundles(font_dirs=FONT_DIRS, bundle_dir=BUNDLE_DIR, workers=None, full=False):
+    from .glyph_downloader import write_json_atomic
+    from .process_pool import process_pool
+
+    os.makedirs(bundle_dir, exist_ok=True)
+    map_path = os.path.join(bundle_dir, "pua_map.json")
+    data = load_pua_map(map_path) or {'glyphs': {}, 'next': PUA_START, 'bundles': {}}
+
+    fonts = scan_fonts(font_dirs)
+    glyphs = data['glyphs']
+    next_cp, added = assign_code_points(glyphs, data['next'], fonts)
+
+    # Membres de chaque lot (glyphes présents sur disque), dans l'ordre des code points
+    members = {}
+    for name, code_point in sorted(glyphs.items(), key=lambda item: item[1]):
+        if name in fonts:
+            members.setdefault(bundle_index(code_point), []).append((name, code_point, fonts[name]))
+
+    previous = data['bundles']
+    bundles, jobs = {}, []
+    for index, entries in sorted(members.items()):
+        name = bundle_file(index)
+        digest = bundle_digest([(glyph, code_point, hash_file(path)) for glyph, code_point, path in entries])
+        bundles[name] = {'index': index, 'sha256': digest, 'glyphs': [entry[0] for entry in entries]}
+        old = previous.get(name)
+        path = os.path.join(bundle_dir, name)
+        if full or old is None or old.get('sha256') != digest or not os.path.exists(path):
+            jobs.append({'index': index, 'members': entries, 'path': path})
+        else:
+            # Lot inchangé : même liste (sans les glyphes ignorés à sa construction)
+            bundles[name]['glyphs'] = old['glyphs']
+
+    if len(jobs) >= PARALLEL_THRESHOLD and (workers is None or workers > 1):
+        with process_pool(workers) as pool:
+            results = list(pool.map(build_bundle, jobs))
+    else:
+        results = [build_bundle(job) for job in jobs]
+
+    skipped = []
+    for index, _, errors in results:
+        skipped += errors
+        if errors:
+            # Glyphes illisibles : retirés du lot pour garder le placeholder dans la grille
+            entry = bundles[bundle_file(index)]
+            bad = {name for name, _ in errors}
+            entry['glyphs'] = [glyph for glyph in entry['glyphs'] if glyph not in bad]
+
+    removed = 0
+    for name in previous:
+        if name not in bundles:
+            path = os.path.join(bundle_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+            removed += 1
+
+    write_json_atomic(map_path, {
+        'format': BUNDLE_FORMAT,
+        'pua_start': PUA_START,
+        'bundle_size': BUNDLE_SIZE,
+        'next': next_cp,
+        'glyphs': glyphs,
+        'bundles': bundles,
+    })
+    return {'glyphs': sum(len(entry['glyphs']) for entry in bundles.values()), 'added': added,
+            'bundles': len(bundles), 'written': len(jobs), 'removed': removed, 'skipped': skipped}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Regroupement des polices GlyphWiki en lots à code points privés")
+    parser.add_argument('--full', action='store_true',
+                        help="Reconstruit tous les lots, même inchangés")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Nombre de processus de construction (défaut : nombre de cœurs)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import importlib.util
+
+    args = parse_args(argv)
+    if importlib.util.find_spec('fontTools') is None:
+        print("ERREUR: fontTools est nécessaire pour construire les lots (pip install fonttools).")
+        raise SystemExit(1)
+    print(f"--- Regroupement des polices de {', '.join(FONT_DIRS)} dans '{BUNDLE_DIR}' ---")
+    start_time = time.time()
+    stats = build_bundles(workers=args.workers, full=args.full)
+    for name, message in stats['skipped']:
+        print(f"   [IGNORÉ] {name} ({message})")
+    print(f"   {stats['glyphs']} glyphes ({stats['added']} nouveaux) dans {stats['bundles']} lots : "
+          f"{stats['written']} reconstruits, {stats['removed']} supprimés.")
+    print(f"Terminé en {time.time() - start_time:.1f} s. Relancez kanji-all.py pour utiliser les lots.")
@@ -0,0 +1,347 @@
+import os
+import struct
+import tempfile
+import time
+import zipfile
+import zlib
+
+from .process_pool import process_pool
+
+# --- CONFIGURATION PAR DÉFAUT ---
+# Au-delà de cette proportion d'octets morts (membres remplacés ou supprimés),
+# l'archive est réécrite au propre au lieu d'être complétée par la fin.
+COMPACT_RATIO = 0.25
+COMPRESS_LEVEL = 9
+
+# Politique de compression par extension : les formats déjà compressés
+# et les fichiers minuscules sont stockés tels quels (ZIP_STORED).
+STORED_EXTENSIONS = ('.zip', '.gz', '.bz2', '.xz', '.br', '.woff', '.woff2',
+                     '.png', '.jpg', '.jpeg', '.gif', '.webp')
+MIN_DEFLATE_SIZE = 128
+
+# Compression parallèle : un pool de processus au-delà de ce nombre de fichiers
+PARALLEL_THRESHOLD = 32
+CHUNKSIZE = 16
+
+# Format ZIP (sans Zip64 : largement suffisant pour quelques milliers de polices)
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+END_RECORD = struct.Struct('<IHHHHIIH')
+LOCAL_DATE = struct.Struct('<HH')   # Heure + date DOS d'un en-tête local
+LOCAL_DATE_OFFSET = 10
+LOCAL_SIG = 0x04034b50
+CENTRAL_SIG = 0x02014b50
+END_SIG = 0x06054b50
+VERSION = 20
+FLAG_UTF8 = 0x800
+FLAG_DATA_DESCRIPTOR = 0x08
+MAX_ENTRIES = 0xFFFF
+MAX_OFFSET = 0xFFFFFFFF
+
+
+class Member:
+    # Un membre prêt à écrire : données déjà compressées (data) ou à recopier
+    # telles quelles depuis l'ancienne archive (raw_offset).
+    __slots__ = ('arcname', 'method', 'crc', 'compress_size', 'file_size',
+                 'dos_time', 'dos_date', 'data', 'raw_offset', 'header_offset')
+
+    def __init__(self, arcname, method, crc, compress_size, file_size, dos_time, dos_date,
+                 data=None, raw_offset=None, header_offset=None):
+        self.arcname = arcname
+        self.method = method
+        self.crc = crc
+        self.compress_size = compress_size
+        self.file_size = file_size
+        self.dos_time = dos_time
+        self.dos_date = dos_date
+        self.data = data
+        self.raw_offset = raw_offset
+        self.header_offset = header_offset
+
+    def name_and_flags(self):
+        try:
+            return self.arcname.encode('ascii'), 0
+        except UnicodeEncodeError:
+            return self.arcname.encode('utf-8'), FLAG_UTF8
+
+
+def fixed_timestamp():
+    # SOURCE_DATE_EPOCH fige la date de tous les membres (archives reproductibles
+    # d'une machine à l'autre, quelles que soient les dates des fichiers)
+    value = os.environ.get('SOURCE_DATE_EPOCH')
+    return int(value) if value else None
+
+
+def dos_datetime(mtime, fixed=None):
+    # Même conversion que zipfile.ZipInfo.from_file (heure locale, 2 s de résolution)
+    t = time.gmtime(fixed) if fixed is not None else time.localtime(mtime)
+    year = max(t.tm_year, 1980)
+    dos_date = (year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    return dos_time, dos_date
+
+
+def date_time_tuple(mtime, fixed=None):
+    # Date attendue dans l'archive pour ce fichier (même règle que dos_datetime)
+    t = time.gmtime(fixed) if fixed is not None else time.localtime(mtime)
+    return (max(t.tm_year, 1980), t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec // 2 * 2)
+
+
+def scan_directory(src_dir, extensions):
+    # arcname -> (chemin, taille, mtime) ; les fichiers sont mis à la racine du zip
+    found = {}
+    for root, dirs, files in os.walk(src_dir):
+        for file in files:
+            if file.endswith(extensions):
+                filepath = os.path.join(root, file)
+                st = os.stat(filepath)
+                found[file] = (filepath, st.st_size, st.st_mtime)
+    return found
+
+
+def file_crc(filepath):
+    crc = 0
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def compress_file(arcname, filepath, mtime, level=COMPRESS_LEVEL, fixed=None):
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    method, data = zipfile.ZIP_STORED, raw
+    if len(raw) >= MIN_DEFLATE_SIZE and not arcname.lower().endswith(STORED_EXTENSIONS):
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        deflated = compressor.compress(raw) + compressor.flush()
+        if len(deflated) < len(raw):
+            method, data = zipfile.ZIP_DEFLATED, deflated
+    dos_time, dos_date = dos_datetime(mtime, fixed)
+    return Member(arcname, method, zlib.crc32(raw), len(data), len(raw),
+                  dos_time, dos_date, data=data)
+
+
+def _compress_job(job):
+    # Exécuté dans un processus du pool (doit rester au niveau du module)
+    return compress_file(*job)
+
+
+def compress_many(current, names, workers=None, fixed=None):
+    # Compresse les fichiers en parallèle ; les membres sortent dans l'ordre de names
+    jobs = [(name, current[name][0], current[name][2], COMPRESS_LEVEL, fixed) for name in names]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) < PARALLEL_THRESHOLD:
+        for job in jobs:
+            yield _compress_job(job)
+        return
+    with process_pool(workers) as pool:
+        yield from pool.map(_compress_job, jobs, chunksize=CHUNKSIZE)
+
+
+def member_from_info(info):
+    # Membre existant, recopié sans recompression
+    (year, month, day, hour, minute, second) = info.date_time
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    dos_time = hour << 11 | minute << 5 | second // 2
+    return Member(info.filename, info.compress_type, info.CRC, info.compress_size, info.file_size,
+                  dos_time, dos_date, raw_offset=info.header_offset)
+
+
+def read_raw(f, header_offset, compress_size):
+    f.seek(header_offset)
+    header = f.read(LOCAL_HEADER.size)
+    fields = LOCAL_HEADER.unpack(header)
+    if fields[0] != LOCAL_SIG:
+        raise zipfile.BadZipFile(f"en-tête local invalide à l'offset {header_offset}")
+    name_len, extra_len = fields[9], fields[10]
+    f.seek(header_offset + LOCAL_HEADER.size + name_len + extra_len)
+    return f.read(compress_size)
+
+
+def write_member(out, member, source=None):
+    name, flags = member.name_and_flags()
+    member.header_offset = out.tell()
+    if member.header_offset > MAX_OFFSET:
+        raise ValueError("archive trop volumineuse pour le format ZIP classique (Zip64 requis)")
+    out.write(LOCAL_HEADER.pack(LOCAL_SIG, VERSION, flags, member.method,
+                                member.dos_time, member.dos_date, member.crc,
+                                member.compress_size, member.file_size, len(name), 0))
+    out.write(name)
+    if member.data is not None:
+        out.write(member.data)
+    else:
+        out.write(read_raw(source, member.raw_offset, member.compress_size))
+
+
+def write_central_directory(out, members):
+    if len(members) > MAX_ENTRIES:
+        raise ValueError("trop de fichiers pour le format ZIP classique (Zip64 requis)")
+    start = out.tell()
+    for member in members:
+        name, flags = member.name_and_flags()
+        out.write(CENTRAL_HEADER.pack(CENTRAL_SIG, VERSION, VERSION, flags, member.method,
+                                      member.dos_time, member.dos_date, member.crc,
+                                      member.compress_size, member.file_size, len(name),
+                                      0, 0, 0, 0, 0, member.header_offset))
+        out.write(name)
+    end = out.tell()
+    out.write(END_RECORD.pack(END_SIG, 0, 0, len(members), len(members), end - start, start, 0))
+
+
+def read_archive(zip_path):
+    # Renvoie (membres existants par nom, offset du répertoire central) ou None
+    # si l'archive est absente ou inexploitable (elle sera alors reconstruite).
+    if not os.path.exists(zip_path):
+        return None
+    try:
+        with zipfile.ZipFile(zip_path) as z:
+            infos = z.infolist()
+            start_dir = z.start_dir
+    except (zipfile.BadZipFile, OSError):
+        return None
+    for info in infos:
+        if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return None
+        if info.flag_bits & FLAG_DATA_DESCRIPTOR or info.file_size > MAX_OFFSET:
+            return None
+    return {info.filename: info for info in infos}, start_dir
+
+
+def member_span(info):
+    return LOCAL_HEADER.size + len(info.filename.encode('utf-8')) + len(info.extra) + info.compress_size
+
+
+def build_zip(src_dir, zip_path, extensions=('.ttf',), incremental=True, workers=None):
+    # Construit ou met à jour zip_path à partir des fichiers de src_dir.
+    # En mode incrémental, l'archive existante est comparée au dossier
+    # (taille, date, CRC) : les membres inchangés ne sont pas recompressés.
+    # Les membres à compresser le sont dans un pool de processus ; une
+    # construction complète est reproductible à l'octet près (ordre trié).
+    # Avec SOURCE_DATE_EPOCH, tous les membres portent la date figée, qui ne
+    # dit rien du contenu : chaque fichier de même taille est comparé par CRC.
+    fixed = fixed_timestamp()
+    current = scan_directory(src_dir, extensions)
+    previous = read_archive(zip_path) if incremental else None
+    old_infos, start_dir = previous if previous else ({}, 0)
+
+    unchanged, touched, added, changed = [], [], [], []
+    for arcname in sorted(current):
+        filepath, size, mtime = current[arcname]
+        info = old_infos.get(arcname)
+        if info is None:
+            added.append(arcname)
+        elif info.file_size != size:
+            changed.append(arcname)
+        elif fixed is None and info.date_time == date_time_tuple(mtime):
+            unchanged.append(arcname)
+        elif file_crc(filepath) != info.CRC:
+            changed.append(arcname)
+        elif info.date_time == date_time_tuple(mtime, fixed):
+            unchanged.append(arcname)
+        else:
+            touched.append(arcname)   # Même contenu, seule la date a bougé
+    removed = sorted(set(old_infos) - set(current))
+
+    stats = {'unchanged': len(unchanged) + len(touched), 'added': len(added),
+             'changed': len(changed), 'removed': len(removed), 'files': len(current)}
+
+    # Membres touchés : nouvelle date écrite dans l'archive, pour ne plus recalculer leur CRC
+    dates = {name: dos_datetime(current[name][2], fixed) for name in touched}
+    if previous and not (added or changed or removed or touched):
+        stats['mode'] = 'à jour'
+        return stats
+
+    # Octets morts après l'opération : anciennes versions des membres remplacés ou supprimés
+    live = sum(member_span(old_infos[name]) for name in unchanged + touched)
+    dead_ratio = (start_dir - live) / start_dir if start_dir else 0.0
+
+    kept = unchanged + touched
+    fresh = compress_many(current, sorted(added + changed), workers, fixed)
+    try:
+        if previous and dead_ratio <= COMPACT_RATIO:
+            stats['mode'] = 'ajout'
+            append_members(zip_path, old_infos, start_dir, kept, fresh, dates)
+        else:
+            stats['mode'] = 'réécriture' if previous else 'complet'
+            rewrite_archive(zip_path, old_infos, kept, sorted(added + changed), fresh, dates)
+    finally:
+        fresh.close()   # Arrêt du pool de processus
+    return stats
+
+
+def kept_member(info, dates):
+    # Membre existant recopié tel quel, avec sa nouvelle date s'il a été touché
+    member = member_from_info(info)
+    if info.filename in dates:
+        member.dos_time, member.dos_date = dates[info.filename]
+    return member
+
+
+def append_members(zip_path, old_infos, start_dir, kept, fresh, dates):
+    # Les nouveaux membres sont écrits à la place de l'ancien répertoire central,
+    # puis un répertoire central à jour est ajouté : coût proportionnel aux changements.
+    # Toute la compression a lieu avant la première écriture ; si l'écriture
+    # échoue, l'ancien répertoire central est remis en place (archive intacte).
+    kept_set = set(kept)
+    members = [kept_member(info, dates) for name, info in old_infos.items() if name in kept_set]
+    for member in members:
+        member.header_offset = member.raw_offset
+    fresh = list(fresh)
+
+    with open(zip_path, 'r+b') as out:
+        out.seek(start_dir)
+        old_tail = out.read()
+        try:
+            out.seek(start_dir)
+            for member in fresh:
+                write_member(out, member)
+                member.data = None
+                members.append(member)
+            write_central_directory(out, members)
+            out.truncate()
+        except BaseException:
+            out.seek(start_dir)
+            out.write(old_tail)
+            out.truncate()
+            raise
+        # En-têtes locaux des membres touchés alignés sur le répertoire central
+        # (une interruption ici laisse une archive lisible)
+        for member in members:
+            if member.arcname in dates:
+                out.seek(member.header_offset + LOCAL_DATE_OFFSET)
+                out.write(LOCAL_DATE.pack(member.dos_time, member.dos_date))
+
+
+def rewrite_archive(zip_path, old_infos, kept, fresh_names, fresh, dates):
+    # Réécriture complète, triée par nom ; les membres inchangés sont recopiés bruts
+    # et les autres arrivent déjà compressés, dans le même ordre trié.
+    kept_set = set(kept)
+    directory = os.path.dirname(os.path.abspath(zip_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.zip.part')
+    members = []
+    source = open(zip_path, 'rb') if kept_set else None
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            for arcname in sorted(kept_set | set(fresh_names)):
+                if arcname in kept_set:
+                    member = kept_member(old_infos[arcname], dates)
+                else:
+                    member = next(fresh)
+                write_member(out, member, source)
+                member.data = None
+                members.append(member)
+            write_central_directory(out, members)
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        if source is not None:
+            source.close()
+
+
+def format_stats(stats):
+    return (f"{stats['files']} fichiers ({stats['mode']}) : {stats['added']} ajoutés, "
+            f"{stats['changed']} modifiés, {stats['removed']} supprimés, "
+            f"{stats['unchanged']} inchangés")
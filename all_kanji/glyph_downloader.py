@@ -0,0 +1,464 @@
+import contextvars
+import hashlib
+import http.client
+import json
+import os
+import random
+import struct
+import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# --- CONFIGURATION PAR DÉFAUT ---
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+DEFAULT_WORKERS = 8          # Taille du pool de téléchargement
+DEFAULT_PER_HOST = 4         # Requêtes simultanées max vers un même serveur
+DEFAULT_MIN_INTERVAL = 0.02  # Délai minimal (s) entre deux requêtes vers un même serveur
+DEFAULT_RETRIES = 3          # Nouvelles tentatives après une erreur réseau / 5xx / 429
+DEFAULT_BACKOFF = 0.5        # Attente initiale (s), doublée à chaque tentative
+DEFAULT_TIMEOUT = 30
+DEFAULT_NEGATIVE_TTL = 7 * 24 * 3600  # Durée de validité d'un 404 mémorisé (s)
+
+# Vérification rapide des fichiers TrueType / OpenType
+SFNT_VERSIONS = {b'\x00\x01\x00\x00', b'true', b'OTTO'}
+REQUIRED_TABLES = {b'head', b'cmap'}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# Statuts renvoyés par GlyphDownloader.download()
+EXISTS = 'exists'
+OK = 'ok'
+MISSING = 'missing'
+KNOWN_MISSING = 'known-missing'   # 404 déjà mémorisé dans le cache négatif
+ERROR = 'error'
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, code, url):
+        super().__init__(f"HTTP {code} pour {url}")
+        self.code = code
+        self.url = url
+
+
+class HostLimiter:
+    # Politesse par serveur : nombre de connexions simultanées borné
+    # + intervalle minimal entre deux départs de requête.
+    def __init__(self, max_concurrent, min_interval):
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self):
+        self._slots.acquire()
+        if self._min_interval > 0:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start) + self._min_interval
+            if wait > 0:
+                time.sleep(wait)
+        return self
+
+    def __exit__(self, *exc):
+        self._slots.release()
+        return False
+
+
+# Limiteurs partagés par tous les téléchargeurs du processus : le pipeline lance
+# les deux scripts de polices en même temps vers glyphwiki.org, la limite reste
+# celle d'un seul téléchargeur (réglages du premier qui contacte le serveur).
+_host_limiters = {}
+_host_limiters_lock = threading.Lock()
+
+
+def host_limiter(host, max_concurrent=DEFAULT_PER_HOST, min_interval=DEFAULT_MIN_INTERVAL):
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _host_limiters[host] = HostLimiter(max_concurrent, min_interval)
+        return limiter
+
+
+def write_file_atomic(path, data, sync=True):
+    # Écriture dans un fichier temporaire du même dossier puis renommage :
+    # un crash ne laisse jamais de fichier tronqué sous le nom final.
+    # sync=False : pas de fsync par fichier (polices, voir FontManifest.save)
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_atomic(path, data):
+    write_file_atomic(path, json.dumps(data, indent=1, sort_keys=True).encode('utf-8'))
+
+
+def sync_directory(directory):
+    # fsync du dossier : les renommages qu'il contient survivent à une coupure
+    # (sans effet là où un dossier ne s'ouvre pas, comme sous Windows)
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def check_truetype(data):
+    # Contrôle rapide de l'en-tête sfnt et du répertoire des tables.
+    # Renvoie None si le fichier semble sain, sinon la raison du rejet.
+    if len(data) < 12:
+        return "fichier trop court"
+    if data[:4] not in SFNT_VERSIONS:
+        return "en-tête TrueType invalide"
+    num_tables = struct.unpack_from('>H', data, 4)[0]
+    if num_tables == 0 or 12 + 16 * num_tables > len(data):
+        return "répertoire des tables tronqué"
+    tags = set()
+    for i in range(num_tables):
+        tag, _checksum, offset, length = struct.unpack_from('>4sIII', data, 12 + 16 * i)
+        if offset + length > len(data):
+            return f"table {tag.decode('latin-1')} tronquée"
+        tags.add(tag)
+    missing = REQUIRED_TABLES - tags
+    if missing:
+        return "table(s) manquante(s) : " + ", ".join(sorted(t.decode('latin-1') for t in missing))
+    return None
+
+
+class FontManifest:
+    # Taille et empreinte SHA-256 de chaque police téléchargée.
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"   [Manifeste] Fichier illisible ({e}), reconstruction.")
+
+    def get(self, name):
+        with self._lock:
+            return self._entries.get(name)
+
+    def names(self):
+        with self._lock:
+            return list(self._entries)
+
+    def record(self, name, data):
+        entry = {'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+        with self._lock:
+            self._entries[name] = entry
+            self._dirty = True
+
+    def drop(self, name):
+        with self._lock:
+            if self._entries.pop(name, None) is not None:
+                self._dirty = True
+
+    def save(self):
+        # Un seul fsync du dossier des polices par run, au lieu d'un par fichier ;
+        # une police restée incomplète après une coupure n'a pas la taille
+        # du manifeste et sera retéléchargée (ou signalée par --verify)
+        with self._lock:
+            if not self._dirty:
+                return
+            sync_directory(os.path.dirname(self.path) or '.')
+            write_json_atomic(self.path, self._entries)
+            self._dirty = False
+
+
+class NegativeCache:
+    # Mémorise les glyphes introuvables (404) avec leur date, pour ne pas
+    # les redemander à chaque relance tant que le TTL n'est pas écoulé.
+    def __init__(self, path, ttl=DEFAULT_NEGATIVE_TTL, recheck=False):
+        self.path = path
+        self.ttl = ttl
+        self.recheck = recheck
+        self.hits = 0      # Requêtes évitées grâce au cache
+        self.misses = 0    # Noms absents (ou expirés) du cache : requête envoyée
+        self.added = 0     # Nouveaux 404 enregistrés
+        self.cleared = 0   # Glyphes apparus depuis leur mise en cache
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"   [Cache 404] Fichier illisible ({e}), cache ignoré.")
+
+    def is_missing(self, name):
+        with self._lock:
+            stamp = self._entries.get(name)
+            if not self.recheck and stamp is not None and time.time() - stamp < self.ttl:
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def record(self, name):
+        with self._lock:
+            if name not in self._entries:
+                self.added += 1
+            self._entries[name] = time.time()
+            self._dirty = True
+
+    def discard(self, name):
+        with self._lock:
+            if self._entries.pop(name, None) is not None:
+                self.cleared += 1
+                self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            # Purge des entrées expirées
+            now = time.time()
+            self._entries = {k: v for k, v in self._entries.items() if now - v < self.ttl}
+            write_json_atomic(self.path, self._entries)
+            self._dirty = False
+
+    def summary(self):
+        return (f"Cache 404 : {self.hits} évités (hit), {self.misses} vérifiés (miss), "
+                f"{self.added} nouveaux 404, {self.cleared} retrouvés, "
+                f"{len(self._entries)} en cache")
+
+
+class GlyphDownloader:
+    def __init__(self, base_url, output_dir, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST,
+                 min_interval=DEFAULT_MIN_INTERVAL, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT, negative_cache=None,
+                 manifest=None):
+        self.base_url = base_url
+        self.output_dir = output_dir
+        self.workers = workers
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.negative_cache = negative_cache
+        self.manifest = manifest
+
+        self._local = threading.local()   # Une connexion keep-alive par thread et par hôte
+        self._lock = threading.Lock()
+        self._open_conns = []
+
+    # --- Connexions ---
+
+    def _connection(self, scheme, host):
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get((scheme, host))
+        if conn is None:
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(host, timeout=self.timeout)
+            else:
+                conn = http.client.HTTPConnection(host, timeout=self.timeout)
+            conns[(scheme, host)] = conn
+            with self._lock:
+                self._open_conns.append(conn)
+        return conn
+
+    def _drop_connection(self, scheme, host):
+        conns = getattr(self._local, 'conns', {})
+        conn = conns.pop((scheme, host), None)
+        if conn is not None:
+            conn.close()
+            with self._lock:
+                if conn in self._open_conns:
+                    self._open_conns.remove(conn)
+
+    def close(self):
+        # Ferme toutes les connexions keep-alive ouvertes par les workers
+        with self._lock:
+            conns, self._open_conns = self._open_conns, []
+        for conn in conns:
+            conn.close()
+
+    # --- Requêtes ---
+
+    def _request_once(self, url):
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        with host_limiter(parts.netloc, self.per_host, self.min_interval):
+            conn = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request('GET', path, headers={'User-Agent': USER_AGENT,
+                                                   'Connection': 'keep-alive'})
+                response = conn.getresponse()
+                # Lecture complète obligatoire pour pouvoir réutiliser la connexion
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                self._drop_connection(parts.scheme, parts.netloc)
+                raise
+            if response.will_close:
+                self._drop_connection(parts.scheme, parts.netloc)
+        return response.status, response.getheader('Location'), response.getheader('Retry-After'), body
+
+    def _sleep_before_retry(self, attempt, retry_after=None):
+        delay = self.backoff * (2 ** attempt)
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        time.sleep(delay + random.uniform(0, self.backoff))
+
+    def fetch(self, url):
+        redirects = 0
+        attempt = 0
+        while True:
+            try:
+                status, location, retry_after, body = self._request_once(url)
+            except (OSError, http.client.HTTPException):
+                if attempt >= self.retries:
+                    raise
+                self._sleep_before_retry(attempt)
+                attempt += 1
+                continue
+
+            if status == 200:
+                return body
+            if status in REDIRECT_STATUSES and location and redirects < MAX_REDIRECTS:
+                url = urllib.parse.urljoin(url, location)
+                redirects += 1
+                continue
+            if status in RETRY_STATUSES and attempt < self.retries:
+                self._sleep_before_retry(attempt, retry_after)
+                attempt += 1
+                continue
+            raise HTTPStatusError(status, url)
+
+    # --- Fichiers de police ---
+
+    def download(self, filename):
+        # Renvoie (statut, détail) : EXISTS, OK, MISSING (404), KNOWN_MISSING ou ERROR
+        url = f"{self.base_url}{filename}.ttf"
+        filepath = os.path.join(self.output_dir, f"{filename}.ttf")
+
+        if self._is_complete(filename, filepath):
+            return EXISTS, None
+
+        cache = self.negative_cache
+        if cache is not None and cache.is_missing(filename):
+            return KNOWN_MISSING, None
+
+        try:
+            data = self.fetch(url)
+        except HTTPStatusError as e:
+            if e.code == 404:
+                if cache is not None:
+                    cache.record(filename)
+                return MISSING, e
+            return ERROR, e
+        except Exception as e:
+            return ERROR, e
+
+        problem = check_truetype(data)
+        if problem:
+            return ERROR, f"police invalide ({problem})"
+
+        write_file_atomic(filepath, data, sync=False)
+        if self.manifest is not None:
+            self.manifest.record(filename, data)
+        if cache is not None:
+            cache.discard(filename)
+        return OK, None
+
+    def _is_complete(self, filename, filepath):
+        if self.manifest is None:
+            return os.path.exists(filepath)
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            return False
+        entry = self.manifest.get(filename)
+        if entry is not None:
+            return entry['size'] == size
+        # Fichier d'un run précédent sans manifeste : adopté s'il est sain
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        if check_truetype(data):
+            return False
+        self.manifest.record(filename, data)
+        return True
+
+    def verify(self):
+        # Passe de vérification parallèle du dossier contre le manifeste.
+        # Les fichiers abîmés sont supprimés ; renvoie la liste des noms à retélécharger.
+        manifest = self.manifest
+        on_disk = {f[:-4] for f in os.listdir(self.output_dir) if f.endswith('.ttf')}
+        names = sorted(on_disk | set(manifest.names()))
+
+        def check(name):
+            filepath = os.path.join(self.output_dir, f"{name}.ttf")
+            try:
+                with open(filepath, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                return "fichier absent"
+            entry = manifest.get(name)
+            if entry is not None:
+                if entry['size'] != len(data):
+                    return "taille différente du manifeste"
+                if entry['sha256'] != hashlib.sha256(data).hexdigest():
+                    return "empreinte SHA-256 différente du manifeste"
+            problem = check_truetype(data)
+            if problem:
+                return problem
+            if entry is None:
+                manifest.record(name, data)
+            return None
+
+        bad = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for name, problem in zip(names, pool.map(check, names)):
+                if problem:
+                    bad.append((name, problem))
+                    manifest.drop(name)
+                    filepath = os.path.join(self.output_dir, f"{name}.ttf")
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+        manifest.save()
+        return bad
+
+    def run(self, func, items):
+        # Exécute func(item) dans le pool borné ; renvoie (item, résultat) dans l'ordre d'achèvement.
+        # Chaque tâche garde le contexte de l'appelant (nom de l'étape du pipeline pour ses messages).
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(contextvars.copy_context().run, func, item): item for item in items}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+        self.close()
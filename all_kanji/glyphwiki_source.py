@@ -0,0 +1,152 @@
+import array
+import hashlib
+import marshal
+import os
+
+from .char_table import MAX_IDENT, MAX_SOURCES, STROKE_OFFSET
+
+# Données GlyphWiki saisies à la main, en TSV sous data/glyphwiki/ :
+#   sources.tsv  : key, prefix, name (un dictionnaire par ligne, dans l'ordre de tri)
+#   <key>.tsv    : id, rad, str (un glyphe sans équivalent Unicode par ligne)
+# Lignes vides et lignes commençant par # ignorées. Les fichiers sont validés
+# puis compilés en colonnes marshal ; le cache est réutilisé tant que
+# l'empreinte des fichiers TSV ne change pas.
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "glyphwiki")
+SOURCES_FILE = "sources.tsv"
+SOURCES_HEADER = ["key", "prefix", "name"]
+ENTRIES_HEADER = ["id", "rad", "str"]
+
+COMPILED_FORMAT = 1
+MAX_RADICAL = 216       # 215 : radical inconnu, 216 : fin de grille (voir kanji_all)
+MIN_STROKES = -STROKE_OFFSET
+MAX_STROKES = 255 - STROKE_OFFSET
+
+
+class GlyphWikiDataError(ValueError):
+    pass
+
+
+def iter_tsv(path, header):
+    # (numéro de ligne, champs) ; la première ligne utile doit être l'en-tête attendu
+    with open(path, 'r', encoding='utf-8') as f:
+        seen_header = False
+        for number, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            fields = line.split('\t')
+            if not seen_header:
+                if fields != header:
+                    raise GlyphWikiDataError(f"{path}:{number}: en-tête attendu {'/'.join(header)}")
+                seen_header = True
+                continue
+            if len(fields) != len(header):
+                raise GlyphWikiDataError(f"{path}:{number}: {len(header)} colonnes attendues, {len(fields)} trouvées")
+            yield number, fields
+
+
+def parse_int(path, number, name, value, low, high):
+    try:
+        result = int(value)
+    except ValueError:
+        raise GlyphWikiDataError(f"{path}:{number}: {name} non entier : {value!r}") from None
+    if not low <= result <= high:
+        raise GlyphWikiDataError(f"{path}:{number}: {name} hors limites ({low} à {high}) : {result}")
+    return result
+
+
+def data_files(data_dir):
+    return sorted(name for name in os.listdir(data_dir) if name.endswith('.tsv'))
+
+
+def data_digest(data_dir=DATA_DIR):
+    # Empreinte des noms et contenus de tous les fichiers TSV
+    hasher = hashlib.sha256(f"v{COMPILED_FORMAT}".encode('ascii'))
+    for name in data_files(data_dir):
+        with open(os.path.join(data_dir, name), 'rb') as f:
+            data = f.read()
+        hasher.update(f"|{name}|{len(data)}|".encode('utf-8'))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+def compile_sources(data_dir):
+    # Lit et valide les TSV ; renvoie les colonnes :
+    #   dicts  : [[clé, préfixe], ...] dans l'ordre de sources.tsv
+    #   source : indice dans dicts de chaque glyphe (array 'B' en octets)
+    #   ident  : numéros GlyphWiki (chaînes, zéros de tête conservés)
+    #   rad / str : radical (array 'H') et traits (array 'h') en octets
+    sources_path = os.path.join(data_dir, SOURCES_FILE)
+    dicts, index = [], {}
+    for number, (key, prefix, _) in iter_tsv(sources_path, SOURCES_HEADER):
+        if not key or not prefix:
+            raise GlyphWikiDataError(f"{sources_path}:{number}: clé et préfixe obligatoires")
+        if key in index:
+            raise GlyphWikiDataError(f"{sources_path}:{number}: dictionnaire en double : {key}")
+        index[key] = len(dicts)
+        dicts.append([key, prefix])
+    if len(dicts) >= MAX_SOURCES:
+        raise GlyphWikiDataError(f"{sources_path}: au plus {MAX_SOURCES - 1} dictionnaires")
+
+    source, ident = array.array('B'), []
+    rad, strokes = array.array('H'), array.array('h')
+    for name in data_files(data_dir):
+        if name == SOURCES_FILE:
+            continue
+        key = name[:-len('.tsv')]
+        path = os.path.join(data_dir, name)
+        if key not in index:
+            raise GlyphWikiDataError(f"{path}: dictionnaire absent de {SOURCES_FILE} : {key}")
+        seen = set()
+        for number, (raw_id, raw_rad, raw_strokes) in iter_tsv(path, ENTRIES_HEADER):
+            if not raw_id.isdigit() or int(raw_id) > MAX_IDENT:
+                raise GlyphWikiDataError(f"{path}:{number}: numéro GlyphWiki invalide : {raw_id!r}")
+            if raw_id in seen:
+                raise GlyphWikiDataError(f"{path}:{number}: glyphe en double : {key}-{raw_id}")
+            seen.add(raw_id)
+            source.append(index[key])
+            ident.append(raw_id)
+            rad.append(parse_int(path, number, "radical", raw_rad, 1, MAX_RADICAL))
+            strokes.append(parse_int(path, number, "traits", raw_strokes, MIN_STROKES, MAX_STROKES))
+    return {'dicts': dicts, 'source': source.tobytes(), 'ident': ident,
+            'rad': rad.tobytes(), 'str': strokes.tobytes()}
+
+
+def load_compiled(path, digest):
+    try:
+        with open(path, 'rb') as f:
+            payload = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get('format') != COMPILED_FORMAT or payload.get('digest') != digest:
+        return None
+    return payload['data']
+
+
+def save_compiled(path, digest, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        marshal.dump({'format': COMPILED_FORMAT, 'digest': digest, 'data': data}, f)
+    os.replace(tmp_path, path)
+
+
+def load_glyphwiki_sources(cache_path=None, data_dir=DATA_DIR):
+    # Colonnes compilées (voir compile_sources) + 'digest' ; cache_path=None : pas de cache
+    digest = data_digest(data_dir)
+    data = load_compiled(cache_path, digest) if cache_path else None
+    if data is None:
+        data = compile_sources(data_dir)
+        if cache_path:
+            save_compiled(cache_path, digest, data)
+    data['digest'] = digest
+    return data
+
+
+def iter_entries(data):
+    # (indice du dictionnaire, numéro, radical, traits) pour chaque glyphe manuel
+    rad, strokes = array.array('H'), array.array('h')
+    rad.frombytes(data['rad'])
+    strokes.frombytes(data['str'])
+    return zip(data['source'], data['ident'], rad, strokes)
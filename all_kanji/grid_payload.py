@@ -0,0 +1,168 @@
+import gzip
+import json
+import os
+import shutil
+from itertools import islice
+
+from .char_table import KIND_GLYPHWIKI, KIND_UNICODE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Données des rendus "dynamic" et "virtual" en colonnes plutôt qu'en lignes
+# [caractère, code affiché, radical, police] :
+#   rad    : radicaux en plages [radical, nombre, radical, nombre...] (déjà triés)
+#   kind   : types de ligne en plages [type, nombre, ...]
+#   cp     : écarts entre code points successifs (lignes Unicode et Ext J)
+#   src    : dictionnaires des glyphes GlyphWiki en plages [source, nombre, ...]
+#   ident  : numéros GlyphWiki séparés par des virgules
+#   font   : écarts entre indices successifs dans FONTS (lignes avec police)
+#   pua    : code point privé du glyphe dans son lot (font_bundler.py) moins
+#            pua_base, plus 1 ; 0 sans lot (lignes avec police, vide sans lots)
+#   prefix : préfixe affiché de chaque dictionnaire
+# Le décodeur (PAYLOAD_DECODER_JS) reconstruit [caractère, code, radical, indice de police].
+
+PAYLOAD_FORMAT = 2
+CHUNK_ITEMS = 4096    # Valeurs par bloc écrit : la mémoire ne dépend pas du nombre de caractères
+
+
+def run_lengths(values):
+    # Plages aplaties : valeur, nombre, valeur, nombre...
+    current, count = None, 0
+    for value in values:
+        if count and value == current:
+            count += 1
+            continue
+        if count:
+            yield current
+            yield count
+        current, count = value, 1
+    if count:
+        yield current
+        yield count
+
+
+def deltas(values):
+    previous = 0
+    for value in values:
+        yield value - previous
+        previous = value
+
+
+def chunks_of(values, size=CHUNK_ITEMS):
+    values = iter(values)
+    while True:
+        chunk = list(islice(values, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_json_array(values):
+    # Tableau JSON d'entiers produit bloc par bloc (équivalent d'iterencode)
+    yield '['
+    separator = ''
+    for chunk in chunks_of(values):
+        yield separator + ','.join(map(str, chunk))
+        separator = ','
+    yield ']'
+
+
+def iter_payload_json(table, order, font_index):
+    # JSON compact des colonnes, produit par morceaux sans matérialiser le document
+    kinds = table.kind
+    rows = lambda keep: (i for i in order if keep(kinds[i]))
+    glyphwiki = lambda kind: kind == KIND_GLYPHWIKI
+    columns = (
+        ('rad', run_lengths(table.rad[i] for i in order)),
+        ('kind', run_lengths(kinds[i] for i in order)),
+        ('cp', deltas(table.cp[i] for i in rows(lambda kind: kind != KIND_GLYPHWIKI))),
+        ('src', run_lengths(table.source[i] for i in rows(glyphwiki))),
+    )
+    yield f'{{"format":{PAYLOAD_FORMAT},"n":{len(order)}'
+    for key, values in columns:
+        yield f',"{key}":'
+        yield from iter_json_array(values)
+    # Numéros GlyphWiki : chiffres uniquement (voir CharTable.append_glyphwiki)
+    yield ',"ident":"'
+    separator = ''
+    for chunk in chunks_of(table.ident[i] for i in rows(glyphwiki)):
+        yield separator + ','.join(chunk)
+        separator = ','
+    yield '","font":'
+    yield from iter_json_array(deltas(font_index[table.font_family(i)]
+                                      for i in rows(lambda kind: kind != KIND_UNICODE)))
+    puas = [table.pua(i) for i in rows(lambda kind: kind != KIND_UNICODE)] if table.bundles else []
+    base = min((cp for cp in puas if cp), default=1)
+    yield f',"pua_base":{base},"pua":'
+    yield from iter_json_array(cp - base + 1 if cp else 0 for cp in puas)
+    yield ',"prefix":' + json.dumps(table.prefixes, ensure_ascii=False, separators=(',', ':')) + '}'
+
+
+def payload_size(table, order, font_index):
+    return sum(len(chunk.encode('utf-8')) for chunk in iter_payload_json(table, order, font_index))
+
+
+def row_json_size(table, order):
+    # Taille de l'ancien littéral js_data (une liste par caractère), pour comparaison
+    size = 2 + 2 * max(len(order) - 1, 0)    # "[", "]" et les séparateurs ", "
+    for i in order:
+        row = [table.char(i), table.display_code(i), table.rad[i], False, table.font_family(i)]
+        size += len(json.dumps(row, ensure_ascii=False).encode('utf-8'))
+    return size
+
+
+PAYLOAD_DECODER_JS = """
+        function decodePayload(p) {
+            // Renvoie [[caractère, code affiché, radical, indice de police ou -1], ...]
+            const rows = new Array(p.n);
+            const idents = p.ident ? p.ident.split(',') : [];
+            let r = 0, rLeft = 0, rad = 0;
+            let k = 0, kLeft = 0, kind = 0;
+            let s = 0, sLeft = 0, src = 0;
+            let c = 0, cp = 0, g = 0, f = 0, font = 0;
+            for (let i = 0; i < p.n; i++) {
+                if (rLeft === 0) { rad = p.rad[r]; rLeft = p.rad[r + 1]; r += 2; }
+                if (kLeft === 0) { kind = p.kind[k]; kLeft = p.kind[k + 1]; k += 2; }
+                rLeft--; kLeft--;
+                let fontIdx = -1, glyph = '\\u3013';
+                if (kind !== 0) {
+                    const pua = p.pua.length ? p.pua[f] : 0;
+                    if (pua) glyph = String.fromCodePoint(p.pua_base + pua - 1);
+                    font += p.font[f++]; fontIdx = font;
+                }
+                if (kind === 2) {
+                    if (sLeft === 0) { src = p.src[s]; sLeft = p.src[s + 1]; s += 2; }
+                    sLeft--;
+                    const ident = idents[g++];
+                    rows[i] = [glyph, `${p.prefix[src]}+${ident}`, rad, fontIdx];
+                } else {
+                    cp += p.cp[c++];
+                    const code = 'U+' + cp.toString(16).toUpperCase();
+                    rows[i] = [kind === 0 ? String.fromCodePoint(cp) : glyph, code, rad, fontIdx];
+                }
+            }
+            return rows;
+        }
+"""
+
+
+def write_precompressed(path):
+    # Copies .gz (mtime nul : octets reproductibles) et .br (si brotli est installé)
+    # à côté de la page, pour un serveur qui sert les fichiers pré-compressés.
+    # Compression en flux, bloc par bloc.
+    written = [(path, os.path.getsize(path))]
+    with open(path, 'rb') as src, open(f"{path}.gz", 'wb') as raw:
+        with gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=raw, mtime=0) as out:
+            shutil.copyfileobj(src, out, 1 << 16)
+        written.append((f"{path}.gz", raw.tell()))
+    if brotli is not None:
+        compressor = brotli.Compressor(quality=11)
+        with open(path, 'rb') as src, open(f"{path}.br", 'wb') as out:
+            for block in iter(lambda: src.read(1 << 16), b''):
+                out.write(compressor.process(block))
+            out.write(compressor.finish())
+            written.append((f"{path}.br", out.tell()))
+    return written
@@ -0,0 +1,717 @@
+import html
+import json
+import os
+
+from .char_table import KIND_UNICODE
+from .cjk_blocks import block_font_faces, block_font_stack
+from .grid_payload import PAYLOAD_DECODER_JS, iter_payload_json
+from .grid_search import SEARCH_CSS, search_box, search_script
+from .grid_toc import REVEAL_JS, TOC_CSS, TOC_JS, build_toc, bucket_anchor, radical_anchor, render_toc, toc_json
+
+# Rendu HTML de la grille A4.
+#  - "static"  : regroupement par radical et pagination faits en Python, le
+#                navigateur reçoit des feuilles déjà construites (aucun JS au chargement)
+#  - "dynamic" : ancien rendu, les feuilles sont construites en JS à partir de DATA
+#  - "virtual" : pages calculées en Python, seules les feuilles visibles sont
+#                montées (nœuds recyclés au défilement), document complet à l'impression
+
+COLS = 10
+ROWS = 7
+ITEMS_PER_PAGE = COLS * ROWS
+
+RENDER_MODES = ('static', 'dynamic', 'virtual')
+
+# Pas vertical d'une feuille à l'écran (hauteur A4 + marge .sheet), en px CSS
+# (1mm = 96/25.4 px) : la visionneuse virtuelle place chaque page à une
+# position exacte sans mesurer le DOM.
+SHEET_HEIGHT_MM = 297
+SHEET_GAP_PX = 30
+SHEET_PITCH_PX = SHEET_HEIGHT_MM * 96 / 25.4 + SHEET_GAP_PX
+VIRTUAL_BUFFER = 2    # Feuilles montées au-dessus et au-dessous de la zone visible
+
+# Visionneuse virtuelle : seules les feuilles visibles (+ tampon) sont montées,
+# positionnées en absolu dans un conteneur à la hauteur du document complet
+VIRTUAL_CSS = """
+        #sheets-container.virtual { position: relative; width: var(--a4-width); }
+        #sheets-container.virtual .sheet { position: absolute; top: 0; left: 0; margin: 0; }
+        #print-container { display: none; }
+        @media print {
+            #sheets-container.virtual { display: none; }
+            #print-container { display: block; }
+        }
+"""
+
+# Rendu statique : les feuilles sont dans le HTML, showPage() fait défiler jusqu'à elles
+STATIC_REVEAL_JS = """
+        const sheetsContainer = document.getElementById('sheets-container');
+        function showPage(page) {
+            const sheet = sheetsContainer.children[page];
+            if (sheet) sheet.scrollIntoView();
+            return sheet;
+        }
+"""
+
+# Encodeur JSON compact pour iterencode() (écriture par morceaux)
+JSON_CHUNKS = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Chargée sans bloquer le rendu (media="print" puis "all" une fois reçue)
+WEB_FONT_CSS = "https://fonts.googleapis.com/css2?family=Noto+Serif+JP:wght@400;700&display=swap"
+
+# Les feuilles hors écran ne sont ni mises en page ni peintes avant d'être atteintes
+STATIC_CSS = """
+        @media screen {
+            .sheet { content-visibility: auto; contain-intrinsic-size: 210mm 297mm; }
+        }
+"""
+
+
+def page_head(title, font_stack, extra_css=""):
+    block_fonts = "".join(f"        {rule}\n" for rule in block_font_faces())
+    return f"""<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="stylesheet" href="{WEB_FONT_CSS}" media="print" onload="this.media='all'">
+    <noscript><link rel="stylesheet" href="{WEB_FONT_CSS}"></noscript>
+    <style>
+        /* === UNE POLICE PAR BLOC CJC (unicode-range) === */
+{block_fonts}
+        :root {{
+            --a4-width: 210mm;
+            --a4-height: 297mm;
+
+            /* CONFIG 7x9 = 63 */
+            --cols: 7;
+            --rows: 9;
+
+            /* MARGES ASYMÉTRIQUES SEAMLESS */
+            --cell-width: 30mm;  /* 210 / 11 */
+            --cell-height: 29.7mm; /* 297 / 8 */
+            --margin-left: 5mm;
+            --margin-top: 5mm;
+
+            --font-size-char: 58px;
+            --font-size-code: 15px;
+        }}
+
+        @page {{
+            size: A4;
+            margin: 0;
+        }}
+
+        body {{
+            background-color: #e5e5e5;
+            margin: 0;
+            padding: 20px;
+            font-family: {block_font_stack(font_stack)};
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+        }}
+
+        /* UI */
+        .controls {{
+            position: fixed; bottom: 20px; right: 20px;
+            background: white; padding: 10px 20px;
+            border-radius: 30px; box-shadow: 0 4px 10px rgba(0,0,0,0.2);
+            display: flex; gap: 10px; align-items: center; z-index: 9999;
+            font-family: sans-serif; border: 1px solid #ccc;
+        }}
+        .btn {{
+            padding: 8px 16px; cursor: pointer; background: #2563eb; color: white;
+            border: none; border-radius: 20px; font-weight: bold;
+        }}
+        .btn-print {{ background: #16a34a; }}
+
+        .font-warning {{
+            background: #fff; border-left: 5px solid #2563eb; color: #333;
+            padding: 15px; margin-bottom: 20px; border-radius: 4px;
+            max-width: 210mm; font-family: sans-serif; font-size: 13px;
+        }}
+
+        /* FEUILLE */
+        .sheet {{
+            width: var(--a4-width);
+            height: var(--a4-height);
+            background: white;
+            position: relative;
+            box-sizing: border-box;
+
+            padding-top: var(--margin-top);
+            padding-left: var(--margin-left);
+            padding-right: 0;
+            padding-bottom: 0;
+
+            margin-bottom: 30px;
+            overflow: hidden;
+
+            break-after: page;
+            page-break-after: always;
+        }}
+
+        .grid-container {{
+            display: flex;
+            flex-wrap: wrap;
+            align-content: flex-start;
+            width: calc(var(--cell-width) * var(--cols));
+            height: calc(var(--cell-height) * var(--rows));
+        }}
+
+        .cell {{
+            width: var(--cell-width);
+            height: var(--cell-height);
+            box-sizing: border-box;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            position: relative;
+        }}
+
+        .char {{
+            font-size: var(--font-size-char);
+            line-height: 1;
+            margin-bottom: 4px;
+            z-index: 2;
+        }}
+
+        .code {{
+            font-family: "Courier New", monospace;
+            font-size: var(--font-size-code);
+            color: #aaa;
+            text-transform: uppercase;
+        }}
+
+        .radical-start {{
+            border: 2px solid #000 !important;
+            border-radius: 0;
+            box-sizing: border-box;
+        }}
+
+        .radical-label {{
+            position: absolute; top: 0; left: 0;
+            font-size: 8px; font-weight: bold; color: white; background: black;
+            padding: 1px 3px; font-family: sans-serif; z-index: 5;
+        }}
+
+        @media print {{
+            body {{ background: none; padding: 0; margin: 0; display: block; }}
+            .controls, .font-warning {{ display: none !important; }}
+            .sheet {{
+                margin: 0; box-shadow: none;
+                page-break-after: always;
+            }}
+        }}
+{extra_css}    </style>
+</head>
+<body>
+"""
+
+
+def page_intro():
+    return """
+    <div class="font-warning">
+        <strong>Mode Dictionnaires Multiples</strong><br>
+        Pour que les caractères <b>K+, H+, Z+...</b> et les caractères Unicode personnalisés s'affichent, les fichiers <code>.ttf</code> correspondants<br>
+        (ex: <code>kokuji-no-jiten-1034.ttf</code> ou <code>u323c7.ttf</code>) doivent être placés dans le même dossier que ce fichier HTML.<br>
+        Les lots construits par <code>font_bundler.py</code> sont lus dans le dossier <code>font_bundles</code> du dossier de génération : gardez-le avec la grille.
+    </div>
+
+"""
+
+
+def page_controls(status, print_call="printWithFonts()", search=False):
+    # printWithFonts() est défini par font_loader_script() ; champ de recherche : voir grid_search.py
+    search_html = f"\n        {search_box()}" if search else ""
+    return f"""    <div class="controls">{search_html}
+        <div id="status">{status}</div>
+        <button class="btn btn-print" onclick="{print_call}">🖨️ Imprimer</button>
+    </div>
+
+"""
+
+
+def register_fonts(fonts, entries, index):
+    # Complète le manifeste (entries, index) avec les polices pas encore vues
+    # (fonts : couples (famille, fichier), famille None pour les caractères Unicode)
+    for font_fam, font_file in fonts:
+        if font_fam and font_fam not in index:
+            index[font_fam] = len(entries)
+            entries.append([font_fam, font_file])
+
+
+def font_manifest(fonts):
+    # Manifeste compact des polices GlyphWiki / Unicode personnalisées :
+    # [[famille, fichier], ...] dans l'ordre d'apparition, et indice de chaque famille.
+    entries = []
+    index = {}
+    register_fonts(fonts, entries, index)
+    return entries, index
+
+
+# Les polices ne sont plus déclarées en @font-face (des milliers de règles) :
+# une feuille qui approche de l'écran enregistre les siennes via l'API FontFace,
+# une feuille très éloignée les libère. Tout est chargé avant l'impression.
+FONT_LOADER_JS = """
+        const FONT_LOAD_MARGIN = '150% 0px';
+        const FONT_UNLOAD_MARGIN = '600% 0px';
+
+        const fontFaces = new Array(FONTS.length).fill(null);
+        const fontRefs = new Uint32Array(FONTS.length);
+        const activeSheets = new WeakSet();
+        let printing = false;
+
+        // Lot de polices introuvable (font_bundler.py) : ses code points privés
+        // s'afficheraient en carrés vides, on remet le placeholder à la place
+        const PUA_START = 0xF0000;
+        const failedFonts = new Set();
+
+        function showPlaceholders(sheet) {
+            for (const el of sheet.querySelectorAll('.char[style]')) {
+                if (el.textContent.codePointAt(0) >= PUA_START
+                        && failedFonts.has(el.style.fontFamily.replace(/["']/g, ''))) el.textContent = '〓';
+            }
+        }
+
+        function fontFailed(idx) {
+            failedFonts.add(FONTS[idx][0]);
+            for (const sheet of fontSheets()) {
+                if (sheet.dataset.fonts.split(',').includes(String(idx))) showPlaceholders(sheet);
+            }
+        }
+
+        function acquireFonts(sheet) {
+            if (activeSheets.has(sheet)) return;
+            activeSheets.add(sheet);
+            if (failedFonts.size) showPlaceholders(sheet);
+            for (const idx of sheet.dataset.fonts.split(',')) {
+                // Police gardée pendant l'impression : déjà enregistrée
+                if (fontRefs[idx]++ === 0 && !fontFaces[idx]) {
+                    const face = new FontFace(FONTS[idx][0], `url("${encodeURI(FONTS[idx][1])}")`);
+                    fontFaces[idx] = face;
+                    document.fonts.add(face);
+                    face.load().catch(() => fontFailed(idx));
+                }
+            }
+        }
+
+        function dropFont(idx) {
+            document.fonts.delete(fontFaces[idx]);
+            fontFaces[idx] = null;
+        }
+
+        function releaseFonts(sheet) {
+            if (!activeSheets.has(sheet)) return;
+            activeSheets.delete(sheet);
+            for (const idx of sheet.dataset.fonts.split(',')) {
+                // Pendant l'impression, les polices restent enregistrées (libérées après)
+                if (--fontRefs[idx] === 0 && !printing) dropFont(idx);
+            }
+        }
+
+        const lazyFonts = 'IntersectionObserver' in window;
+        const nearObserver = lazyFonts && new IntersectionObserver(entries => {
+            for (const entry of entries) if (entry.isIntersecting) acquireFonts(entry.target);
+        }, { rootMargin: FONT_LOAD_MARGIN });
+        const farObserver = lazyFonts && new IntersectionObserver(entries => {
+            for (const entry of entries) if (!entry.isIntersecting) releaseFonts(entry.target);
+        }, { rootMargin: FONT_UNLOAD_MARGIN });
+
+        function observeSheet(sheet) {
+            if (!sheet.dataset.fonts) return;
+            if (!lazyFonts) return acquireFonts(sheet);
+            nearObserver.observe(sheet);
+            farObserver.observe(sheet);
+        }
+
+        function fontSheets() {
+            return document.querySelectorAll('.sheet[data-fonts]');
+        }
+
+        // Préparations avant impression (ex. : la visionneuse virtuelle déplie toutes les feuilles)
+        const printPreparers = [];
+
+        function preparePrint() {
+            printing = true;
+            printPreparers.forEach(prepare => prepare());
+            fontSheets().forEach(acquireFonts);
+        }
+
+        window.addEventListener('beforeprint', preparePrint);
+        window.addEventListener('afterprint', () => {
+            printing = false;
+            fontFaces.forEach((face, idx) => { if (face && fontRefs[idx] === 0) dropFont(idx); });
+            // Ré-observer pour libérer les polices des feuilles éloignées
+            if (lazyFonts) fontSheets().forEach(sheet => { farObserver.unobserve(sheet); farObserver.observe(sheet); });
+        });
+
+        function printWithFonts() {
+            preparePrint();
+            document.fonts.ready.then(() => window.print());
+        }
+
+        fontSheets().forEach(observeSheet);
+"""
+
+
+def iter_font_loader(entries):
+    yield '    <script id="font-loader">\n        const FONTS = '
+    yield from JSON_CHUNKS.iterencode(entries)
+    yield f""";
+{FONT_LOADER_JS}    </script>
+"""
+
+
+def font_loader_script(entries):
+    return "".join(iter_font_loader(entries))
+
+
+def table_fonts(table, order):
+    kinds = table.kind
+    return ((table.font_family(i), table.font_file(i)) for i in order if kinds[i] != KIND_UNICODE)
+
+
+def iter_pages(table, order):
+    # Même découpage que renderAll() : un groupe par radical, puis des pages
+    # de ITEMS_PER_PAGE. Produit les pages (listes d'indices de lignes) une à une.
+    rads = table.rad
+    group_start = 0
+    for pos in range(1, len(order) + 1):
+        if pos == len(order) or rads[order[pos]] != rads[order[group_start]]:
+            for page_start in range(group_start, pos, ITEMS_PER_PAGE):
+                yield order[page_start:min(page_start + ITEMS_PER_PAGE, pos)]
+            group_start = pos
+
+
+def paginate(table, order):
+    return list(iter_pages(table, order))
+
+
+def cell_data(table, i):
+    # Tout ce qu'il faut pour dessiner une case, sans référence à la table
+    # (transmissible tel quel à un processus de rendu)
+    return (table.rad[i], table.char(i), table.display_code(i), table.font_family(i), table.font_file(i),
+            table.strokes[i])
+
+
+def render_cell(cell, is_new_rad, is_new_bucket):
+    # Ancres de la table des matières : #r140 sur l'étiquette du radical,
+    # #r140s5 sur la première case de chaque groupe de traits
+    rad, char, display_code, font_fam, _, strokes = cell
+    classes = "cell radical-start" if is_new_rad else "cell"
+    anchor = f' id="{bucket_anchor(rad, strokes)}"' if is_new_bucket else ""
+    label = f'<div class="radical-label" id="{radical_anchor(rad)}">R{rad}</div>' if is_new_rad else ""
+    style = f' style="font-family: \'{font_fam}\';"' if font_fam else ""
+    return (f'<div class="{classes}"{anchor}>{label}<div class="char"{style}>{html.escape(char)}</div>'
+            f'<div class="code">{html.escape(display_code)}</div></div>')
+
+
+def render_sheet(cells, previous, font_index):
+    # previous : (radical, traits) de la case précédente (None au début)
+    # font_index : indice de chaque famille dans le manifeste des polices
+    parts = []
+    fonts = {}
+    for cell in cells:
+        key = (cell[0], cell[5])
+        parts.append(render_cell(cell, previous is None or key[0] != previous[0], key != previous))
+        previous = key
+        if cell[3]:
+            fonts[font_index[cell[3]]] = None
+    fonts_attr = f' data-fonts="{",".join(map(str, fonts))}"' if fonts else ""
+    return (f'<div class="sheet"{fonts_attr}><div class="grid-container">{"".join(parts)}</div></div>\n',
+            previous)
+
+
+def iter_static(table, order, font_stack, toc=None, search_dir=None):
+    # Les feuilles sont produites une à une ; le manifeste des polices se
+    # remplit au fil des feuilles et n'est écrit qu'à la fin (script en bas de page)
+    toc = toc or build_toc(table, order, ITEMS_PER_PAGE)
+    fonts, font_index = [], {}
+    yield page_head("CJK Grid - 70 Chars Seamless", font_stack, STATIC_CSS + TOC_CSS + SEARCH_CSS)
+    yield page_intro()
+    yield render_toc(toc)
+    yield '    <div id="sheets-container">\n'
+    page_count = 0
+    previous = None
+    for page in iter_pages(table, order):
+        cells = [cell_data(table, i) for i in page]
+        register_fonts(((cell[3], cell[4]) for cell in cells), fonts, font_index)
+        sheet, previous = render_sheet(cells, previous, font_index)
+        yield sheet
+        page_count += 1
+    yield '    </div>\n\n'
+    yield page_controls(f"{page_count} Pages", search=bool(search_dir))
+    yield from iter_font_loader(fonts)
+    if search_dir:
+        yield search_script(search_dir, table.sources, table.prefixes, STATIC_REVEAL_JS + REVEAL_JS)
+    yield "</body>\n</html>\n"
+
+
+def iter_dynamic(table, order, font_stack, toc=None, search_dir=None):
+    toc = toc or build_toc(table, order, ITEMS_PER_PAGE)
+    fonts, font_index = font_manifest(table_fonts(table, order))
+
+    yield page_head("CJK Grid - 70 Chars Seamless", font_stack, TOC_CSS + SEARCH_CSS)
+    yield page_intro()
+    yield render_toc(toc)
+    yield '    <div id="sheets-container"></div>\n\n'
+    yield page_controls("Génération...", search=bool(search_dir))
+    yield from iter_font_loader(fonts)
+    yield f"""    <script>{PAYLOAD_DECODER_JS}
+        const DATA = decodePayload("""
+    yield from iter_payload_json(table, order, font_index)
+    yield f""")
+            .map(([char, code, rad, fontIdx]) => [char, code, rad, false, fontIdx >= 0 ? FONTS[fontIdx][0] : null]);
+        const FONT_INDEX = new Map(FONTS.map((font, idx) => [font[0], idx]));
+
+        const COLS = {COLS};
+        const ROWS = {ROWS};
+        const ITEMS_PER_PAGE = COLS * ROWS;
+
+        const container = document.getElementById('sheets-container');
+        const statusEl = document.getElementById('status');
+
+        const TOC = {toc_json(toc)};
+        function showPage(page) {{
+            const sheet = container.children[page];
+            if (sheet) sheet.scrollIntoView();
+            return sheet;
+        }}
+{REVEAL_JS}{TOC_JS}
+        function renderAll() {{
+            container.innerHTML = '';
+
+            let currentRadical = -1;
+            let sheetCount = 0;
+
+            function createSheet(items) {{
+                sheetCount++;
+                const sheet = document.createElement('div');
+                sheet.className = 'sheet';
+
+                const grid = document.createElement('div');
+                grid.className = 'grid-container';
+                const sheetFonts = new Set();
+
+                items.forEach(item => {{
+                    const char = item[0];
+                    const displayCode = item[1];
+                    const rad = item[2];
+                    const isNewRad = item[3];
+                    const fontFam = item[4];
+
+                    const cell = document.createElement('div');
+                    cell.className = 'cell';
+
+                    if (isNewRad) {{
+                        cell.classList.add('radical-start');
+                        cell.innerHTML += `<div class="radical-label">R${{rad}}</div>`;
+                    }}
+
+                    let styleStr = "";
+                    if (fontFam) {{
+                        styleStr = `style="font-family: '${{fontFam}}';"`;
+                        sheetFonts.add(FONT_INDEX.get(fontFam));
+                    }}
+
+                    cell.innerHTML += `
+                        <div class="char" ${{styleStr}}>${{char}}</div>
+                        <div class="code">${{displayCode}}</div>
+                    `;
+                    grid.appendChild(cell);
+                }});
+
+                sheet.appendChild(grid);
+                if (sheetFonts.size) sheet.dataset.fonts = [...sheetFonts].join(',');
+                container.appendChild(sheet);
+                observeSheet(sheet);
+            }}
+
+            let groupedByRad = [];
+            let currentGroup = [];
+
+            DATA.forEach((item) => {{
+                const rad = item[2];
+                if (rad !== currentRadical) {{
+                    if (currentGroup.length > 0) groupedByRad.push(currentGroup);
+                    currentGroup = [];
+                    currentRadical = rad;
+                    item[3] = true;
+                }}
+                currentGroup.push(item);
+            }});
+            if (currentGroup.length > 0) groupedByRad.push(currentGroup);
+
+            groupedByRad.forEach(group => {{
+                for (let i = 0; i < group.length; i += ITEMS_PER_PAGE) {{
+                    const pageItems = group.slice(i, i + ITEMS_PER_PAGE);
+                    createSheet(pageItems);
+                }}
+            }});
+
+            statusEl.textContent = `${{sheetCount}} Pages`;
+            if (location.hash) jumpTo(location.hash);
+        }}
+
+        setTimeout(renderAll, 100);
+    </script>
+"""
+    if search_dir:
+        yield search_script(search_dir, table.sources, table.prefixes)
+    yield "</body>\n</html>\n"
+
+
+def iter_virtual(table, order, font_stack, toc=None, search_dir=None):
+    toc = toc or build_toc(table, order, ITEMS_PER_PAGE)
+    fonts, font_index = font_manifest(table_fonts(table, order))
+    page_starts = [0]
+    for page in iter_pages(table, order):
+        page_starts.append(page_starts[-1] + len(page))
+    page_count = len(page_starts) - 1
+    height = page_count * SHEET_PITCH_PX
+
+    yield page_head("CJK Grid - 70 Chars Seamless", font_stack, STATIC_CSS + VIRTUAL_CSS + TOC_CSS + SEARCH_CSS)
+    yield page_intro()
+    yield render_toc(toc)
+    yield f'    <div id="sheets-container" class="virtual" style="height: {height:.2f}px;"></div>\n'
+    yield '    <div id="print-container"></div>\n\n'
+    yield page_controls(f"{page_count} Pages", search=bool(search_dir))
+    yield from iter_font_loader(fonts)
+    yield f"""    <script>{PAYLOAD_DECODER_JS}
+        const DATA = decodePayload("""
+    yield from iter_payload_json(table, order, font_index)
+    yield f""");
+        const PAGE_STARTS = {json.dumps(page_starts, separators=(',', ':'))};
+        const PAGE_COUNT = {page_count};
+        const SHEET_PITCH = {SHEET_PITCH_PX!r};
+        const BUFFER = {VIRTUAL_BUFFER};
+
+        const container = document.getElementById('sheets-container');
+        const printContainer = document.getElementById('print-container');
+        const mounted = new Map();   // page -> feuille montée
+        const pool = [];             // feuilles libres, réutilisées au défilement
+
+        function pageHtml(page) {{
+            const cells = [];
+            const fonts = new Set();
+            for (let i = PAGE_STARTS[page]; i < PAGE_STARTS[page + 1]; i++) {{
+                const [char, displayCode, rad, fontIdx] = DATA[i];
+                const isNewRad = i === 0 || DATA[i - 1][2] !== rad;
+                const label = isNewRad ? `<div class="radical-label">R${{rad}}</div>` : '';
+                let style = '';
+                if (fontIdx >= 0) {{
+                    style = ` style="font-family: '${{FONTS[fontIdx][0]}}';"`;
+                    fonts.add(fontIdx);
+                }}
+                cells.push(`<div class="cell${{isNewRad ? ' radical-start' : ''}}">${{label}}`
+                           + `<div class="char"${{style}}>${{char}}</div><div class="code">${{displayCode}}</div></div>`);
+            }}
+            return [`<div class="grid-container">${{cells.join('')}}</div>`, [...fonts].join(',')];
+        }}
+
+        function mountSheet(page) {{
+            let sheet = pool.pop();
+            if (!sheet) {{
+                sheet = document.createElement('div');
+                sheet.className = 'sheet';
+                container.appendChild(sheet);
+            }}
+            const [content, fonts] = pageHtml(page);
+            sheet.innerHTML = content;
+            sheet.style.top = `${{page * SHEET_PITCH}}px`;
+            sheet.hidden = false;
+            if (fonts) {{
+                sheet.dataset.fonts = fonts;
+                acquireFonts(sheet);
+            }} else {{
+                delete sheet.dataset.fonts;
+            }}
+            mounted.set(page, sheet);
+        }}
+
+        function unmountSheet(page) {{
+            const sheet = mounted.get(page);
+            mounted.delete(page);
+            if (sheet.dataset.fonts) releaseFonts(sheet);
+            sheet.hidden = true;
+            pool.push(sheet);
+        }}
+
+        let scheduled = false;
+        function update() {{
+            scheduled = false;
+            const top = container.getBoundingClientRect().top + window.scrollY;
+            const first = Math.max(0, Math.floor((window.scrollY - top) / SHEET_PITCH) - BUFFER);
+            const last = Math.min(PAGE_COUNT - 1,
+                                  Math.floor((window.scrollY + window.innerHeight - top) / SHEET_PITCH) + BUFFER);
+            for (const page of [...mounted.keys()]) {{
+                if (page < first || page > last) unmountSheet(page);
+            }}
+            for (let page = first; page <= last; page++) {{
+                if (!mounted.has(page)) mountSheet(page);
+            }}
+        }}
+
+        function scheduleUpdate() {{
+            if (!scheduled) {{
+                scheduled = true;
+                requestAnimationFrame(update);
+            }}
+        }}
+
+        // Impression : toutes les feuilles, dans un conteneur visible uniquement à l'impression
+        printPreparers.push(() => {{
+            if (printContainer.childElementCount) return;
+            const sheets = [];
+            for (let page = 0; page < PAGE_COUNT; page++) {{
+                const [content, fonts] = pageHtml(page);
+                sheets.push(`<div class="sheet"${{fonts ? ` data-fonts="${{fonts}}"` : ''}}>${{content}}</div>`);
+            }}
+            printContainer.innerHTML = sheets.join('');
+        }});
+        window.addEventListener('afterprint', () => {{
+            printContainer.querySelectorAll('.sheet[data-fonts]').forEach(releaseFonts);
+            printContainer.textContent = '';
+        }});
+
+        // Saut direct à une page : défilement à sa position exacte, seule cette zone est montée
+        const TOC = {toc_json(toc)};
+        function showPage(page) {{
+            const top = container.getBoundingClientRect().top + window.scrollY;
+            window.scrollTo(0, top + page * SHEET_PITCH);
+            update();
+            return mounted.get(page);
+        }}
+{REVEAL_JS}{TOC_JS}
+        window.addEventListener('scroll', scheduleUpdate, {{ passive: true }});
+        window.addEventListener('resize', scheduleUpdate);
+        update();
+        if (location.hash) jumpTo(location.hash);
+    </script>
+"""
+    if search_dir:
+        yield search_script(search_dir, table.sources, table.prefixes)
+    yield "</body>\n</html>\n"
+
+
+# Rendus complets en mémoire (benchmarks) ; kanji-all.py écrit en flux avec write_html()
+def render_static(table, order, font_stack, toc=None, search_dir=None):
+    return "".join(iter_static(table, order, font_stack, toc, search_dir))
+
+
+def render_dynamic(table, order, font_stack, toc=None, search_dir=None):
+    return "".join(iter_dynamic(table, order, font_stack, toc, search_dir))
+
+
+def render_virtual(table, order, font_stack, toc=None, search_dir=None):
+    return "".join(iter_virtual(table, order, font_stack, toc, search_dir))
+
+
+def write_html(path, chunks):
+    # Écriture morceau par morceau dans un fichier temporaire, puis renommage
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, path)
@@ -0,0 +1,181 @@
+import json
+import os
+import re
+
+from .char_table import KIND_GLYPHWIKI
+
+# Index de recherche côté client, découpé par préfixe de clé.
+# Clés normalisées : "U+2A6D6" (caractère ou code point), "K+1034" / "IRG+123"
+# (code affiché, numéro sans zéros de tête). Chaque fichier regroupe les clés
+# qui partagent la même clé de shard (clé sans ses SHARD_TAIL derniers
+# caractères) : au plus 256 entrées, quelques Ko. Fichiers JSONP (.js) chargés
+# par <script> à la demande, pour fonctionner aussi en file://.
+
+SEARCH_FORMAT = 1
+SHARD_TAIL = 2
+
+
+def search_key(table, i):
+    if table.kind[i] == KIND_GLYPHWIKI:
+        return f"{table.prefixes[table.source[i]]}+{int(table.ident[i])}"
+    return f"U+{table.cp[i]:X}"
+
+
+def shard_file(shard_key):
+    return re.sub(r'[^0-9A-Za-z]', '_', shard_key) + ".js"
+
+
+def iter_positions(table, order, items_per_page):
+    # (ligne, page, case) dans le même découpage que grid_render.paginate()
+    rads = table.rad
+    page = -1
+    cell = items_per_page
+    previous_rad = None
+    for i in order:
+        rad = rads[i]
+        if rad != previous_rad or cell == items_per_page:
+            page += 1
+            cell = 0
+            previous_rad = rad
+        yield i, page, cell
+        cell += 1
+
+
+def build_search_shards(table, order, items_per_page):
+    # {clé de shard: {fin de clé: [page, case, page, case...]}}
+    shards = {}
+    for i, page, cell in iter_positions(table, order, items_per_page):
+        key = search_key(table, i)
+        entries = shards.setdefault(key[:-SHARD_TAIL], {})
+        entries.setdefault(key[-SHARD_TAIL:], []).extend((page, cell))
+    return shards
+
+
+def render_search_shard(shard_key, entries):
+    payload = json.dumps({tail: entries[tail] for tail in sorted(entries)}, separators=(',', ':'))
+    return f"searchShard({json.dumps(shard_key)},{payload});\n"
+
+
+def write_search_index(out_dir, table, order, items_per_page):
+    # Réécrit seulement les fichiers modifiés et supprime ceux qui n'existent plus
+    os.makedirs(out_dir, exist_ok=True)
+    shards = build_search_shards(table, order, items_per_page)
+    wanted = set()
+    written = largest = 0
+    for shard_key, entries in shards.items():
+        name = shard_file(shard_key)
+        wanted.add(name)
+        data = render_search_shard(shard_key, entries).encode('utf-8')
+        largest = max(largest, len(data))
+        path = os.path.join(out_dir, name)
+        try:
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    continue
+        except OSError:
+            pass
+        with open(path, 'wb') as f:
+            f.write(data)
+        written += 1
+
+    removed = 0
+    for name in os.listdir(out_dir):
+        if name.endswith('.js') and name not in wanted:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+    return {'entries': len(order), 'shards': len(shards), 'written': written,
+            'removed': removed, 'largest': largest}
+
+
+SEARCH_CSS = """
+        #search-box { width: 150px; padding: 6px 10px; border: 1px solid #ccc; border-radius: 20px; }
+        #search-status { font-size: 12px; color: #555; }
+"""
+
+
+def search_box():
+    return ('<input id="search-box" type="search" placeholder="U+2A6D6, K+1034, 𪛖..." '
+            'title="Caractère, code point, code affiché ou fichier de police (source-numéro)">'
+            '<div id="search-status"></div>')
+
+
+# Nécessite revealCell(page, case) (voir grid_toc.REVEAL_JS)
+SEARCH_JS = """
+        function searchKey(query) {
+            const q = query.trim();
+            if (!q) return null;
+            if ([...q].length === 1 && q.codePointAt(0) > 0x7F) {
+                return 'U+' + q.codePointAt(0).toString(16).toUpperCase();
+            }
+            const file = q.match(/^(.+)-(\\d+)(\\.ttf)?$/i);
+            const prefix = file && SEARCH_SOURCES[file[1].toLowerCase()];
+            if (prefix) return `${prefix}+${parseInt(file[2], 10)}`;
+            const upper = q.toUpperCase().replace(/\\s+/g, '').replace(/\\.TTF$/, '');
+            const hex = upper.match(/^(?:0X|U\\+?)?([0-9A-F]{4,6})$/);
+            if (hex) return 'U+' + parseInt(hex[1], 16).toString(16).toUpperCase();
+            const code = upper.match(/^([A-Z]+)\\+?(\\d+)$/);
+            if (code) return `${code[1]}+${parseInt(code[2], 10)}`;
+            return null;
+        }
+
+        const searchShards = new Map();      // clé de shard -> Promise des entrées
+        const searchCallbacks = new Map();
+
+        function searchShard(shardKey, entries) {
+            const resolve = searchCallbacks.get(shardKey);
+            searchCallbacks.delete(shardKey);
+            if (resolve) resolve(entries);
+        }
+
+        function loadSearchShard(shardKey) {
+            if (!searchShards.has(shardKey)) {
+                searchShards.set(shardKey, new Promise(resolve => {
+                    searchCallbacks.set(shardKey, resolve);
+                    const script = document.createElement('script');
+                    script.src = `${SEARCH_DIR}/${shardKey.replace(/[^0-9A-Za-z]/g, '_')}.js`;
+                    script.onerror = () => searchShard(shardKey, {});
+                    document.head.appendChild(script);
+                }));
+            }
+            return searchShards.get(shardKey);
+        }
+
+        const searchBox = document.getElementById('search-box');
+        const searchStatus = document.getElementById('search-status');
+        let lastSearch = null, lastHit = 0;
+
+        async function runSearch(query) {
+            const key = searchKey(query);
+            if (!key || key.length <= SEARCH_TAIL) {
+                searchStatus.textContent = 'Requête non reconnue';
+                return;
+            }
+            const entries = await loadSearchShard(key.slice(0, -SEARCH_TAIL));
+            const hits = entries[key.slice(-SEARCH_TAIL)];
+            if (!hits) {
+                searchStatus.textContent = `${key} : introuvable`;
+                return;
+            }
+            // Entrée répétée sur la même clé : occurrence suivante
+            lastHit = key === lastSearch ? (lastHit + 2) % hits.length : 0;
+            lastSearch = key;
+            revealCell(hits[lastHit], hits[lastHit + 1]);
+            const count = hits.length / 2;
+            searchStatus.textContent = `${key} : p. ${hits[lastHit] + 1}` + (count > 1 ? ` (${lastHit / 2 + 1}/${count})` : '');
+        }
+
+        searchBox.addEventListener('keydown', event => {
+            if (event.key === 'Enter') runSearch(searchBox.value);
+        });
+"""
+
+
+def search_script(search_dir, sources, prefixes, reveal_js=""):
+    # sources / prefixes : colonnes de la CharTable (clé de dictionnaire -> préfixe affiché)
+    source_map = {key.lower(): prefix for key, prefix in zip(sources, prefixes) if key}
+    return f"""    <script id="search">
+        const SEARCH_DIR = {json.dumps(search_dir)};
+        const SEARCH_TAIL = {SHARD_TAIL};
+        const SEARCH_SOURCES = {json.dumps(source_map, separators=(',', ':'))};
+{reveal_js}{SEARCH_JS}    </script>
+"""
@@ -0,0 +1,187 @@
+import hashlib
+import html
+import json
+import os
+
+from .grid_render import (ITEMS_PER_PAGE, STATIC_CSS, cell_data, font_loader_script, font_manifest,
+                         page_controls, page_head, page_intro, render_sheet)
+from .grid_toc import TOC_CSS, bucket_anchor, build_toc
+from .process_pool import process_pool
+
+# Sortie découpée : un fichier HTML par radical, un manifeste JSON et une
+# page de navigation. Seuls les fichiers dont le contenu a changé (empreinte
+# des données + version du gabarit) sont réécrits, dans un pool de processus.
+
+SHARD_FORMAT = 4
+MANIFEST_NAME = "manifest.json"
+INDEX_NAME = "index.html"
+
+NAV_CSS = """
+        .shard-nav {
+            max-width: 210mm; width: 100%; display: flex; justify-content: space-between;
+            margin-bottom: 20px; font-family: sans-serif; font-size: 14px;
+        }
+        .shard-nav a { color: #2563eb; text-decoration: none; font-weight: bold; }
+        .radical-index {
+            max-width: 210mm; display: grid; grid-template-columns: repeat(8, 1fr); gap: 6px;
+            font-family: sans-serif; font-size: 13px;
+        }
+        .radical-index a {
+            background: white; border: 1px solid #ccc; border-radius: 4px; padding: 6px;
+            text-align: center; color: #333; text-decoration: none;
+        }
+        .radical-index small { display: block; color: #888; }
+        .radical-index .toc-strokes a { display: inline; border: none; padding: 0 2px; color: #2563eb; }
+        @media print { .shard-nav { display: none; } }
+"""
+
+
+def shard_name(rad):
+    return f"rad-{rad:03d}.html"
+
+
+def group_by_radical(table, order):
+    # [(radical, [cases...]), ...] dans l'ordre de tri
+    groups = []
+    current_rad = None
+    for i in order:
+        rad = table.rad[i]
+        if rad != current_rad:
+            groups.append((rad, []))
+            current_rad = rad
+        groups[-1][1].append(cell_data(table, i))
+    return groups
+
+
+def shard_nav(prev_rad, next_rad):
+    prev_link = f'<a href="{shard_name(prev_rad)}">&larr; R{prev_rad}</a>' if prev_rad is not None else '<span></span>'
+    next_link = f'<a href="{shard_name(next_rad)}">R{next_rad} &rarr;</a>' if next_rad is not None else '<span></span>'
+    return (f'    <nav class="shard-nav">{prev_link}<a href="{INDEX_NAME}">Index des radicaux</a>'
+            f'{next_link}</nav>\n\n')
+
+
+def shard_hash(job):
+    payload = [SHARD_FORMAT, job['rad'], job['prev'], job['next'], job['font_stack'], job['cells']]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def render_shard(job):
+    # Exécuté dans un processus du pool : rend et écrit un fichier de radical
+    cells = job['cells']
+    fonts, font_index = font_manifest((cell[3], cell[4]) for cell in cells)
+    sheets = []
+    previous = None
+    for start in range(0, len(cells), ITEMS_PER_PAGE):
+        sheet, previous = render_sheet(cells[start:start + ITEMS_PER_PAGE], previous, font_index)
+        sheets.append(sheet)
+
+    document = (page_head(f"CJK Grid - Radical {job['rad']}", job['font_stack'], STATIC_CSS + NAV_CSS + TOC_CSS)
+                + shard_nav(job['prev'], job['next'])
+                + page_intro()
+                + f'    <div id="sheets-container">\n{"".join(sheets)}    </div>\n\n'
+                + page_controls(f"R{job['rad']} - {len(sheets)} Pages")
+                + font_loader_script(fonts)
+                + "</body>\n</html>\n")
+    write_text_atomic(job['path'], document)
+    return job['rad'], len(sheets)
+
+
+def write_text_atomic(path, text):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('format') != SHARD_FORMAT:
+        return {}
+    return {entry['rad']: entry for entry in manifest.get('radicals', [])}
+
+
+def render_index(entries, total, font_stack):
+    # Un bloc par radical : lien vers le fichier, effectifs, puis un lien par nombre de traits
+    links = []
+    for entry in entries:
+        target = html.escape(entry["file"])
+        strokes = "".join(f'<a href="{target}#{bucket_anchor(entry["rad"], b["strokes"])}" '
+                          f'title="{b["count"]} car., p. {b["page"] + 1}">{b["strokes"]}</a>'
+                          for b in entry['strokes'])
+        links.append(f'<div><a href="{target}">R{entry["rad"]}<small>{entry["count"]} car. / '
+                     f'{entry["pages"]} p.</small></a><div class="toc-strokes">{strokes}</div></div>')
+    links = "".join(links)
+    return (page_head("CJK Grid - Index des radicaux", font_stack, NAV_CSS)
+            + page_intro()
+            + f'    <div class="radical-index">{links}</div>\n\n'
+            + page_controls(f"{total} caractères", "window.print()")
+            + "</body>\n</html>\n")
+
+
+def write_shards(table, order, out_dir, font_stack, workers=None):
+    # Écrit un fichier par radical dans out_dir ; renvoie des statistiques
+    os.makedirs(out_dir, exist_ok=True)
+    previous = load_manifest(out_dir)
+    groups = group_by_radical(table, order)
+    toc = build_toc(table, order, ITEMS_PER_PAGE)
+
+    jobs, entries = [], []
+    unchanged = 0
+    for n, ((rad, cells), toc_entry) in enumerate(zip(groups, toc)):
+        job = {
+            'rad': rad,
+            'prev': groups[n - 1][0] if n > 0 else None,
+            'next': groups[n + 1][0] if n + 1 < len(groups) else None,
+            'font_stack': font_stack,
+            'cells': cells,
+            'path': os.path.join(out_dir, shard_name(rad)),
+        }
+        digest = shard_hash(job)
+        entries.append({
+            'rad': rad,
+            'file': shard_name(rad),
+            'count': len(cells),
+            'pages': -(-len(cells) // ITEMS_PER_PAGE),
+            # Groupes de traits : effectif, page (dans le fichier du radical) et case de départ
+            'strokes': [{'strokes': b['strokes'], 'count': b['count'],
+                         'page': b['page'] - toc_entry['page'], 'cell': b['cell']}
+                        for b in toc_entry['strokes']],
+            'sha256': digest,
+        })
+        old = previous.get(rad)
+        if old is not None and old.get('sha256') == digest and os.path.exists(job['path']):
+            unchanged += 1
+        else:
+            jobs.append(job)
+
+    if len(jobs) > 1 and (workers is None or workers > 1):
+        with process_pool(workers) as pool:
+            list(pool.map(render_shard, jobs, chunksize=4))
+    else:
+        for job in jobs:
+            render_shard(job)
+
+    # Radicaux disparus depuis le dernier run
+    current = {entry['rad'] for entry in entries}
+    removed = 0
+    for rad in previous:
+        if rad not in current:
+            path = os.path.join(out_dir, shard_name(rad))
+            if os.path.exists(path):
+                os.remove(path)
+            removed += 1
+
+    manifest = {
+        'format': SHARD_FORMAT,
+        'items_per_page': ITEMS_PER_PAGE,
+        'total': len(order),
+        'radicals': entries,
+    }
+    write_text_atomic(os.path.join(out_dir, MANIFEST_NAME), json.dumps(manifest, indent=1, ensure_ascii=False))
+    write_text_atomic(os.path.join(out_dir, INDEX_NAME), render_index(entries, len(order), font_stack))
+
+    return {'shards': len(entries), 'written': len(jobs), 'unchanged': unchanged, 'removed': removed}
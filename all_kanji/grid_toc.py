@@ -0,0 +1,139 @@
+import html
+import json
+import os
+
+# Table des matières : première page et première case de chaque radical et de
+# chaque groupe (radical, nombre de traits), calculées au moment de la génération.
+# Les cases de début de groupe portent une ancre (#r140 / #r140s5) : en rendu
+# statique, la navigation est un simple lien ; en rendu virtuel ou dynamique,
+# la table de saut (TOC) donne directement la page à afficher.
+
+TOC_FORMAT = 1
+
+
+def page_count(count, items_per_page):
+    return -(-count // items_per_page)
+
+
+def build_toc(table, order, items_per_page):
+    # [{'rad', 'count', 'page', 'cell', 'strokes': [{'strokes', 'count', 'page', 'cell'}, ...]}, ...]
+    # (pages numérotées à partir de 0, même découpage que grid_render.paginate())
+    toc = []
+    rads, strokes = table.rad, table.strokes
+    entry = bucket = None
+    page = 0
+    for i in order:
+        rad = rads[i]
+        if entry is None or rad != entry['rad']:
+            if entry is not None:
+                page += page_count(entry['count'], items_per_page)
+            entry = {'rad': rad, 'count': 0, 'page': page, 'cell': 0, 'strokes': []}
+            toc.append(entry)
+            bucket = None
+        stroke_count = strokes[i]
+        if bucket is None or stroke_count != bucket['strokes']:
+            offset = entry['count']
+            bucket = {'strokes': stroke_count, 'count': 0,
+                      'page': entry['page'] + offset // items_per_page, 'cell': offset % items_per_page}
+            entry['strokes'].append(bucket)
+        bucket['count'] += 1
+        entry['count'] += 1
+    return toc
+
+
+def radical_anchor(rad):
+    return f"r{rad}"
+
+
+def bucket_anchor(rad, stroke_count):
+    return f"r{rad}s{stroke_count}"
+
+
+def toc_json(toc):
+    # Table de saut compacte : [[radical, page, case, [traits, page, case, traits, ...]], ...]
+    rows = []
+    for entry in toc:
+        buckets = []
+        for bucket in entry['strokes']:
+            buckets += [bucket['strokes'], bucket['page'], bucket['cell']]
+        rows.append([entry['rad'], entry['page'], entry['cell'], buckets])
+    return json.dumps(rows, separators=(',', ':'))
+
+
+TOC_CSS = """
+        .toc {
+            max-width: 210mm; width: 100%; margin-bottom: 20px;
+            font-family: sans-serif; font-size: 12px;
+        }
+        .toc summary { cursor: pointer; font-weight: bold; font-size: 14px; margin-bottom: 8px; }
+        .toc-grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 4px; }
+        .toc-rad { background: white; border: 1px solid #ccc; border-radius: 4px; padding: 4px 6px; }
+        .toc-rad > a { color: #2563eb; font-weight: bold; text-decoration: none; }
+        .toc-rad small { color: #888; margin-left: 4px; }
+        .toc-strokes a { color: #555; text-decoration: none; margin-right: 4px; }
+        .cell:target, .radical-label:target + .char, .toc-target { outline: 3px solid #2563eb; outline-offset: -3px; }
+        @media print { .toc { display: none; } }
+"""
+
+
+def render_toc(toc, href_for=lambda rad: ""):
+    # href_for(radical) : fichier cible des liens ("" = même page, ex. "rad-140.html" pour les shards)
+    items = []
+    for entry in toc:
+        rad = entry['rad']
+        target = html.escape(href_for(rad))
+        strokes = "".join(f'<a href="{target}#{bucket_anchor(rad, b["strokes"])}" '
+                          f'title="p. {b["page"] + 1}">{b["strokes"]}</a>'
+                          for b in entry['strokes'])
+        items.append(f'<div class="toc-rad"><a href="{target}#{radical_anchor(rad)}">R{rad}</a>'
+                     f'<small>{entry["count"]} car. · p. {entry["page"] + 1}</small>'
+                     f'<div class="toc-strokes">{strokes}</div></div>')
+    return (f'    <nav class="toc"><details><summary>Radicaux et nombre de traits</summary>'
+            f'<div class="toc-grid">{"".join(items)}</div></details></nav>\n\n')
+
+
+# Affiche une page puis met une case en évidence ; showPage(page) est défini par
+# chaque rendu et renvoie la feuille une fois affichée (aucune page précédente
+# n'est construite). Utilisé par la table des matières et par la recherche.
+REVEAL_JS = """
+        let revealed = null;
+        function revealCell(page, cell) {
+            const sheet = showPage(page);
+            const target = sheet && sheet.querySelectorAll('.cell')[cell];
+            if (revealed) revealed.classList.remove('toc-target');
+            revealed = target || null;
+            if (target) target.classList.add('toc-target');
+        }
+"""
+
+# Navigation par la table de saut (rendus virtuel et dynamic)
+TOC_JS = """
+        const JUMP = new Map();
+        for (const [rad, page, cell, buckets] of TOC) {
+            JUMP.set(`r${rad}`, [page, cell]);
+            for (let b = 0; b < buckets.length; b += 3) {
+                JUMP.set(`r${rad}s${buckets[b]}`, [buckets[b + 1], buckets[b + 2]]);
+            }
+        }
+
+        function jumpTo(hash) {
+            const target = JUMP.get(hash.slice(1));
+            if (target) revealCell(target[0], target[1]);
+        }
+        window.addEventListener('hashchange', () => jumpTo(location.hash));
+"""
+
+
+def write_toc_manifest(path, toc, items_per_page):
+    # Manifeste de la page unique : effectifs et position de chaque radical / groupe de traits
+    manifest = {
+        'format': TOC_FORMAT,
+        'items_per_page': items_per_page,
+        'total': sum(entry['count'] for entry in toc),
+        'pages': sum(page_count(entry['count'], items_per_page) for entry in toc),
+        'radicals': toc,
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, path)
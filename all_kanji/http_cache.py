@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import urllib.error
+import urllib.request
+
+# --- CONFIGURATION PAR DÉFAUT ---
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+CHUNK_SIZE = 1 << 16
+DEFAULT_TIMEOUT = 60
+
+# Résultats de fetch_cached()
+NOT_MODIFIED = 'not-modified'   # 304 : la copie locale est à jour
+DOWNLOADED = 'downloaded'       # Téléchargement complet
+RESUMED = 'resumed'             # Reprise d'un téléchargement interrompu (Range)
+
+
+class DigestMismatch(Exception):
+    pass
+
+
+def sha256_file(path):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def load_meta(path):
+    return _load_json(f"{path}.meta.json")
+
+
+def fetch_cached(url, path, expected_sha256=None, timeout=DEFAULT_TIMEOUT, on_chunk=None):
+    # Télécharge url vers path en gardant ETag / Last-Modified à côté du fichier :
+    #  - copie locale présente -> GET conditionnel (un 304 ne coûte qu'un aller-retour)
+    #  - fichier .part d'un essai interrompu -> reprise avec Range / If-Range
+    #  - empreinte SHA-256 vérifiée avant de remplacer la copie locale.
+    # on_chunk (optionnel) reçoit chaque bloc quand le corps est lu depuis le début.
+    # Renvoie NOT_MODIFIED, DOWNLOADED ou RESUMED.
+    meta_path = f"{path}.meta.json"
+    part_path = f"{path}.part"
+    part_meta_path = f"{part_path}.json"
+
+    meta = load_meta(path)
+    have_copy = os.path.exists(path) and meta is not None and meta.get('url') == url
+    if have_copy and meta.get('sha256') != sha256_file(path):
+        print(f"   [Cache] {path} ne correspond plus à son empreinte, nouveau téléchargement.")
+        have_copy = False
+
+    headers = {'User-Agent': USER_AGENT}
+    part_meta = _load_json(part_meta_path) if os.path.exists(part_path) else None
+    validator = part_meta and part_meta.get('url') == url and (part_meta.get('etag') or part_meta.get('last_modified'))
+    offset = os.path.getsize(part_path) if validator else 0
+    if offset:
+        headers['Range'] = f"bytes={offset}-"
+        headers['If-Range'] = validator
+    elif have_copy:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and have_copy:
+            return NOT_MODIFIED
+        if e.code == 416 and offset:
+            # Fragment inutilisable côté serveur : on repart de zéro
+            os.remove(part_path)
+            return fetch_cached(url, path, expected_sha256, timeout, on_chunk)
+        raise
+
+    with response:
+        resumed = response.status == 206 and offset > 0
+        hasher = hashlib.sha256()
+        if resumed:
+            with open(part_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+        else:
+            offset = 0
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        _save_json(part_meta_path, {'url': url, 'etag': etag, 'last_modified': last_modified})
+
+        expected_length = response.headers.get('Content-Length')
+        received = 0
+        with open(part_path, 'ab' if resumed else 'wb') as out:
+            for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                out.write(chunk)
+                hasher.update(chunk)
+                received += len(chunk)
+                if on_chunk is not None and not resumed:
+                    on_chunk(chunk)
+
+    if expected_length is not None and received != int(expected_length):
+        raise OSError(f"téléchargement incomplet ({received}/{expected_length} octets), reprise au prochain lancement")
+
+    digest = hasher.hexdigest()
+    if expected_sha256 and digest != expected_sha256.lower():
+        os.remove(part_path)
+        os.remove(part_meta_path)
+        raise DigestMismatch(f"empreinte SHA-256 inattendue pour {url} : {digest}")
+
+    os.replace(part_path, path)
+    _save_json(meta_path, {'url': url, 'etag': etag, 'last_modified': last_modified,
+                           'size': offset + received, 'sha256': digest})
+    os.remove(part_meta_path)
+    return RESUMED if resumed else DOWNLOADED
@@ -0,0 +1,111 @@
+import argparse
+import os
+import sys
+
+from .irg_source import IrgRowParser, parse_irg_file
+
+# --- CONFIGURATION ---
+# Utilisation de list.php qui est plus léger et structuré
+TARGET_URL = "https://hc.jsecs.org/irg/ws2024/app/list.php?show_all=1"
+OUTPUT_JSON = "irg2024_attributes.json"
+CACHE_DIR = "cache"
+PAGE_CACHE = os.path.join(CACHE_DIR, "irg2024_list.html")  # Copie locale + ETag/Last-Modified
+
+# Plage exacte des caractères IRG 2024
+START_ID = 1
+END_ID = 4674
+
+# En dessous de cette proportion de caractères identifiés, la page est jugée
+# incomplète ou de structure inattendue : rien n'est écrit.
+MIN_COVERAGE = 0.95
+UNKNOWN_RADICAL = 215   # Radical "Inconnu" des caractères absents de la page
+
+
+def fetch_and_parse(offline=False):
+    # {identifiant: {'rad', 'str'}} ; la page est analysée pendant le téléchargement
+    from .http_cache import fetch_cached, DOWNLOADED, NOT_MODIFIED
+
+    scraped_data = {}
+
+    def on_row(char_id, rad, strokes):
+        scraped_data[char_id] = {'rad': rad, 'str': strokes}
+
+    if offline:
+        if not os.path.exists(PAGE_CACHE):
+            raise OSError(f"'{PAGE_CACHE}' introuvable (relancez sans --offline)")
+        print(f"   Mode hors ligne : analyse de la copie locale '{PAGE_CACHE}'.")
+        parse_irg_file(PAGE_CACHE, on_row)
+        return scraped_data
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    parser = IrgRowParser(on_row)
+    try:
+        status = fetch_cached(TARGET_URL, PAGE_CACHE, on_chunk=parser.feed_bytes)
+    except Exception as e:
+        if not os.path.exists(PAGE_CACHE):
+            raise
+        print(f"   ATTENTION: Vérification impossible ({e}). Utilisation de la copie locale.")
+        status = None
+
+    if status == DOWNLOADED:
+        parser.close()
+    else:
+        # 304, reprise ou copie locale : la page (complète) est relue depuis le disque
+        scraped_data.clear()
+        parse_irg_file(PAGE_CACHE, on_row)
+        if status == NOT_MODIFIED:
+            print("   Copie locale à jour, rien à télécharger.")
+    print(f"   Page : {os.path.getsize(PAGE_CACHE) / 1024:.0f} KB ({PAGE_CACHE})")
+    return scraped_data
+
+
+def scrape_and_generate_json(offline=False):
+    from .glyph_downloader import write_json_atomic
+
+    print("1. Téléchargement et analyse de la liste officielle depuis :")
+    print(f"   {TARGET_URL}")
+    try:
+        scraped_data = fetch_and_parse(offline)
+    except Exception as e:
+        print(f"   [ERREUR] Impossible de lire le site : {e}")
+        print(f"   '{OUTPUT_JSON}' n'est pas modifié.")
+        return False
+
+    print(f"2. Vérification et remplissage ({START_ID:05d} à {END_ID:05d})...")
+    final_data = {}
+    missing = 0
+    for i in range(START_ID, END_ID + 1):
+        str_id = f"{i:05d}"
+        if str_id in scraped_data:
+            final_data[str_id] = scraped_data[str_id]
+        else:
+            final_data[str_id] = {'rad': UNKNOWN_RADICAL, 'str': 0}
+            missing += 1
+    found = len(final_data) - missing
+    print(f"   -> {found} caractères correctement identifiés.")
+    if found < MIN_COVERAGE * len(final_data):
+        print(f"   [ERREUR] {missing} caractères sans radical : page incomplète ou format inattendu.")
+        print(f"   '{OUTPUT_JSON}' n'est pas modifié.")
+        return False
+    if missing:
+        print(f"   (Info : {missing} caractères non trouvés, mis en Radical {UNKNOWN_RADICAL})")
+    else:
+        print("   (Succès : Tous les caractères ont été associés à un radical !)")
+
+    print(f"3. Sauvegarde dans '{OUTPUT_JSON}'...")
+    write_json_atomic(OUTPUT_JSON, final_data)
+    print("Terminé ! Lancez maintenant 'kanji-all.py' pour générer la grille corrigée.")
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Radicaux et traits du Working Set IRG 2024")
+    parser.add_argument('--offline', action='store_true',
+                        help=f"Analyse la copie locale '{PAGE_CACHE}' sans contacter le site")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not scrape_and_generate_json(offline=args.offline):
+        sys.exit(1)
@@ -0,0 +1,116 @@
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+# --- CONFIGURATION ---
+BASE_URL = "https://glyphwiki.org/glyph/"
+OUTPUT_DIR = "irg2024_fonts"
+ZIP_NAME = "fonts_irg2024.zip"
+
+# Plage IRG 2024 : 00001 à 04674
+START_ID = 1
+END_ID = 4674
+
+# Téléchargement parallèle (rester raisonnable avec GlyphWiki)
+WORKERS = 8
+PER_HOST_LIMIT = 4      # Connexions simultanées max vers glyphwiki.org
+MIN_INTERVAL = 0.02     # Délai minimal entre deux requêtes (secondes)
+
+# Taille + SHA-256 de chaque police (écrite de façon atomique)
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, "manifest.json")
+
+
+def make_downloader():
+    # Importé et construit à l'exécution seulement (import du module et --help instantanés)
+    from .glyph_downloader import GlyphDownloader, FontManifest
+
+    downloader = GlyphDownloader(BASE_URL, OUTPUT_DIR, workers=WORKERS,
+                                 per_host=PER_HOST_LIMIT, min_interval=MIN_INTERVAL)
+    downloader.manifest = FontManifest(MANIFEST_FILE)
+    return downloader
+
+
+def download_file(downloader, filename):
+    # Renvoie le statut du téléchargement (EXISTS, OK, MISSING, KNOWN_MISSING ou ERROR)
+    from .glyph_downloader import EXISTS, OK
+
+    status, error = downloader.download(filename)
+    if status not in (EXISTS, OK):
+        print(f"   [ERREUR] Impossible de télécharger {filename}: {error}")
+    return status
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Téléchargement des polices IRG 2024 depuis GlyphWiki")
+    parser.add_argument('--verify', action='store_true',
+                        help="Vérifie tout le dossier contre le manifeste et ne retélécharge que les fichiers abîmés")
+    parser.add_argument('--full-zip', action='store_true',
+                        help="Reconstruit le ZIP de zéro au lieu de le mettre à jour")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from .font_packager import build_zip, format_stats
+    from .glyph_downloader import ERROR, EXISTS, OK
+
+    # Création du dossier de stockage
+    if not os.path.exists(OUTPUT_DIR):
+        os.makedirs(OUTPUT_DIR)
+    downloader = make_downloader()
+    
+    print(f"=== TÉLÉCHARGEMENT IRG 2024 ({START_ID} à {END_ID}) ===")
+    
+    files_to_download = []
+    
+    if args.verify:
+        print("--- Vérification du dossier contre le manifeste ---")
+        bad = downloader.verify()
+        for filename, problem in bad:
+            print(f"   [ABÎMÉ] {filename} : {problem}")
+        files_to_download = [filename for filename, _ in bad]
+    else:
+        # Génération de la liste
+        for i in range(START_ID, END_ID + 1):
+            filename = f"irg2024-{i:05d}" # ex: irg2024-01201
+            files_to_download.append(filename)
+    
+    total = len(files_to_download)
+    print(f"Total de fichiers : {total}")
+    print(f"Démarrage... ({WORKERS} téléchargements en parallèle)")
+    
+    success_count = 0
+    error_count = 0
+    start_time = time.time()
+    
+    # Téléchargement parallèle (pool borné, connexions keep-alive)
+    try:
+        for i, (filename, status) in enumerate(downloader.run(partial(download_file, downloader), files_to_download)):
+            if status in (EXISTS, OK):
+                success_count += 1
+            elif status == ERROR:
+                error_count += 1
+                
+            # Affichage progression tous les 100 fichiers
+            if i % 100 == 0 and i > 0:
+                elapsed = time.time() - start_time
+                percent = (i / total) * 100
+                print(f"   Progression : {i}/{total} ({percent:.1f}%) - {elapsed:.0f}s écoulées")
+    finally:
+        downloader.manifest.save()
+
+    # Création du ZIP
+    print(f"\n=== CRÉATION DU ZIP ({ZIP_NAME}) ===")
+    # Mise à jour incrémentale : seuls les fichiers nouveaux ou modifiés sont compressés
+    zip_start = time.time()
+    stats = build_zip(OUTPUT_DIR, ZIP_NAME, extensions=('.ttf',), incremental=not args.full_zip)
+    print(f"   {format_stats(stats)} - {time.time() - zip_start:.1f}s")
+    
+    print(f"Terminé ! {success_count} fichiers sont dans '{ZIP_NAME}'.")
+    print("Vous pouvez maintenant utiliser 'install_fonts.py' avec ce fichier zip.")
+    if error_count:
+        # Les 404 ne comptent pas : seules les erreurs réseau / polices invalides font échouer
+        print(f"[ERREUR] {error_count} téléchargements en échec : relancez le script.")
+        sys.exit(1)
@@ -0,0 +1,108 @@
+import codecs
+import html
+import re
+
+# Extraction (radical, traits) de la liste IRG Working Set 2024 (list.php).
+# La page est analysée au fil de l'eau : les blocs sont découpés en lignes
+# <tr> dès leur arrivée et seule la ligne incomplète reste en mémoire.
+# Pas de HTMLParser : son découpage balise par balise en Python coûtait
+# 5 à 7 fois le temps de l'ancien découpage sur </tr> ; ici, une ligne
+# complète passe par deux expressions régulières (balises, motif R.S).
+
+READ_SIZE = 1 << 16
+
+# Fin de ligne (</table> et </tbody> ferment aussi une ligne sans </tr>),
+# début de ligne et balise quelconque
+ROW_END_RE = re.compile(r'</(?:tr|tbody|table)\s*>', re.IGNORECASE)
+ROW_START_RE = re.compile(r'<tr(?:\s[^>]*)?>', re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]*>')
+
+# Identifiant IRG : nœud texte de 5 chiffres exactement
+ID_RE = re.compile(r'^\d{5}$')
+# Motif radical.traits (ex: 85.9, 187'.3) qui n'est PAS précédé ou suivi d'une
+# lettre ou d'un tiret (pour éviter les codes source comme G-12.3)
+RS_RE = re.compile(r'(?<![-\w])(\d{1,3})\'?\.(\d{1,2})(?:\.\d+)?(?![-\w])')
+
+MIN_RADICAL = 1
+MAX_RADICAL = 214
+
+
+def row_attributes(texts):
+    # (identifiant, radical, traits) d'une ligne, ou None : premier radical Kangxi
+    # valide trouvé dans la ligne (les codes source sont écartés par RS_RE)
+    char_id = next((text for text in texts if ID_RE.match(text)), None)
+    if char_id is None:
+        return None
+    for text in texts:
+        for m in RS_RE.finditer(text):
+            rad = int(m.group(1))
+            if MIN_RADICAL <= rad <= MAX_RADICAL:
+                return char_id, rad, int(m.group(2))
+    return None
+
+
+class IrgRowParser:
+    # Appelle on_row(identifiant, radical, traits) à chaque fin de ligne reconnue
+
+    def __init__(self, on_row):
+        self.on_row = on_row
+        self.rows = 0
+        self._pending = ''   # Début de la ligne en cours (pas encore fermée)
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def feed(self, text):
+        text = self._pending + text
+        start = 0
+        for match in ROW_END_RE.finditer(text):
+            self.parse_rows(text[start:match.start()])
+            start = match.end()
+        self._pending = text[start:]
+
+    def parse_rows(self, segment):
+        # Texte avant la fin de ligne ; chaque <tr> ouvre une nouvelle ligne,
+        # le texte avant le premier <tr> est hors ligne
+        for row in ROW_START_RE.split(segment)[1:]:
+            parts = TAG_RE.split(row)
+            if '&' in row:
+                parts = [html.unescape(part) for part in parts]
+            texts = [text for text in (part.strip() for part in parts) if text]
+            found = row_attributes(texts)
+            if found is not None:
+                self.rows += 1
+                self.on_row(*found)
+
+    def feed_bytes(self, chunk):
+        # Bloc brut (un caractère UTF-8 peut être coupé entre deux blocs)
+        self.feed(self._decoder.decode(chunk))
+
+    def close(self):
+        self.feed(self._decoder.decode(b'', final=True))
+        self.parse_rows(self._pending)
+        self._pending = ''
+
+
+def parse_irg_file(path, on_row):
+    # Relit une copie locale par blocs ; renvoie le nombre de lignes reconnues
+    parser = IrgRowParser(on_row)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_SIZE), b''):
+            parser.feed_bytes(chunk)
+    parser.close()
+    return parser.rows
+
+
+def parse_irg_page_legacy(html_content):
+    # Ancienne méthode (page entière en mémoire, découpage sur </tr>, regex par ligne).
+    # Conservée comme référence pour benchmarks/bench_irg_scraper.py.
+    scraped_data = {}
+    for row in html_content.split('</tr>'):
+        id_match = re.search(r'>(\d{5})<', row)
+        if not id_match:
+            continue
+        char_id = id_match.group(1)
+        pattern = r'(?<![-\w])(\d{1,3})\'?\.(\d{1,2})(?:\.\d+)?(?![-\w])'
+        for m in re.findall(pattern, row):
+            if 1 <= int(m[0]) <= 214:
+                scraped_data[char_id] = {'rad': int(m[0]), 'str': int(m[1])}
+                break
+    return scraped_data
@@ -0,0 +1,250 @@
+import argparse
+import json
+import os
+
+# Génération de la grille de tous les kanji (Unihan + GlyphWiki).
+# Les modules du pipeline sont importés dans les fonctions qui s'en servent et
+# les données manuelles au premier usage : importer ce module ou afficher --help
+# ne coûte que quelques millisecondes.
+
+# --- CONFIGURATION ---
+UNIHAN_URL = "https://www.unicode.org/Public/UCD/latest/ucd/Unihan.zip"
+CACHE_DIR = "cache"
+UNIHAN_CACHE = os.path.join(CACHE_DIR, "Unihan.zip")  # Copie locale + ETag/Last-Modified
+UNIHAN_SHA256 = None  # Empreinte attendue (optionnelle) pour figer une version précise
+TABLE_CACHE = os.path.join(CACHE_DIR, "cjk_table.bin")  # Table fusionnée compilée
+GLYPHWIKI_CACHE = os.path.join(CACHE_DIR, "glyphwiki_data.bin")  # data/glyphwiki/*.tsv compilés
+OUTPUT_FILE = "ALL_KANJI.html"
+MANIFEST_FILE = "ALL_KANJI.manifest.json"  # Effectifs et position de chaque radical / groupe de traits
+SEARCH_DIR = "ALL_KANJI_search"  # Index de recherche découpé (fichiers .js chargés à la demande)
+SHARD_DIR = "ALL_KANJI_shards"  # Sortie découpée : un fichier par radical (--shard)
+IRG_DATA_FILE = "irg2024_attributes.json" # Fichier contenant les radicaux/traits IRG
+
+# Caractères IRG 2024 : 00001 à 04674 ; radical 216 (fin de grille) sans fichier d'attributs
+IRG_SOURCE = "irg2024"
+IRG_COUNT = 4674
+IRG_UNKNOWN_RADICAL = 216
+
+RENDER_MODES = ('static', 'dynamic', 'virtual')  # grid_render.RENDER_MODES, sans importer le rendu
+
+# POLICES
+FONT_STACK = '"BabelStone Han Extra", "BabelStone Han", "Hanazono Mincho B", "HanaMinB", "HanaMin A", "Hanazono Mincho A", "HanaMinA", "TH-Tshyn-P1", "TH-Tshyn-P2", "SimSun-ExtB", "MingLiU-ExtB", "Nom Na Tong", "Noto Serif JP", "Source Han Serif", serif'
+
+_glyphwiki_data = None
+
+
+def load_irg_attributes(path=IRG_DATA_FILE):
+    # {identifiant: {'rad', 'str'}} produit par irg2024-attributes.py ({} si absent ou illisible)
+    print("--- Chargement des données IRG 2024 ---")
+    if not os.path.exists(path):
+        print(f"   ⚠️ '{path}' introuvable.")
+        print(f"   Les caractères IRG seront classés à la fin (Radical {IRG_UNKNOWN_RADICAL}).")
+        print("   (Utilisez le script 'irg2024-attributes.py' pour récupérer les vraies données)")
+        return {}
+    print(f"   Fichier '{path}' trouvé ! Chargement des détails...")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"   Erreur de lecture du JSON ({e}). Utilisation des valeurs par défaut.")
+        return {}
+
+
+def iter_irg_entries(irg_attributes):
+    # (numéro, radical, traits) de chaque caractère IRG, radical/traits du scraper si connus
+    for i in range(1, IRG_COUNT + 1):
+        str_id = f"{i:05d}" # Format 00001, 00002...
+        attributes = irg_attributes.get(str_id)
+        if attributes:
+            yield str_id, attributes['rad'], attributes['str']
+        else:
+            yield str_id, IRG_UNKNOWN_RADICAL, 0
+
+
+def load_glyphwiki_data():
+    # Dictionnaires et glyphes manuels (data/glyphwiki/*.tsv), compilés une seule
+    # fois puis relus depuis GLYPHWIKI_CACHE tant que les TSV ne changent pas
+    global _glyphwiki_data
+    if _glyphwiki_data is None:
+        from .glyphwiki_source import load_glyphwiki_sources
+        _glyphwiki_data = load_glyphwiki_sources(GLYPHWIKI_CACHE)
+    return _glyphwiki_data
+
+
+def download_and_extract():
+    from .http_cache import fetch_cached, NOT_MODIFIED, RESUMED
+
+    print(f"1. Téléchargement de {UNIHAN_URL}...")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    try:
+        status = fetch_cached(UNIHAN_URL, UNIHAN_CACHE, expected_sha256=UNIHAN_SHA256)
+    except Exception as e:
+        if os.path.exists(UNIHAN_CACHE):
+            print(f"   ATTENTION: Vérification impossible ({e}). Utilisation de la copie locale.")
+            return UNIHAN_CACHE
+        print(f"   ERREUR: Impossible de télécharger Unihan. {e}")
+        return None
+
+    size_mb = os.path.getsize(UNIHAN_CACHE) / 1024 / 1024
+    if status == NOT_MODIFIED:
+        print(f"   Copie locale à jour ({size_mb:.2f} MB), rien à télécharger.")
+    elif status == RESUMED:
+        print(f"   Téléchargement repris et terminé ({size_mb:.2f} MB).")
+    else:
+        print(f"   Téléchargement terminé ({size_mb:.2f} MB).")
+    return UNIHAN_CACHE
+
+
+def parse_unihan(zip_path, legacy=False):
+    from .char_table import CharTable
+    from .cjk_blocks import needs_custom_font
+    from .glyphwiki_source import iter_entries
+    from .unihan_source import iter_rs_unicode, iter_rs_unicode_legacy
+
+    glyphwiki_data = load_glyphwiki_data()
+    print("2. Analyse des données...")
+    table = CharTable()
+    # Ordinal de chaque dictionnaire = sa position dans sources.tsv (ordre de tri stable)
+    source_indexes = [table.add_source(key, prefix) for key, prefix in glyphwiki_data['dicts']]
+
+    # A. Données Unicode Officielles (lues directement depuis le cache disque)
+    # Le parseur rapide n'ouvre que le fichier contenant kRSUnicode et filtre sur les octets.
+    records = iter_rs_unicode_legacy(zip_path) if legacy else iter_rs_unicode(zip_path)
+    for code_point, rad, strokes in records:
+        # Bloc sans police système (Ext J) : police GlyphWiki dédiée (voir cjk_blocks.py)
+        table.append_unicode(code_point, rad, strokes, custom_font=needs_custom_font(code_point))
+
+    # B. Ajout des données GlyphWiki (saisies à la main, puis IRG 2024)
+    print("   -> Intégration des données GlyphWiki...")
+    count_k = 0
+    for source, raw_id, rad, strokes in iter_entries(glyphwiki_data):
+        table.append_glyphwiki(source_indexes[source], raw_id, rad, strokes)
+        count_k += 1
+
+    irg_source = table.add_source(IRG_SOURCE, "IRG")
+    for raw_id, rad, strokes in iter_irg_entries(load_irg_attributes()):
+        table.append_glyphwiki(irg_source, raw_id, rad, strokes)
+        count_k += 1
+
+    print(f"   TOTAL : {len(table)} caractères prêts (dont {count_k} GlyphWiki).")
+    return table
+
+
+def generate_grid_html(table, mode='static', workers=None):
+    from .grid_payload import payload_size, row_json_size, write_precompressed
+    from .grid_render import (ITEMS_PER_PAGE, font_manifest, iter_dynamic, iter_static, iter_virtual,
+                              table_fonts, write_html)
+    from .grid_search import write_search_index
+    from .grid_shards import write_shards
+    from .grid_toc import build_toc, write_toc_manifest
+
+    if not table:
+        print("   ERREUR: Aucune donnée à générer.")
+        return
+
+    print("3. Tri par Busyu...")
+    order = table.sort_order()
+
+    if mode == 'sharded':
+        print(f"4. Génération d'un fichier par radical : {SHARD_DIR}/ ...")
+        stats = write_shards(table, order, SHARD_DIR, FONT_STACK, workers=workers)
+        print(f"   {stats['shards']} radicaux : {stats['written']} réécrits, {stats['unchanged']} inchangés, "
+              f"{stats['removed']} supprimés.")
+        print(f"Terminé ! Ouvrez '{SHARD_DIR}/index.html'.")
+        return
+
+    print(f"4. Génération de la grille A4 (70 chars, rendu {mode}) : {OUTPUT_FILE}...")
+    toc = build_toc(table, order, ITEMS_PER_PAGE)
+    if mode == 'dynamic':
+        chunks = iter_dynamic(table, order, FONT_STACK, toc, SEARCH_DIR)
+    elif mode == 'virtual':
+        chunks = iter_virtual(table, order, FONT_STACK, toc, SEARCH_DIR)
+    else:
+        chunks = iter_static(table, order, FONT_STACK, toc, SEARCH_DIR)
+    write_html(OUTPUT_FILE, chunks)
+    write_toc_manifest(MANIFEST_FILE, toc, ITEMS_PER_PAGE)
+    print(f"   Table des matières : {len(toc)} radicaux, "
+          f"{sum(len(entry['strokes']) for entry in toc)} groupes de traits -> {MANIFEST_FILE}")
+    stats = write_search_index(SEARCH_DIR, table, order, ITEMS_PER_PAGE)
+    print(f"   Index de recherche : {stats['entries']} entrées, {stats['shards']} fichiers "
+          f"({stats['written']} réécrits, {stats['removed']} supprimés, max {stats['largest'] / 1024:.1f} KB) "
+          f"-> {SEARCH_DIR}/")
+
+    if mode in ('dynamic', 'virtual'):
+        _, font_index = font_manifest(table_fonts(table, order))
+        before = row_json_size(table, order)
+        after = payload_size(table, order, font_index)
+        print(f"   Données en colonnes : {before / 1024:.0f} KB -> {after / 1024:.0f} KB "
+              f"(-{100 * (1 - after / before):.0f} %)")
+    for path, size in write_precompressed(OUTPUT_FILE):
+        print(f"   {path} : {size / 1024:.0f} KB")
+    print(f"Terminé ! Ouvrez '{OUTPUT_FILE}'.")
+
+
+def table_cache_key(zip_path):
+    from .cjk_blocks import CJK_BLOCKS
+    from .glyphwiki_source import data_digest
+    from .table_cache import cache_key, hash_bytes, hash_file
+
+    # Clé du cache : empreintes de Unihan.zip, du JSON IRG, des TSV GlyphWiki manuels
+    # et de la table des blocs (qui décide des caractères à police dédiée)
+    blocks = json.dumps(CJK_BLOCKS).encode('utf-8')
+    return cache_key(hash_file(zip_path), hash_file(IRG_DATA_FILE), data_digest(), hash_bytes(blocks))
+
+
+def load_cached_table():
+    from .table_cache import load_table
+
+    if not os.path.exists(UNIHAN_CACHE):
+        return None
+    table = load_table(TABLE_CACHE, table_cache_key(UNIHAN_CACHE))
+    if table:
+        print(f"1-2. Table compilée à jour ({len(table)} caractères) : téléchargement et analyse ignorés.")
+    return table
+
+
+def build_table(refresh=False, legacy=False):
+    # Table fusionnée : cache compilé si à jour, sinon téléchargement + analyse (puis mise en cache)
+    from .table_cache import save_table
+
+    table = None if refresh else load_cached_table()
+    if table is None:
+        zip_path = download_and_extract()
+        if zip_path:
+            table = parse_unihan(zip_path, legacy=legacy)
+            if table:
+                save_table(TABLE_CACHE, table_cache_key(zip_path), table)
+    return table
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Génération de la grille de tous les kanji (Unihan + GlyphWiki)")
+    parser.add_argument('--legacy-parser', action='store_true',
+                        help="Utilise l'ancien parseur Unihan (lecture de tous les fichiers, ligne par ligne)")
+    parser.add_argument('--render', choices=RENDER_MODES, default='static',
+                        help="static : feuilles pré-paginées en HTML (défaut) ; dynamic : construites en JS au chargement ; "
+                             "virtual : seules les feuilles visibles sont montées")
+    parser.add_argument('--shard', action='store_true',
+                        help=f"Écrit un fichier par radical + manifeste + index dans '{SHARD_DIR}'")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Nombre de processus de rendu pour --shard (défaut : nombre de cœurs)")
+    parser.add_argument('--no-bundles', action='store_true',
+                        help="Ignore les lots de 'font_bundles' : une police par glyphe et placeholder 〓")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Ignore la table compilée et revérifie Unihan.zip en ligne")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    table = build_table(refresh=args.refresh, legacy=args.legacy_parser)
+    if table:
+        from .font_bundler import BUNDLE_DIR, load_bundles
+
+        # Lots de polices (font_bundler.py) : hors cache, ils évoluent indépendamment de Unihan
+        # Chemins des lots relatifs aux pages générées (racine ou dossier des radicaux)
+        page_dir = SHARD_DIR if args.shard else os.path.dirname(OUTPUT_FILE) or '.'
+        table.bundles = {} if args.no_bundles else load_bundles(BUNDLE_DIR, page_dir)
+        if table.bundles:
+            print(f"   {len(table.bundles)} glyphes servis par les lots de '{BUNDLE_DIR}'.")
+        generate_grid_html(table, mode='sharded' if args.shard else args.render, workers=args.workers)
@@ -0,0 +1,391 @@
+import argparse
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+
+# Chaîne complète de génération, décrite comme un graphe d'étapes :
+#
+#   unihan ──────────┐
+#   irg-attributes ──┼──────────────> grid
+#   irg-fonts ───┬───┘               ^
+#   ext-j-fonts ─┴──> bundle ────────┘
+#
+# Chaque étape déclare ses dépendances, ses entrées et ses sorties (fichiers ou
+# dossiers). Les étapes prêtes tournent en parallèle ; une étape est ignorée
+# quand l'empreinte de ses entrées (contenu des fichiers + paramètres) et celle
+# de ses sorties sont celles du dernier succès, mémorisées dans STATE_FILE.
+# Les étapes réseau n'ont pas d'entrée locale : elles revérifient leur source
+# une fois le délai --ttl-days écoulé (ou avec --force).
+
+# --- CONFIGURATION ---
+CACHE_DIR = "cache"
+STATE_FILE = os.path.join(CACHE_DIR, "pipeline_state.json")
+STATE_FORMAT = 1
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+REMOTE_TTL_DAYS = 7     # Délai avant de revérifier une source en ligne
+WORKERS = 4             # Étapes exécutées simultanément (au plus 4 sont indépendantes)
+IGNORED_SUFFIXES = ('.tmp', '.part')  # Écritures atomiques ou téléchargements en cours
+
+STAGE_NAME = contextvars.ContextVar('stage_name', default=None)  # Étape en cours (préfixe des sorties)
+
+# États d'une étape après exécution
+DONE = 'terminé'
+SKIPPED = 'à jour'
+FAILED = 'échec'
+BLOCKED = 'bloqué'
+
+
+class Stage:
+    # inputs / outputs : listes de chemins, ou fonctions (options) -> liste ;
+    # params : fonction (options) -> valeurs JSON qui entrent dans l'empreinte des entrées
+    __slots__ = ('name', 'run', 'deps', 'inputs', 'outputs', 'params', 'remote', 'label')
+
+    def __init__(self, name, run, label, deps=(), inputs=(), outputs=(), params=None, remote=False):
+        self.name = name
+        self.run = run
+        self.label = label
+        self.deps = tuple(deps)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.params = params
+        self.remote = remote
+
+
+def package_code():
+    return sorted(os.path.join(PACKAGE_DIR, name) for name in os.listdir(PACKAGE_DIR) if name.endswith('.py'))
+
+
+def run_command(module_name, argv):
+    # main(argv) d'une commande du paquet ; sys.exit(n) est traduit en succès / échec
+    import importlib
+
+    module = importlib.import_module(f".{module_name}", __package__)
+    try:
+        module.main(argv)
+    except SystemExit as e:
+        return e.code in (None, 0)
+    return True
+
+
+def run_unihan(options):
+    from .kanji_all import download_and_extract
+    return download_and_extract() is not None
+
+
+def run_irg_attributes(options):
+    from .irg_attributes import scrape_and_generate_json
+    return scrape_and_generate_json()
+
+
+def run_bundle(options):
+    if not fonttools_available():
+        print("fontTools absent (pip install fonttools) : lots non construits, la grille utilisera une police par glyphe.")
+        return True
+    return run_command('font_bundler', [])
+
+
+def fonttools_available():
+    import importlib.util
+    return importlib.util.find_spec('fontTools') is not None
+
+
+def grid_argv(options):
+    return ['--shard'] if options.shard else ['--render', options.render]
+
+
+def unihan_outputs(options):
+    from .kanji_all import UNIHAN_CACHE
+    return [UNIHAN_CACHE]
+
+
+def irg_attributes_outputs(options):
+    from .irg_attributes import OUTPUT_JSON
+    return [OUTPUT_JSON]
+
+
+def irg_fonts_outputs(options):
+    from .irg_fonts import OUTPUT_DIR, ZIP_NAME
+    return [OUTPUT_DIR, ZIP_NAME]
+
+
+def ext_j_fonts_outputs(options):
+    from .ext_j_fonts import OUTPUT_DIR, ZIP_NAME
+    return [OUTPUT_DIR, ZIP_NAME]
+
+
+def bundle_outputs(options):
+    from .font_bundler import BUNDLE_DIR
+    return [BUNDLE_DIR]
+
+
+def grid_inputs(options):
+    from .glyphwiki_source import DATA_DIR
+    from .kanji_all import IRG_DATA_FILE, UNIHAN_CACHE
+
+    return [UNIHAN_CACHE, IRG_DATA_FILE, DATA_DIR] + bundle_outputs(options) + package_code()
+
+
+def grid_outputs(options):
+    from .kanji_all import MANIFEST_FILE, OUTPUT_FILE, SEARCH_DIR, SHARD_DIR
+    if options.shard:
+        return [SHARD_DIR]
+    # Copies précompressées comprises (grid_payload) : .br absent sans brotli
+    return [OUTPUT_FILE, f"{OUTPUT_FILE}.gz", f"{OUTPUT_FILE}.br", MANIFEST_FILE, SEARCH_DIR]
+
+
+STAGES = [
+    Stage('unihan', run_unihan, "Téléchargement de Unihan.zip",
+          outputs=unihan_outputs, remote=True),
+    Stage('irg-attributes', run_irg_attributes, "Radicaux et traits IRG 2024",
+          outputs=irg_attributes_outputs, remote=True),
+    Stage('irg-fonts', lambda options: run_command('irg_fonts', []), "Polices IRG 2024",
+          outputs=irg_fonts_outputs, remote=True),
+    Stage('ext-j-fonts', lambda options: run_command('ext_j_fonts', []), "Polices de l'Extension J",
+          outputs=ext_j_fonts_outputs, remote=True),
+    Stage('bundle', run_bundle, "Lots de polices à code points privés",
+          deps=('irg-fonts', 'ext-j-fonts'),
+          inputs=lambda options: irg_fonts_outputs(options) + ext_j_fonts_outputs(options) + package_code(),
+          outputs=bundle_outputs, params=lambda options: {'fonttools': fonttools_available()}),
+    Stage('grid', lambda options: run_command('kanji_all', grid_argv(options)), "Grille de tous les kanji",
+          deps=('unihan', 'irg-attributes', 'bundle'),
+          inputs=grid_inputs, outputs=grid_outputs, params=grid_argv),
+]
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+
+def resolve_paths(paths, options):
+    return paths(options) if callable(paths) else list(paths)
+
+
+def iter_files(path):
+    # (chemin relatif, chemin) de chaque fichier d'un dossier, dans un ordre stable
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for name in sorted(files):
+            if not name.endswith(IGNORED_SUFFIXES):
+                full = os.path.join(root, name)
+                yield os.path.relpath(full, path).replace(os.sep, '/'), full
+
+
+def hash_paths(paths, extra=None):
+    # Empreinte du contenu de fichiers et de dossiers (absents compris) + valeurs JSON
+    from .table_cache import hash_bytes, hash_file
+
+    parts = [json.dumps(extra, sort_keys=True)]
+    for path in paths:
+        if os.path.isdir(path):
+            parts.append(f"{path}/")
+            parts.extend(f"{rel}={hash_file(full)}" for rel, full in iter_files(path))
+        else:
+            parts.append(f"{path}={hash_file(path)}")
+    return hash_bytes("\n".join(parts).encode('utf-8'))
+
+
+def input_digest(stage, options):
+    params = stage.params(options) if stage.params else None
+    return hash_paths(resolve_paths(stage.inputs, options), {'stage': stage.name, 'params': params})
+
+
+def output_digest(stage, options):
+    return hash_paths(resolve_paths(stage.outputs, options))
+
+
+def load_state(path=STATE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if state.get('format') != STATE_FORMAT:
+        return {}
+    return state.get('stages', {})
+
+
+def save_state(stages, path=STATE_FILE):
+    from .glyph_downloader import write_json_atomic
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_json_atomic(path, {'format': STATE_FORMAT, 'stages': stages})
+
+
+def stale_reason(stage, options, previous, inputs):
+    # None si l'étape peut être ignorée, sinon la raison de l'exécuter
+    if options.force:
+        return "--force"
+    if previous is None:
+        return "jamais exécutée"
+    if previous.get('inputs') != inputs:
+        return "entrées modifiées"
+    if previous.get('outputs') != output_digest(stage, options):
+        return "sorties modifiées ou absentes"
+    if stage.remote and time.time() - previous.get('time', 0) > options.ttl_days * 86400:
+        return f"source en ligne vérifiée il y a plus de {options.ttl_days:g} jours"
+    return None
+
+
+def select_stages(targets):
+    # Étapes demandées et toutes leurs dépendances, dans l'ordre de STAGES
+    selected, pending = set(), list(targets or STAGES_BY_NAME)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(STAGES_BY_NAME[name].deps)
+    return [stage for stage in STAGES if stage.name in selected]
+
+
+class StageOutput:
+    # Remplace sys.stdout pendant le pipeline : chaque ligne est préfixée par le
+    # nom de l'étape qui l'écrit, et les lignes des étapes parallèles ne se
+    # mélangent pas. Le nom est une variable de contexte : les threads lancés
+    # par une étape avec contextvars.copy_context() (voir GlyphDownloader.run)
+    # en héritent.
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()     # Fin de ligne en attente, par thread
+        self._lock = threading.Lock()
+
+    def begin(self, name):
+        return STAGE_NAME.set(name)
+
+    def end(self, token):
+        if getattr(self._local, 'pending', ''):
+            self.write('\n')
+        STAGE_NAME.reset(token)
+
+    def write(self, text):
+        name = STAGE_NAME.get()
+        if name is None:
+            with self._lock:
+                return self.stream.write(text)
+        *lines, self._local.pending = (getattr(self._local, 'pending', '') + text).split('\n')
+        if lines:
+            with self._lock:
+                self.stream.write(''.join(f"[{name}] {line}\n" for line in lines))
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def execute_stage(stage, options, previous, output):
+    # Exécutée dans un thread du pool : (état, raison, nouvelle entrée de STATE_FILE ou None)
+    token = output.begin(stage.name)
+    try:
+        inputs = input_digest(stage, options)
+        reason = stale_reason(stage, options, previous, inputs)
+        if reason is None:
+            return SKIPPED, None, previous
+        print(f"--- {stage.label} ({reason}) ---")
+        start = time.time()
+        try:
+            ok = stage.run(options)
+        except Exception as e:
+            print(f"[ERREUR] {type(e).__name__}: {e}")
+            ok = False
+        if not ok:
+            return FAILED, reason, None
+        print(f"--- {stage.label} : terminé en {time.time() - start:.1f} s ---")
+        entry = {'inputs': inputs, 'outputs': output_digest(stage, options), 'time': time.time()}
+        return DONE, reason, entry
+    finally:
+        output.end(token)
+
+
+def run_pipeline(options, state_path=STATE_FILE):
+    # Exécute les étapes sélectionnées dès que leurs dépendances ont réussi ;
+    # renvoie {nom: état}
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    from graphlib import TopologicalSorter
+
+    stages = select_stages(options.stages)
+    names = {stage.name for stage in stages}
+    sorter = TopologicalSorter({stage.name: [d for d in stage.deps if d in names] for stage in stages})
+    sorter.prepare()
+    state = load_state(state_path)
+    results = {}
+
+    output = StageOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=options.workers) as pool:
+            running = {}
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    stage = STAGES_BY_NAME[name]
+                    if any(results.get(dep) in (FAILED, BLOCKED) for dep in stage.deps):
+                        results[name] = BLOCKED
+                        sorter.done(name)
+                        continue
+                    running[pool.submit(execute_stage, stage, options, state.get(name), output)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    results[name], _, entry = future.result()
+                    if entry is None:
+                        state.pop(name, None)
+                    else:
+                        state[name] = entry
+                    save_state(state, state_path)
+                    sorter.done(name)
+    finally:
+        sys.stdout = output.stream
+    return {stage.name: results[stage.name] for stage in stages}
+
+
+def plan(options, state_path=STATE_FILE):
+    # (étape, raison ou None) d'après les fichiers actuels, sans rien exécuter.
+    # Les étapes en aval d'une étape à exécuter peuvent encore changer de statut.
+    state = load_state(state_path)
+    return [(stage, stale_reason(stage, options, state.get(stage.name), input_digest(stage, options)))
+            for stage in select_stages(options.stages)]
+
+
+def parse_args(argv=None):
+    from .kanji_all import RENDER_MODES
+
+    parser = argparse.ArgumentParser(description="Chaîne complète : téléchargements, lots de polices et grille, "
+                                                 "en ignorant les étapes déjà à jour")
+    parser.add_argument('stages', nargs='*', metavar='étape',
+                        help=f"Étapes à exécuter avec leurs dépendances ({', '.join(STAGES_BY_NAME)} ; défaut : toutes)")
+    parser.add_argument('--force', action='store_true',
+                        help="Exécute toutes les étapes sélectionnées, même à jour")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Affiche les étapes à exécuter sans rien lancer")
+    parser.add_argument('--ttl-days', type=float, default=REMOTE_TTL_DAYS,
+                        help=f"Délai avant de revérifier les sources en ligne (défaut : {REMOTE_TTL_DAYS} jours)")
+    parser.add_argument('--workers', type=int, default=WORKERS,
+                        help=f"Étapes exécutées simultanément (défaut : {WORKERS})")
+    parser.add_argument('--render', choices=RENDER_MODES, default='static',
+                        help="Mode de rendu de la grille (voir kanji-all.py --help)")
+    parser.add_argument('--shard', action='store_true',
+                        help="Grille découpée en un fichier par radical (voir kanji-all.py --help)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.stages if name not in STAGES_BY_NAME]
+    if unknown:
+        parser.error(f"étape(s) inconnue(s) : {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.dry_run:
+        for stage, reason in plan(args):
+            print(f"   {stage.name:<15} {'à exécuter : ' + reason if reason else 'à jour'}")
+        return
+
+    start = time.time()
+    results = run_pipeline(args)
+    print(f"\n=== BILAN ({time.time() - start:.1f} s) ===")
+    for name, status in results.items():
+        print(f"   {name:<15} {status}")
+    if any(status in (FAILED, BLOCKED) for status in results.values()):
+        sys.exit(1)
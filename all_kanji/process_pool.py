@@ -0,0 +1,14 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Pools de processus démarrés sans fork() : le pipeline (pipeline.py) exécute
+# des étapes dans des threads, et un fork() depuis un processus à plusieurs
+# threads peut copier un verrou tenu par un autre thread (sortie préfixée,
+# pools du téléchargeur) et bloquer le processus enfant. forkserver (Linux) ou
+# spawn (Windows, macOS) partent d'un processus neuf.
+
+
+def process_pool(max_workers=None):
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
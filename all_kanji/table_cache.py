@@ -0,0 +1,49 @@
+import hashlib
+import marshal
+import os
+
+from .char_table import CharTable
+
+# Cache compilé de la table fusionnée (Unihan + IRG + GlyphWiki).
+# Format : dictionnaire marshal des colonnes de la CharTable (array.tobytes()
+# + listes de chaînes), bien plus compact et rapide à relire qu'un pickle de dicts.
+CACHE_FORMAT = 3
+
+
+def hash_file(path):
+    if not os.path.exists(path):
+        return 'absent'
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(*digests):
+    return hash_bytes(f"v{CACHE_FORMAT}|".encode('ascii') + "|".join(digests).encode('ascii'))
+
+
+def save_table(path, key, table):
+    payload = {'format': CACHE_FORMAT, 'key': key, 'columns': table.to_columns()}
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def load_table(path, key):
+    # Renvoie la CharTable, ou None si le cache est absent ou périmé
+    try:
+        with open(path, 'rb') as f:
+            payload = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get('format') != CACHE_FORMAT or payload.get('key') != key:
+        return None
+    return CharTable.from_columns(payload['columns'])
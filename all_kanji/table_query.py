@@ -0,0 +1,248 @@
+import argparse
+import array
+import bisect
+import heapq
+import re
+import sys
+from itertools import islice
+
+from .char_table import KIND_GLYPHWIKI, RAD_SHIFT, STROKE_OFFSET, STROKE_SHIFT
+from .cjk_blocks import BLOCK_STARTS, CJK_BLOCKS
+
+# Requêtes en mémoire sur la table fusionnée (CharTable), sans rendu HTML.
+# Toutes les lignes sont numérotées par leur rang dans l'ordre de la grille
+# (radical, traits, code point / rang GlyphWiki) ; chaque index est un tableau
+# trié de rangs ou de clés, interrogé par dichotomie :
+#   keys       : clé de tri de chaque rang -> intervalle de rangs pour radical + traits
+#   cps / cp_ranks : code points Unicode triés et rang de chacun
+#   categories : rangs triés de chaque bloc CJC et de chaque dictionnaire GlyphWiki
+# Une requête "radical 85, 9 à 11 traits, Ext B ou IRG" coûte quelques bisect
+# par catégorie, plus le nombre de résultats : aucune ligne n'est parcourue
+# en dehors de l'intervalle demandé.
+
+OTHER_CATEGORY = "Autres"   # Caractères Unicode hors des blocs CJC connus
+
+MIN_STROKES = -STROKE_OFFSET
+MAX_STROKES = (1 << (RAD_SHIFT - STROKE_SHIFT)) - 1 - STROKE_OFFSET
+
+
+class TableIndex:
+    __slots__ = ('table', 'order', 'keys', 'cps', 'cp_ranks', 'categories', 'category_of', 'category_list',
+                 'rank_categories')
+
+    def __init__(self, table):
+        self.table = table
+        keys = table.sort_keys()
+        self.order = array.array('I', sorted(range(len(keys)), key=keys.__getitem__))
+        self.keys = array.array('Q', [keys[row] for row in self.order])
+
+        # Catégories : blocs dans l'ordre de CJK_BLOCKS, OTHER_CATEGORY, puis dictionnaires
+        names = [block[2] for block in CJK_BLOCKS] + [OTHER_CATEGORY]
+        self.category_of = {name: i for i, name in enumerate(names)}
+        for key in table.sources[1:]:
+            self.category_of[key] = len(self.category_of)
+        self.category_list = list(self.category_of)
+        glyphwiki_base = len(names) - 1
+        self.categories = [array.array('I') for _ in self.category_of]
+        self.rank_categories = array.array('H')     # Catégorie de chaque rang (filtre des plages de code points)
+
+        unicode_cps, unicode_ranks = [], []
+        kind, source, cp = table.kind, table.source, table.cp
+        for rank, row in enumerate(self.order):
+            if kind[row] == KIND_GLYPHWIKI:
+                category = glyphwiki_base + source[row]
+            else:
+                code_point = cp[row]
+                category = bisect.bisect_right(BLOCK_STARTS, code_point) - 1
+                if category < 0 or code_point > CJK_BLOCKS[category][1]:
+                    category = len(CJK_BLOCKS)
+                unicode_cps.append(code_point)
+                unicode_ranks.append(rank)
+            self.categories[category].append(rank)
+            self.rank_categories.append(category)
+
+        by_cp = sorted(range(len(unicode_cps)), key=unicode_cps.__getitem__)
+        self.cps = array.array('Q', [unicode_cps[i] for i in by_cp])
+        self.cp_ranks = array.array('I', [unicode_ranks[i] for i in by_cp])
+
+    def __len__(self):
+        return len(self.order)
+
+    def category_names(self):
+        # Blocs et dictionnaires présents dans la table
+        return [name for name, ranks in zip(self.category_list, self.categories) if ranks]
+
+    def rank_intervals(self, rad=None, strokes=None):
+        # Intervalles [début, fin[ de rangs pour des radicaux et traits (entier ou (min, max) inclus)
+        if rad is None and strokes is None:
+            return [(0, len(self.keys))]
+        rad_lo, rad_hi = as_range(rad, 0, (1 << (64 - RAD_SHIFT)) - 1)
+        str_lo, str_hi = as_range(strokes, MIN_STROKES, MAX_STROKES)
+        str_lo, str_hi = max(str_lo, MIN_STROKES), min(str_hi, MAX_STROKES)
+        if rad_lo > rad_hi or str_lo > str_hi:
+            return []
+        if strokes is None:
+            # Radicaux consécutifs : un seul intervalle de clés
+            return [self.key_interval(rad_lo, MIN_STROKES, rad_hi + 1, MIN_STROKES)]
+        intervals = []
+        # Radicaux présents dans la plage seulement (sauts par bisect, pas un tour par radical possible)
+        rank = self.key_interval(rad_lo, MIN_STROKES, rad_lo, MIN_STROKES)[0]
+        while rank < len(self.keys):
+            current = self.keys[rank] >> RAD_SHIFT
+            if current > rad_hi:
+                break
+            start, end = self.key_interval(current, str_lo, current, str_hi + 1)
+            if start < end:
+                intervals.append((start, end))
+            rank = self.key_interval(current + 1, MIN_STROKES, current + 1, MIN_STROKES)[0]
+        return intervals
+
+    def key_interval(self, rad_lo, str_lo, rad_hi, str_hi):
+        # Rangs dont la clé est dans [(rad_lo, str_lo), (rad_hi, str_hi)[ ; addition et non |
+        # pour que traits max + 1 déborde sur le radical suivant
+        lo = (rad_lo << RAD_SHIFT) + ((str_lo + STROKE_OFFSET) << STROKE_SHIFT)
+        hi = (rad_hi << RAD_SHIFT) + ((str_hi + STROKE_OFFSET) << STROKE_SHIFT)
+        return bisect.bisect_left(self.keys, lo), bisect.bisect_left(self.keys, hi)
+
+    def category_ids(self, names):
+        ids = []
+        for name in names:
+            if name not in self.category_of:
+                raise KeyError(f"bloc ou dictionnaire inconnu : {name} (connus : {', '.join(self.category_names())})")
+            ids.append(self.category_of[name])
+        return list(dict.fromkeys(ids))
+
+    def iter_ranks(self, rad=None, strokes=None, categories=None, cp=None):
+        # Rangs correspondants, dans l'ordre de la grille
+        intervals = self.rank_intervals(rad, strokes)
+        ids = None if categories is None else self.category_ids(categories)
+        if cp is not None:
+            # Plage de code points : candidats triés par rang, filtrés par dichotomie
+            cp_lo, cp_hi = as_range(cp, 0, 0x10FFFF)
+            lo, hi = bisect.bisect_left(self.cps, cp_lo), bisect.bisect_right(self.cps, cp_hi)
+            candidates = sorted(self.cp_ranks[lo:hi])
+            allowed = None if ids is None else set(ids)
+            for start, end in intervals:
+                for rank in candidates[bisect.bisect_left(candidates, start):bisect.bisect_left(candidates, end)]:
+                    if allowed is None or self.rank_categories[rank] in allowed:
+                        yield rank
+            return
+        for start, end in intervals:
+            if ids is None:
+                yield from range(start, end)
+                continue
+            slices = []
+            for i in ids:
+                ranks = self.categories[i]
+                slices.append(ranks[bisect.bisect_left(ranks, start):bisect.bisect_left(ranks, end)])
+            yield from heapq.merge(*slices) if len(slices) > 1 else slices[0]
+
+    def query(self, rad=None, strokes=None, categories=None, cp=None, limit=None):
+        # Indices de lignes de la table (ordre de la grille), au plus limit
+        ranks = self.iter_ranks(rad, strokes, categories, cp)
+        return [self.order[rank] for rank in islice(ranks, limit)]
+
+    def count(self, rad=None, strokes=None, categories=None, cp=None):
+        if cp is None:
+            intervals = self.rank_intervals(rad, strokes)
+            if categories is None:
+                return sum(end - start for start, end in intervals)
+            # Effectifs par dichotomie seule, sans énumérer les rangs
+            total = 0
+            for i in self.category_ids(categories):
+                ranks = self.categories[i]
+                total += sum(bisect.bisect_left(ranks, end) - bisect.bisect_left(ranks, start)
+                             for start, end in intervals)
+            return total
+        return sum(1 for _ in self.iter_ranks(rad, strokes, categories, cp))
+
+    def rank_category(self, rank):
+        # Bloc CJC ou dictionnaire GlyphWiki d'un rang
+        return self.category_list[self.rank_categories[rank]]
+
+
+def as_range(value, low, high):
+    # None -> (low, high) ; entier -> (n, n) ; (min, max) inclus, None pour une borne ouverte
+    if value is None:
+        return low, high
+    if isinstance(value, int):
+        return value, value
+    lo, hi = value
+    return (low if lo is None else lo), (high if hi is None else hi)
+
+
+RANGE_RE = re.compile(r"^(-?\d*)(?:(\.\.|-)(-?\d*))?$")
+CP_RANGE_RE = re.compile(r"^(?:U\+)?([0-9A-Fa-f]*)(?:(\.\.|-)(?:U\+)?([0-9A-Fa-f]*))?$")
+
+
+def parse_range(text, pattern=RANGE_RE, base=10):
+    # "85" ; "9-11" ou "9..11" ; "9-" (borne ouverte) ; "-1..3" pour des traits négatifs
+    match = pattern.match(text.strip())
+    if not match or not (match.group(1) or match.group(3)):
+        raise argparse.ArgumentTypeError(f"plage invalide : {text!r}")
+    lo = int(match.group(1), base) if match.group(1) not in ('', '-') else None
+    if match.group(2) is None:
+        return lo, lo
+    hi = int(match.group(3), base) if match.group(3) not in ('', '-') else None
+    return lo, hi
+
+
+def parse_cp_range(text):
+    if len(text) == 1 and ord(text) > 0x7F:
+        return ord(text), ord(text)
+    return parse_range(text, CP_RANGE_RE, 16)
+
+
+def load_index(refresh=False):
+    # Table fusionnée (cache compilé si à jour, voir kanji_all.build_table) ; la
+    # progression part sur stderr pour garder stdout aux résultats
+    import contextlib
+    from .kanji_all import build_table
+
+    with contextlib.redirect_stdout(sys.stderr):
+        table = build_table(refresh=refresh)
+    return TableIndex(table) if table else None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Recherche dans la table fusionnée (radical, traits, "
+                                                 "code point, bloc, dictionnaire)")
+    parser.add_argument('--rad', type=parse_range,
+                        help="Radical ou plage de radicaux (ex : 85, 85-86)")
+    parser.add_argument('--strokes', type=parse_range,
+                        help="Traits restants ou plage (ex : 9-11, 20-)")
+    parser.add_argument('--cp', type=parse_cp_range,
+                        help="Code point, caractère ou plage (ex : U+6C34, 水, 4E00-4FFF)")
+    parser.add_argument('--block', action='append', dest='categories', metavar='BLOC',
+                        help="Bloc CJC (ex : \"Ext B\") ; répétable, les blocs et dictionnaires s'additionnent")
+    parser.add_argument('--source', action='append', dest='categories', metavar='DICTIONNAIRE',
+                        help="Dictionnaire GlyphWiki (ex : irg2024, dkw) ; répétable")
+    parser.add_argument('--limit', type=int, default=None,
+                        help="Nombre maximal de résultats affichés")
+    parser.add_argument('--count', action='store_true',
+                        help="Affiche seulement le nombre de résultats")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Ignore la table compilée et revérifie Unihan.zip en ligne")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    index = load_index(refresh=args.refresh)
+    if index is None:
+        print("ERREUR: table indisponible (Unihan.zip introuvable).", file=sys.stderr)
+        sys.exit(1)
+    try:
+        if args.count:
+            print(index.count(args.rad, args.strokes, args.categories, args.cp))
+            return
+        ranks = list(islice(index.iter_ranks(args.rad, args.strokes, args.categories, args.cp), args.limit))
+    except KeyError as e:
+        print(f"ERREUR: {e.args[0]}", file=sys.stderr)
+        sys.exit(2)
+    table = index.table
+    # Une ligne TSV par résultat : code, caractère, radical, traits, bloc ou dictionnaire
+    for rank in ranks:
+        row = index.order[rank]
+        print(f"{table.display_code(row)}\t{table.char(row)}\t{table.rad[row]}\t{table.strokes[row]}\t"
+              f"{index.rank_category(rank)}")
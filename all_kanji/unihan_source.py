@@ -0,0 +1,81 @@
+import re
+import zipfile
+
+# Fichiers Unihan contenant chaque champ : seuls ceux-là sont ouverts.
+# (kRSUnicode est dans IRGSources depuis Unicode 15.1, RadicalStrokeCounts avant)
+FIELD_MEMBERS = {
+    'kRSUnicode': ('Unihan_IRGSources.txt', 'Unihan_RadicalStrokeCounts.txt'),
+}
+
+# Motifs précompilés appliqués directement sur les octets (aucun décodage ligne par ligne).
+# Même sémantique que l'ancien re.match(r"(\d+)'?\.(\-?\d+)") sur la 3e colonne.
+RS_UNICODE_RE = re.compile(rb"^U\+([0-9A-F]{4,6})\tkRSUnicode\t(\d+)'?\.(-?\d+)", re.M)
+
+
+def is_unihan_member(name):
+    if name.endswith('/') or name.startswith('__MACOSX') or '/.' in name:
+        return False
+    base = name.rsplit('/', 1)[-1]
+    return base.startswith('Unihan_') and "ReadMe" not in base and "History" not in base
+
+
+def members_for(z, field):
+    # Membres connus pour contenir le champ, puis les autres en secours
+    # (au cas où une future version d'Unihan déplacerait le champ).
+    names = [n for n in z.namelist() if is_unihan_member(n)]
+    known = FIELD_MEMBERS.get(field, ())
+    preferred = [n for n in names if n.rsplit('/', 1)[-1] in known]
+    others = [n for n in names if n not in preferred]
+    return preferred, others
+
+
+def iter_rs_unicode(zip_path):
+    # Renvoie (code_point, radical, traits) pour chaque entrée kRSUnicode
+    needle = b'\tkRSUnicode\t'
+    with zipfile.ZipFile(zip_path) as z:
+        preferred, others = members_for(z, 'kRSUnicode')
+        found = False
+        for group in (preferred, others):
+            if found:
+                break
+            for name in group:
+                data = z.read(name)
+                if needle not in data:
+                    continue
+                found = True
+                for m in RS_UNICODE_RE.finditer(data):
+                    yield int(m.group(1), 16), int(m.group(2)), int(m.group(3))
+
+
+def iter_rs_unicode_legacy(zip_path):
+    # Ancienne méthode (tous les fichiers, décodage et découpage de chaque ligne).
+    # Conservée comme référence pour benchmarks/bench_unihan_parser.py.
+    with zipfile.ZipFile(zip_path) as z:
+        file_list = [n for n in z.namelist() if not n.endswith('/') and not n.startswith('__MACOSX') and not '/.' in n]
+
+        for filename in file_list:
+            if not filename.startswith('Unihan_'):
+                continue
+            if "ReadMe" in filename or "History" in filename:
+                continue
+
+            with z.open(filename) as f:
+                for line in f:
+                    try:
+                        line_str = line.decode('utf-8').strip()
+                    except:
+                        continue
+                    if not line_str or line_str.startswith('#'):
+                        continue
+
+                    parts = line_str.split('\t')
+                    if len(parts) >= 3 and parts[1] == 'kRSUnicode':
+                        try:
+                            code_point = int(parts[0].replace('U+', ''), 16)
+                            chr(code_point)
+                            match = re.match(r"(\d+)'?\.(\-?\d+)", parts[2])
+                            if not match:
+                                continue
+                            yield code_point, int(match.group(1)), int(match.group(2))
+                        except Exception:
+                            continue
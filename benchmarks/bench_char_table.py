@@ -0,0 +1,83 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_kanji.char_table import CharTable
+from all_kanji.cjk_blocks import needs_custom_font
+from all_kanji.unihan_source import iter_rs_unicode
+from fixtures import synthetic_unihan
+
+# Compare la liste de dicts historique à la CharTable en colonnes :
+#   python benchmarks/bench_char_table.py [--zip cache/Unihan.zip]
+
+
+def build_dicts(records):
+    # Construction historique de cjk_map (une dict par caractère)
+    cjk_map = []
+    for code_point, rad, strokes in records:
+        if 0x323B0 <= code_point <= 0x3347F:
+            hex_code_lower = hex(code_point)[2:].lower()
+            cjk_map.append({
+                'rad': rad, 'str': strokes, 'cp': code_point, 'char': '〓',
+                'type': 'U_CUSTOM_FONT',
+                'display_code': f"U+{hex(code_point).upper()[2:]}",
+                'font_file': f"u{hex_code_lower}.ttf",
+                'font_family': f"U_CUSTOM_FONT_{hex(code_point).upper()[2:]}"
+            })
+        else:
+            cjk_map.append({'rad': rad, 'str': strokes, 'cp': code_point,
+                            'char': chr(code_point), 'type': 'U', 'font_file': None})
+    cjk_map.sort(key=lambda x: (x['rad'], x['str'], x['cp']))
+    return cjk_map
+
+
+def build_table(records):
+    table = CharTable()
+    for code_point, rad, strokes in records:
+        table.append_unicode(code_point, rad, strokes, custom_font=needs_custom_font(code_point))
+    order = table.sort_order()
+    return table, order
+
+
+def measure(func, records, repeat=3):
+    # Temps mesuré sans tracemalloc (qui ralentit les allocations), puis pic mémoire
+    elapsed = min(timed(func, records) for _ in range(repeat))
+    tracemalloc.start()
+    result = func(records)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def timed(func, records):
+    start = time.perf_counter()
+    func(records)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mémoire / temps : dicts vs CharTable")
+    parser.add_argument('--zip', help="Archive Unihan.zip (défaut : cache/Unihan.zip, sinon archive synthétique)")
+    args = parser.parse_args()
+
+    path = args.zip or "cache/Unihan.zip"
+    if not os.path.exists(path):
+        path = synthetic_unihan(os.path.join(tempfile.gettempdir(), "Unihan-synthetic.zip"))
+    records = list(iter_rs_unicode(path))
+    print(f"{len(records)} caractères ({path})")
+
+    dict_time, dict_peak, _ = measure(build_dicts, records)
+    table_time, table_peak, _ = measure(build_table, records)
+
+    print(f"   Liste de dicts : {dict_time * 1000:8.1f} ms, pic mémoire {dict_peak / 1024 / 1024:7.1f} MB")
+    print(f"   CharTable      : {table_time * 1000:8.1f} ms, pic mémoire {table_peak / 1024 / 1024:7.1f} MB")
+    print(f"   Gain           : temps x{dict_time / table_time:.1f}, mémoire x{dict_peak / table_peak:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_kanji.glyphwiki_source import iter_entries, iter_tsv, load_glyphwiki_sources
+from fixtures import synthetic_glyphwiki_data
+
+# Chargement des glyphes GlyphWiki manuels : ancien littéral Python (liste de
+# dicts compilée à chaque import), TSV validés et compilés (premier lancement),
+# puis cache marshal (lancements suivants) :
+#   python benchmarks/bench_glyphwiki_data.py [--rows 50000]
+
+
+def literal_source(data_dir):
+    # Même contenu sous la forme de l'ancien RAW_GLYPHWIKI_DATA
+    lines = ["RAW_GLYPHWIKI_DATA = ["]
+    for name in sorted(os.listdir(data_dir)):
+        if name == "sources.tsv":
+            continue
+        for _, (ident, rad, strokes) in iter_tsv(os.path.join(data_dir, name), ["id", "rad", "str"]):
+            lines.append(f"    {{'source': '{name[:-4]}', 'id': '{ident}', 'rad': {rad}, 'str': {strokes}, "
+                         f"'has_unicode_sim': False}},")
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def timed(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du chargement des données GlyphWiki manuelles")
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp(prefix="glyphwiki-bench-")
+    try:
+        data_dir = synthetic_glyphwiki_data(os.path.join(work, "glyphwiki"), rows=args.rows)
+        cache_path = os.path.join(work, "glyphwiki_data.bin")
+        source = literal_source(data_dir)
+
+        def literal():
+            namespace = {}
+            exec(compile(source, "glyphwiki_data.py", "exec"), namespace)
+            return namespace["RAW_GLYPHWIKI_DATA"]
+
+        def first_run():
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            return load_glyphwiki_sources(cache_path, data_dir)
+
+        literal_time, rows = timed(literal, args.repeat)
+        compile_time, compiled = timed(first_run, args.repeat)
+        cached_time, cached = timed(lambda: load_glyphwiki_sources(cache_path, data_dir), args.repeat)
+
+        if list(iter_entries(cached)) != list(iter_entries(compiled)) or len(rows) != len(compiled['ident']):
+            print("ERREUR : le cache ne redonne pas les données compilées")
+            sys.exit(1)
+
+        print(f"{len(rows)} glyphes, TSV {sum(os.path.getsize(os.path.join(data_dir, n)) for n in os.listdir(data_dir)) / 1024:.0f} KB, "
+              f"cache {os.path.getsize(cache_path) / 1024:.0f} KB")
+        print(f"   Littéral Python (à chaque import) : {literal_time * 1000:8.1f} ms")
+        print(f"   TSV validés + compilation         : {compile_time * 1000:8.1f} ms (premier lancement)")
+        print(f"   Cache marshal                     : {cached_time * 1000:8.1f} ms (lancements suivants)")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_kanji.irg_source import parse_irg_file, parse_irg_page_legacy
+from fixtures import synthetic_irg_page
+
+# Compare l'extracteur en flux (lignes <tr> découpées bloc par bloc) à l'ancien découpage
+# de la page entière sur </tr>, en temps et en pic mémoire :
+#   python benchmarks/bench_irg_scraper.py [--page cache/irg2024_list.html]
+
+
+def legacy(path):
+    with open(path, 'rb') as f:
+        return parse_irg_page_legacy(f.read().decode('utf-8'))
+
+
+def streaming(path):
+    data = {}
+    parse_irg_file(path, lambda char_id, rad, strokes: data.__setitem__(char_id, {'rad': rad, 'str': strokes}))
+    return data
+
+
+def measure(func, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'extracteur IRG 2024 (flux vs ancien)")
+    parser.add_argument('--page', help="Page list.php enregistrée (défaut : cache/irg2024_list.html, sinon page synthétique)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.page or "cache/irg2024_list.html"
+    if not os.path.exists(path):
+        path = synthetic_irg_page(os.path.join(tempfile.gettempdir(), "irg2024-list-synthetic.html"))
+    print(f"Page : {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+    legacy_time, legacy_peak, old = measure(legacy, path, args.repeat)
+    stream_time, stream_peak, new = measure(streaming, path, args.repeat)
+
+    if new != old:
+        diff = sum(1 for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+        print(f"ERREUR : {diff} entrées différentes ({len(new)} contre {len(old)})")
+        sys.exit(1)
+
+    print(f"   Ancien (page entière) : {legacy_time * 1000:8.1f} ms, pic {legacy_peak / 1024 / 1024:6.2f} MB "
+          f"({len(old)} entrées)")
+    print(f"   Flux (bloc par bloc)  : {stream_time * 1000:8.1f} ms, pic {stream_peak / 1024 / 1024:6.2f} MB "
+          f"({len(new)} entrées)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_kanji.cjk_blocks import block_font_faces
+from all_kanji.grid_render import paginate, render_dynamic, render_static, render_virtual
+from fixtures import synthetic_table
+
+# Benchmark structurel du rendu (sans navigateur) :
+#   python benchmarks/bench_render.py [--zip cache/Unihan.zip]
+# Objectif « premier affichage » du rendu statique : aucun script de construction
+# des feuilles (seul le petit chargeur de polices à la demande est autorisé),
+# toutes les feuilles déjà présentes dans le HTML, aucune règle @font-face par
+# glyphe (seuls les alias par bloc CJC de cjk_blocks.py).
+
+FONT_STACK = 'serif'
+SCRIPT_RE = re.compile(r'<script>(.*?)</script>', re.S)
+FONT_LOADER_RE = re.compile(r'<script id="font-loader">(.*?)</script>', re.S)
+SHEET_RE = re.compile(r'<div class="sheet"[ >]')
+
+
+def measure(render, table, order):
+    start = time.perf_counter()
+    html = render(table, order, FONT_STACK)
+    return time.perf_counter() - start, html
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark structurel du rendu HTML")
+    parser.add_argument('--zip', help="Archive Unihan.zip (défaut : cache/Unihan.zip, sinon archive synthétique)")
+    args = parser.parse_args()
+
+    table = synthetic_table(args.zip or "cache/Unihan.zip")
+    order = table.sort_order()
+    expected_sheets = len(paginate(table, order))
+    print(f"{len(table)} caractères, {expected_sheets} feuilles attendues")
+
+    failures = []
+    for name, render in (("dynamic", render_dynamic), ("static", render_static), ("virtual", render_virtual)):
+        elapsed, html = measure(render, table, order)
+        sheets = len(SHEET_RE.findall(html))
+        script_bytes = sum(len(s.encode('utf-8')) for s in SCRIPT_RE.findall(html))
+        loader_bytes = sum(len(s.encode('utf-8')) for s in FONT_LOADER_RE.findall(html))
+        font_faces = html.count('@font-face') - len(block_font_faces())
+        print(f"   {name:8s}: {elapsed * 1000:7.0f} ms, {len(html.encode('utf-8')) / 1024 / 1024:6.2f} MB, "
+              f"{sheets} feuilles dans le HTML, {script_bytes / 1024:8.1f} KB de script au chargement, "
+              f"manifeste des polices {loader_bytes / 1024:.1f} KB, {font_faces} @font-face par glyphe")
+        if font_faces:
+            failures.append(f"{name} : {font_faces} règles @font-face")
+        if name == "static":
+            if sheets != expected_sheets:
+                failures.append(f"{sheets} feuilles au lieu de {expected_sheets}")
+            if script_bytes:
+                failures.append(f"{script_bytes} octets de script au chargement")
+
+    if failures:
+        print("ÉCHEC objectif premier affichage : " + "; ".join(failures))
+        sys.exit(1)
+    print("Objectif premier affichage atteint : feuilles pré-rendues, polices chargées à la demande.")
+
+
+if __name__ == "__main__":
+    main()
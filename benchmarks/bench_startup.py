@@ -0,0 +1,77 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Temps de démarrage : import du paquet et --help de chaque commande, comparés
+# au lancement d'un interpréteur vide (processus séparés, meilleur de N) :
+#   python benchmarks/bench_startup.py [--repeat 10] [--budget-ms 50]
+
+CASES = [
+    ("import all_kanji", ['-c', 'import all_kanji']),
+    ("import all_kanji.kanji_all", ['-c', 'import all_kanji.kanji_all']),
+    ("python -m all_kanji --help", ['-m', 'all_kanji', '--help']),
+    ("kanji-all.py --help", ['kanji-all.py', '--help']),
+    ("irg2024-attributes.py --help", ['irg2024-attributes.py', '--help']),
+    ("IRG2024-fonts.py --help", ['IRG2024-fonts.py', '--help']),
+    ("fonts-glyphwiki-for-unicode-ext-J.py --help", ['fonts-glyphwiki-for-unicode-ext-J.py', '--help']),
+    ("pipeline.py --help", ['pipeline.py', '--help']),
+    ("query.py --help", ['query.py', '--help']),
+]
+
+# Modules qui ne doivent pas être chargés par un simple import ou --help
+HEAVY_MODULES = ('all_kanji.glyphwiki_source', 'all_kanji.grid_render', 'all_kanji.glyph_downloader',
+                 'all_kanji.http_cache', 'concurrent.futures', 'urllib.request')
+
+
+def best_of(args, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def loaded_heavy_modules():
+    code = ("import sys, all_kanji.kanji_all, all_kanji.irg_attributes, all_kanji.irg_fonts, "
+            "all_kanji.ext_j_fonts, all_kanji.pipeline, all_kanji.table_query; print(' '.join(sys.modules))")
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout.split()
+    return [name for name in HEAVY_MODULES if name in out]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage (import du paquet, --help)")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=50,
+                        help="Surcoût maximal toléré par rapport à l'interpréteur vide (ms)")
+    args = parser.parse_args()
+
+    baseline = best_of(['-c', 'pass'], args.repeat)
+    print(f"   {'interpréteur vide':45s} {baseline * 1000:7.1f} ms")
+    over = []
+    for label, case in CASES:
+        elapsed = best_of(case, args.repeat)
+        extra = (elapsed - baseline) * 1000
+        print(f"   {label:45s} {elapsed * 1000:7.1f} ms (+{extra:.1f} ms)")
+        if extra > args.budget_ms:
+            over.append(label)
+
+    heavy = loaded_heavy_modules()
+    if heavy:
+        print(f"ERREUR : modules chargés dès l'import : {', '.join(heavy)}")
+        sys.exit(1)
+    if over:
+        print(f"ERREUR : budget de {args.budget_ms:.0f} ms dépassé : {', '.join(over)}")
+        sys.exit(1)
+    print(f"Démarrage dans le budget (+{args.budget_ms:.0f} ms max), aucun module lourd chargé à l'import.")
+
+
+if __name__ == "__main__":
+    main()
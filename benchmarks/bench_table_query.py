@@ -0,0 +1,83 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_kanji.cjk_blocks import block_of
+from all_kanji.table_query import TableIndex
+from fixtures import synthetic_table
+
+# Latence des requêtes indexées (bisect) comparée à un parcours linéaire de la
+# table, sur ~100k lignes synthétiques :
+#   python benchmarks/bench_table_query.py [--repeat 200]
+
+QUERIES = [
+    ("radical 85, 9-11 traits, Ext B + IRG", dict(rad=85, strokes=(9, 11), categories=["Ext B", "irg2024"])),
+    ("radical 85", dict(rad=85)),
+    ("radicaux 30-40, 5 traits", dict(rad=(30, 40), strokes=5)),
+    ("20 traits et plus, dkw", dict(strokes=(20, None), categories=["dkw"])),
+    ("U+4E00-U+4FFF, radical 1-50", dict(rad=(1, 50), cp=(0x4E00, 0x4FFF))),
+    ("bloc Ext J", dict(categories=["Ext J"])),
+]
+
+
+def linear_query(table, rad=None, strokes=None, categories=None, cp=None):
+    # Référence : filtre de chaque ligne puis tri dans l'ordre de la grille
+    def in_range(value, bounds):
+        if bounds is None:
+            return True
+        if isinstance(bounds, int):
+            return value == bounds
+        lo, hi = bounds
+        return (lo is None or value >= lo) and (hi is None or value <= hi)
+
+    def category(i):
+        if table.kind[i] == 2:
+            return table.sources[table.source[i]]
+        block = block_of(table.cp[i])
+        return block[2] if block else None
+
+    rows = [i for i in range(len(table))
+            if in_range(table.rad[i], rad) and in_range(table.strokes[i], strokes)
+            and (cp is None or (table.kind[i] != 2 and in_range(table.cp[i], cp)))
+            and (categories is None or category(i) in categories)]
+    return sorted(rows, key=table.sort_key)
+
+
+def best_of(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des requêtes indexées sur la table fusionnée")
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--zip', help="Archive Unihan.zip (défaut : archive synthétique)")
+    args = parser.parse_args()
+
+    table = synthetic_table(args.zip, glyphwiki_per_source=1000)
+    start = time.perf_counter()
+    index = TableIndex(table)
+    print(f"{len(table)} lignes, index construit en {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for label, query in QUERIES:
+        indexed_time, rows = best_of(lambda: index.query(**query), args.repeat)
+        count_time, count = best_of(lambda: index.count(**query), args.repeat)
+        linear_time, expected = best_of(lambda: linear_query(table, **query), 1)
+        if rows != expected or count != len(expected):
+            print(f"ERREUR : résultats différents pour « {label} »")
+            sys.exit(1)
+        print(f"   {label:<40} {len(rows):6d} résultats : index {indexed_time * 1e6:9.1f} µs, "
+              f"count {count_time * 1e6:7.1f} µs, parcours {linear_time * 1e6:10.0f} µs "
+              f"(x{linear_time / indexed_time:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from all_kanji.unihan_source import iter_rs_unicode, iter_rs_unicode_legacy
+from fixtures import synthetic_unihan
+
+# Compare le parseur rapide à l'ancien sur la même archive :
+#   python benchmarks/bench_unihan_parser.py [--zip cache/Unihan.zip]
+
+
+def best_of(func, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = list(func(path))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du parseur Unihan (rapide vs ancien)")
+    parser.add_argument('--zip', help="Archive Unihan.zip (défaut : cache/Unihan.zip, sinon archive synthétique)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.zip or "cache/Unihan.zip"
+    if not os.path.exists(path):
+        path = synthetic_unihan(os.path.join(tempfile.gettempdir(), "Unihan-synthetic.zip"))
+    print(f"Archive : {path} ({os.path.getsize(path) / 1024 / 1024:.2f} MB)")
+
+    legacy_time, legacy = best_of(iter_rs_unicode_legacy, path, args.repeat)
+    fast_time, fast = best_of(iter_rs_unicode, path, args.repeat)
+
+    if fast != legacy:
+        print(f"ERREUR : résultats différents ({len(fast)} contre {len(legacy)} entrées)")
+        sys.exit(1)
+
+    print(f"   Ancien parseur : {legacy_time * 1000:8.1f} ms ({len(legacy)} entrées)")
+    print(f"   Parseur rapide : {fast_time * 1000:8.1f} ms ({len(fast)} entrées)")
+    print(f"   Accélération   : x{legacy_time / fast_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
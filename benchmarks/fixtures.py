@@ -0,0 +1,110 @@
+import os
+import random
+import zipfile
+
+# Données synthétiques pour les benchmarks (aucun accès réseau nécessaire)
+
+UNIHAN_RANGES = [(0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAD9), (0x20000, 0x2A6DF),
+                 (0x2A700, 0x2B739), (0x2B740, 0x2B81D), (0x2B820, 0x2CEA1), (0x2CEB0, 0x2EBE0),
+                 (0x30000, 0x3134A), (0x31350, 0x323AF), (0x323B0, 0x3347F)]
+
+# Champs présents dans les autres fichiers, pour que l'archive ait un volume réaliste
+FILLER_MEMBERS = {
+    'Unihan_DictionaryIndices.txt': ('kHanYu', 'kKangXi', 'kMorohashi'),
+    'Unihan_DictionaryLikeData.txt': ('kCangjie', 'kPhonetic', 'kTotalStrokes'),
+    'Unihan_NumericValues.txt': (),
+    'Unihan_OtherMappings.txt': ('kBigFive', 'kJis0', 'kKPS0'),
+    'Unihan_Readings.txt': ('kDefinition', 'kMandarin', 'kJapaneseOn', 'kJapaneseKun'),
+    'Unihan_Variants.txt': ('kSemanticVariant',),
+}
+
+
+def code_points():
+    for start, end in UNIHAN_RANGES:
+        yield from range(start, end + 1)
+
+
+def synthetic_unihan(path, seed=0):
+    # Archive au format Unihan (~100k caractères) ; renvoie son chemin
+    if os.path.exists(path):
+        return path
+    rng = random.Random(seed)
+    irg = ["# Unihan_IRGSources.txt (synthétique)"]
+    fillers = {name: [f"# {name} (synthétique)"] for name in FILLER_MEMBERS}
+    for cp in code_points():
+        code = f"U+{cp:X}"
+        prime = "'" if rng.random() < 0.05 else ""
+        irg.append(f"{code}\tkIRG_GSource\tGKX-{rng.randint(0, 9999):04d}.{rng.randint(0, 99):02d}")
+        irg.append(f"{code}\tkRSUnicode\t{rng.randint(1, 214)}{prime}.{rng.randint(0, 30)}")
+        irg.append(f"{code}\tkTotalStrokes\t{rng.randint(1, 40)}")
+        for name, fields in FILLER_MEMBERS.items():
+            for field in fields:
+                fillers[name].append(f"{code}\t{field}\tvaleur synthétique {rng.randint(0, 10 ** 6)}")
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('Unihan_IRGSources.txt', "\n".join(irg) + "\n")
+        for name, lines in fillers.items():
+            z.writestr(name, "\n".join(lines) + "\n")
+    return path
+
+
+def synthetic_table(zip_path=None, glyphwiki_per_source=300, seed=0):
+    # CharTable complète : Unihan synthétique + glyphes GlyphWiki pour quelques sources
+    from all_kanji.char_table import CharTable
+    from all_kanji.cjk_blocks import needs_custom_font
+    from all_kanji.unihan_source import iter_rs_unicode
+
+    if zip_path is None or not os.path.exists(zip_path):
+        import tempfile
+        zip_path = synthetic_unihan(os.path.join(tempfile.gettempdir(), "Unihan-synthetic.zip"))
+    table = CharTable()
+    for code_point, rad, strokes in iter_rs_unicode(zip_path):
+        table.append_unicode(code_point, rad, strokes, custom_font=needs_custom_font(code_point))
+    rng = random.Random(seed)
+    for key, prefix in (("kokuji", "K"), ("dkw", "DKW"), ("irg2024", "IRG")):
+        source_index = table.add_source(key, prefix)
+        for n in range(1, glyphwiki_per_source + 1):
+            table.append_glyphwiki(source_index, f"{n:05d}", rng.randint(1, 214), rng.randint(0, 30))
+    return table
+
+
+def synthetic_irg_page(path, count=4674, seed=0):
+    # Page au format de la liste IRG 2024 (list.php?show_all=1) ; renvoie son chemin.
+    # Codes source (G-12.3) avant le radical, radicaux primés, lignes sans radical.
+    if os.path.exists(path):
+        return path
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>IRG Working Set 2024</title></head>\n'
+                '<body><table class="list">\n<tr><th>No.</th><th>Glyph</th><th>Source</th>'
+                '<th>Radical</th><th>SC</th><th>IDS</th><th>Note</th></tr>\n')
+        for i in range(1, count + 1):
+            rad = rng.randint(1, 214)
+            prime = "'" if rng.random() < 0.05 else ""
+            rs = f"{rad}{prime}.{rng.randint(0, 30)}" if rng.random() < 0.99 else "&mdash;"
+            f.write(f'<tr class="row"><td><a href="detail.php?id={i:05d}">{i:05d}</a></td>'
+                    f'<td><img src="img/{i:05d}.png" width="32" height="32" alt="{i:05d}"></td>'
+                    f'<td>G{rng.choice("HKTUV")}-{rng.randint(0, 9999):04d}.{rng.randint(0, 99):02d}</td>'
+                    f'<td>{rs}</td><td>{rng.randint(1, 40)}</td>'
+                    f'<td>&#x2FF0;&#x{rng.randint(0x4E00, 0x9FFF):X};&#x{rng.randint(0x4E00, 0x9FFF):X};</td>'
+                    f'<td>{"Review comment " * rng.randint(0, 20)}</td></tr>\n')
+        f.write('</table></body></html>\n')
+    return path
+
+
+def synthetic_glyphwiki_data(path, rows=50000, seed=0):
+    # Dossier au format data/glyphwiki (sources.tsv + un TSV par dictionnaire) ; renvoie son chemin
+    if os.path.exists(os.path.join(path, "sources.tsv")):
+        return path
+    rng = random.Random(seed)
+    sources = ["kokuji", "hokke", "dkw", "chunom-jiten", "kozouji-jiten"]
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "sources.tsv"), 'w', encoding='utf-8') as f:
+        f.write("key\tprefix\tname\n")
+        for key in sources:
+            f.write(f"{key}\t{key[:2].upper()}\tsynthétique\n")
+    for n, key in enumerate(sources):
+        with open(os.path.join(path, f"{key}.tsv"), 'w', encoding='utf-8') as f:
+            f.write("id\trad\tstr\n")
+            for ident in range(n, rows, len(sources)):
+                f.write(f"{ident:05d}\t{rng.randint(1, 214)}\t{rng.randint(0, 30)}\n")
+    return path
@@ -0,0 +1,5 @@
+# Point d'entrée : voir all_kanji/font_bundler.py (équivalent : python -m all_kanji bundle)
+from all_kanji.font_bundler import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+# Point d'entrée : voir all_kanji/pipeline.py (équivalent : python -m all_kanji pipeline)
+from all_kanji.pipeline import main
+
+if __name__ == "__main__":
+    main()
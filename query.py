@@ -0,0 +1,5 @@
+# Point d'entrée : voir all_kanji/table_query.py (équivalent : python -m all_kanji query)
+from all_kanji.table_query import main
+
+if __name__ == "__main__":
+    main()